@@ -0,0 +1,310 @@
+"""
+cases.py — Benchmark cases for the SUBIT hot paths.
+
+Each case is registered with @case and returns a zero-argument callable;
+everything the callable needs is built once, outside the timed loop.
+"""
+
+import io
+import random
+from typing import Callable, Dict, List, Tuple
+
+from src.subit import (
+    Archetype, SUBITNarrativeEngine,
+    PIONEER, STEADFAST, GHOST, COUNCIL,
+    hamming_distance, find_path, analyze_transmutation
+)
+from src.poetry.subit_poetry import SUBITPoetryEngine
+from src.poetry.prosody import scan
+from src.novelty import NoveltyFilter
+from src.store import StoryStore
+from src.story_codec import StoryCodec
+from dobre.src.dobre import (
+    Dobre, DobrePhrase, DobreTokenizer, pack_codes, phonetic_distance, reduce_phrases,
+    resolve, stream, unpack_codes
+)
+from dobre.src.synth import DobreSynth
+
+
+# name -> (group, factory)
+CASES: Dict[str, Tuple[str, Callable[[], Callable[[], object]]]] = {}
+
+
+def case(name: str, group: str):
+    """Register a benchmark case factory under a name and group."""
+    def register(factory):
+        CASES[name] = (group, factory)
+        return factory
+    return register
+
+
+def select(patterns: List[str]) -> List[str]:
+    """Return case names matching any of the substrings (all if none given)."""
+    if not patterns:
+        return list(CASES)
+    return [name for name, (group, _) in CASES.items()
+            if any(p in name or p == group for p in patterns)]
+
+
+# ----------------------------------------------------------------------------
+# Archetype algebra
+# ----------------------------------------------------------------------------
+
+@case("archetype_xor", "archetype")
+def bench_archetype_xor():
+    a, b = STEADFAST, GHOST
+    return lambda: a ^ b
+
+
+@case("archetype_hash", "archetype")
+def bench_archetype_hash():
+    a = STEADFAST
+    return lambda: hash(a)
+
+
+@case("archetype_from_bits", "archetype")
+def bench_archetype_from_bits():
+    from_bits = Archetype.from_bits
+    return lambda: from_bits("10 11 00")
+
+
+@case("hamming_distance", "archetype")
+def bench_hamming_distance():
+    return lambda: hamming_distance(PIONEER, COUNCIL)
+
+
+@case("find_path", "search")
+def bench_find_path():
+    return lambda: find_path(PIONEER, COUNCIL, max_steps=2)
+
+
+@case("analyze_transmutation", "search")
+def bench_analyze_transmutation():
+    return lambda: analyze_transmutation(STEADFAST, COUNCIL)
+
+
+# ----------------------------------------------------------------------------
+# Story generation
+# ----------------------------------------------------------------------------
+
+@case("engine_construct", "story")
+def bench_engine_construct():
+    return SUBITNarrativeEngine
+
+
+@case("generate_arc", "story")
+def bench_generate_arc():
+    plot_gen = SUBITNarrativeEngine().plot_gen
+    return lambda: plot_gen.generate_arc(STEADFAST, COUNCIL, complexity=3)
+
+
+@case("story_render", "story")
+def bench_story_render():
+    engine = SUBITNarrativeEngine()
+    arc = engine.plot_gen.generate_arc(STEADFAST, COUNCIL, protagonist_name="Luca")
+    world = engine.world_gen.generate(STEADFAST)
+    render = engine.renderer.render
+    return lambda: render(arc, world)
+
+
+@case("generate_story", "story")
+def bench_generate_story():
+    engine = SUBITNarrativeEngine()
+    return lambda: engine.generate_story(complexity=3)
+
+
+@case("store_query", "story")
+def bench_store_query():
+    engine = SUBITNarrativeEngine()
+    store = StoryStore()
+    store.add_many(engine.generate_story(initial=STEADFAST, seed=str(i)) for i in range(1000))
+    return lambda: list(store.query(STEADFAST, COUNCIL, min_tension=0.3, complexity=3))
+
+
+@case("story_encode", "story")
+def bench_story_encode():
+    engine = SUBITNarrativeEngine()
+    codec = StoryCodec(engine)
+    text = engine.generate_story(STEADFAST, COUNCIL, seed="encode").text
+    return lambda: codec.encode(text)
+
+
+@case("story_decode", "story")
+def bench_story_decode():
+    engine = SUBITNarrativeEngine()
+    codec = StoryCodec(engine)
+    blob = codec.encode(engine.generate_story(STEADFAST, COUNCIL, seed="encode").text)
+    return lambda: codec.decode(blob)
+
+
+# ----------------------------------------------------------------------------
+# Poetry
+# ----------------------------------------------------------------------------
+
+@case("poetry_haiku", "poetry")
+def bench_poetry_haiku():
+    engine = SUBITPoetryEngine()
+    return lambda: engine.generate_haiku(STEADFAST)
+
+
+@case("poetry_sonnet", "poetry")
+def bench_poetry_sonnet():
+    engine = SUBITPoetryEngine()
+    return lambda: engine.generate_sonnet(STEADFAST)
+
+
+@case("poetry_free_verse", "poetry")
+def bench_poetry_free_verse():
+    engine = SUBITPoetryEngine()
+    return lambda: engine.generate_free_verse(STEADFAST, 12)
+
+
+@case("poetry_blank_verse", "poetry")
+def bench_poetry_blank_verse():
+    engine = SUBITPoetryEngine()
+    return lambda: engine.generate_blank_verse(STEADFAST, 12)
+
+
+@case("poetry_ballad", "poetry")
+def bench_poetry_ballad():
+    engine = SUBITPoetryEngine()
+    return lambda: engine.generate_ballad(STEADFAST, 3)
+
+
+@case("prosody_scan", "poetry")
+def bench_prosody_scan():
+    line = "I whisper to the morning star along the way"
+    return lambda: scan(line)
+
+
+@case("poetry_poem", "poetry")
+def bench_poetry_poem():
+    engine = SUBITPoetryEngine()
+    return lambda: engine.generate_poem(STEADFAST, form="free_verse")
+
+
+@case("poetry_poem_cached", "poetry")
+def bench_poetry_poem_cached():
+    engine = SUBITPoetryEngine()
+    engine.generate_poem(STEADFAST, form="free_verse", seed=1)
+    return lambda: engine.generate_poem(STEADFAST, form="free_verse", seed=1)
+
+
+@case("novelty_check", "poetry")
+def bench_novelty_check():
+    engine = SUBITPoetryEngine()
+    novelty = NoveltyFilter()
+    novelty.add(engine.generate_free_verse(STEADFAST, 12, seed=0))
+    poem = engine.generate_free_verse(STEADFAST, 12, seed=1)
+    return lambda: novelty.is_novel(poem)
+
+
+# ----------------------------------------------------------------------------
+# Dobre conversions
+# ----------------------------------------------------------------------------
+
+@case("dobre_from_string", "dobre")
+def bench_dobre_from_string():
+    return lambda: Dobre.from_string("di-bo-ra")
+
+
+@case("dobre_from_archetype", "dobre")
+def bench_dobre_from_archetype():
+    return lambda: Dobre.from_archetype("ME", "SOUTH", "WINTER")
+
+
+@case("dobre_to_code", "dobre")
+def bench_dobre_to_code():
+    word = Dobre.from_string("di-bo-ra")
+    return word.to_code
+
+
+@case("dobre_from_code", "dobre")
+def bench_dobre_from_code():
+    return lambda: Dobre.from_code(44)
+
+
+@case("dobre_xor", "dobre")
+def bench_dobre_xor():
+    a, b, c = (Dobre.from_string(w) for w in ("di-bi-ri", "da-ba-ra", "do-bo-ro"))
+    return lambda: a ^ b ^ c
+
+
+@case("dobre_archetype_bridge", "dobre")
+def bench_dobre_archetype_bridge():
+    word = STEADFAST.dobre
+    return lambda: word.archetype.dobre
+
+
+@case("dobre_phrase_parse", "dobre")
+def bench_dobre_phrase_parse():
+    rng = random.Random(64)
+    words = [str(Dobre.from_archetype(
+        rng.choice(["ME", "WE", "YOU", "THEY"]),
+        rng.choice(["EAST", "SOUTH", "WEST", "NORTH"]),
+        rng.choice(["SPRING", "SUMMER", "AUTUMN", "WINTER"])
+    )) for _ in range(100)]
+    text = " ".join(words)
+    return lambda: DobrePhrase.from_string(text)
+
+
+@case("dobre_xor_range", "dobre")
+def bench_dobre_xor_range():
+    rng = random.Random(64)
+    phrase = DobrePhrase.from_codes(rng.randrange(64) for _ in range(10000))
+    phrase.reduce()
+    return lambda: phrase.xor_range(1234, 8765)
+
+
+@case("dobre_reduce_phrases", "dobre")
+def bench_dobre_reduce_phrases():
+    rng = random.Random(64)
+    codes = bytes(rng.randrange(64) for _ in range(3000))
+    lengths = [3] * 1000
+    return lambda: reduce_phrases(codes, lengths)
+
+
+@case("dobre_pack", "dobre")
+def bench_dobre_pack():
+    rng = random.Random(64)
+    codes = bytes(rng.randrange(64) for _ in range(4000))
+    return lambda: pack_codes(codes)
+
+
+@case("dobre_unpack", "dobre")
+def bench_dobre_unpack():
+    rng = random.Random(64)
+    packed = pack_codes(rng.randrange(64) for _ in range(4000))
+    return lambda: unpack_codes(packed)
+
+
+@case("dobre_stream", "dobre")
+def bench_dobre_stream():
+    rng = random.Random(64)
+    lines = [str(rng.randrange(64)) + "\n" for _ in range(1000)]
+    return lambda: stream(lines, io.StringIO())
+
+
+@case("dobre_resolve", "dobre")
+def bench_dobre_resolve():
+    return lambda: resolve("ti-bi-rii")
+
+
+@case("dobre_phonetic_distance", "dobre")
+def bench_dobre_phonetic_distance():
+    return lambda: phonetic_distance("tibirii", "dibiri")
+
+
+@case("dobre_tokenize", "dobre")
+def bench_dobre_tokenize():
+    rng = random.Random(64)
+    data = " ".join(str(Dobre.from_code(rng.randrange(64))) for _ in range(100)).encode()
+    return lambda: list(DobreTokenizer().tokenize(data))
+
+
+@case("dobre_synth_write", "dobre")
+def bench_dobre_synth_write():
+    rng = random.Random(64)
+    synth = DobreSynth()
+    codes = bytes(rng.randrange(64) for _ in range(1000))
+    return lambda: synth.write_wav(codes, io.BytesIO())
@@ -0,0 +1,256 @@
+"""
+run.py — Benchmark runner for the SUBIT Narrative Engine.
+
+Times every case in benchmarks/cases.py, writes JSON results and compares
+them against the committed baseline. Runs offline with the standard library.
+
+Usage (from the repository root):
+    python benchmarks/run.py                      # run all, compare to baseline
+    python benchmarks/run.py story poetry         # run matching cases/groups
+    python benchmarks/run.py --output out.json    # also write results
+    python benchmarks/run.py --threshold 0.5      # allow 50% slowdown
+    python benchmarks/run.py --noise-floor 100    # ignore slowdowns under 100 ns
+    python benchmarks/run.py --update-baseline    # rewrite the baseline
+
+Exit status is 1 if any case regressed beyond its threshold and by more
+than the noise floor, an absolute slowdown below which timer and
+scheduler jitter swamp sub-microsecond cases. Baselines are
+machine-specific: refresh them with --update-baseline on the machine that
+runs the comparison.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.cases import CASES, select
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.5
+# Slowdowns smaller than this are noise on a busy machine, whatever the ratio
+DEFAULT_NOISE_FLOOR_NS = 250.0
+
+
+def time_case(
+    func: Callable[[], object],
+    repeat: int = 5,
+    min_time: float = 0.05
+) -> Dict[str, Any]:
+    """
+    Time a callable timeit-style.
+
+    The loop count is doubled until one sample takes at least `min_time`
+    seconds, then `repeat` samples are taken. Returns per-call nanoseconds.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter() - start) / loops * 1e9)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "median_ns": statistics.median(samples),
+        "min_ns": min(samples),
+        "mean_ns": statistics.fmean(samples),
+        "loops": loops,
+        "repeat": repeat
+    }
+
+
+def run(
+    names: List[str],
+    repeat: int = 5,
+    min_time: float = 0.05
+) -> Dict[str, Any]:
+    """Run the named cases and return a results document."""
+    results = {}
+    for name in names:
+        group, factory = CASES[name]
+        random.seed(name)
+        func = factory()
+        results[name] = dict(group=group, **time_case(func, repeat, min_time))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "min_time": min_time
+        },
+        "results": results
+    }
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: Optional[float] = None,
+    noise_floor_ns: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline document.
+
+    Cases are compared on their fastest sample, which is the least noisy
+    estimate. A case regresses when it is slower than the baseline by more
+    than its threshold: the per-case value in baseline["thresholds"], else
+    `threshold`, else baseline["default_threshold"]; and by more than the
+    noise floor in absolute terms: `noise_floor_ns`, else
+    baseline["noise_floor_ns"].
+    """
+    default = threshold
+    if default is None:
+        default = baseline.get("default_threshold", DEFAULT_THRESHOLD)
+    floor = noise_floor_ns
+    if floor is None:
+        floor = baseline.get("noise_floor_ns", DEFAULT_NOISE_FLOOR_NS)
+    per_case = baseline.get("thresholds", {})
+
+    rows = []
+    for name, current in results["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            rows.append({"name": name, "status": "new", "current_ns": current["min_ns"]})
+            continue
+        limit = per_case.get(name, default)
+        ratio = current["min_ns"] / base["min_ns"]
+        rows.append({
+            "name": name,
+            "status": ("regressed" if ratio > 1.0 + limit
+                       and current["min_ns"] - base["min_ns"] > floor else "ok"),
+            "baseline_ns": base["min_ns"],
+            "current_ns": current["min_ns"],
+            "ratio": ratio,
+            "threshold": limit
+        })
+    return rows
+
+
+def format_ns(ns: float) -> str:
+    """Format nanoseconds with a readable unit."""
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} µs"
+    return f"{ns:.0f} ns"
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    """Print a comparison table."""
+    print(f"{'CASE':<24} {'BASELINE':>12} {'CURRENT':>12} {'RATIO':>7}  STATUS")
+    print("-" * 66)
+    for row in rows:
+        if row["status"] == "new":
+            print(f"{row['name']:<24} {'-':>12} {format_ns(row['current_ns']):>12} {'-':>7}  new")
+        else:
+            print(f"{row['name']:<24} {format_ns(row['baseline_ns']):>12} "
+                  f"{format_ns(row['current_ns']):>12} {row['ratio']:>6.2f}x  {row['status']}")
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """Load a baseline document, or None if the file does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="SUBIT benchmark suite")
+    parser.add_argument("cases", nargs="*",
+                        help="Case names or groups to run (substring match; default all)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Write JSON results to PATH")
+    parser.add_argument("--baseline", metavar="PATH", default=BASELINE_PATH,
+                        help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float,
+                        help="Allowed slowdown as a fraction (default from baseline, else 0.5)")
+    parser.add_argument("--noise-floor", type=float, metavar="NS",
+                        help="Ignore slowdowns under NS nanoseconds (default from baseline, else 250)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Samples per case")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="Minimum seconds per sample")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Merge these results into the baseline instead of comparing")
+    parser.add_argument("--list", action="store_true",
+                        help="List cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (group, _) in CASES.items():
+            print(f"{group:<10} {name}")
+        return 0
+
+    names = select(args.cases)
+    if not names:
+        print(f"No cases match: {' '.join(args.cases)}")
+        return 2
+
+    results = run(names, repeat=args.repeat, min_time=args.min_time)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    baseline = load_baseline(args.baseline)
+
+    if args.update_baseline:
+        updated = baseline or {"default_threshold": DEFAULT_THRESHOLD,
+                               "noise_floor_ns": DEFAULT_NOISE_FLOOR_NS, "thresholds": {}}
+        updated["meta"] = results["meta"]
+        updated.setdefault("results", {}).update(results["results"])
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(updated, f, indent=2)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline} ({len(names)} cases)")
+        return 0
+
+    if baseline is None:
+        rows = [{"name": n, "status": "new", "current_ns": r["min_ns"]}
+                for n, r in results["results"].items()]
+        print_report(rows)
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    rows = compare(results, baseline, args.threshold, args.noise_floor)
+    print_report(rows)
+    regressed = [r["name"] for r in rows if r["status"] == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s): {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
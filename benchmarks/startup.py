@@ -0,0 +1,135 @@
+"""
+startup.py — Cold-start benchmark for the SUBIT Narrative Engine.
+
+Each sample runs a fresh interpreter that imports src.subit, constructs a
+SUBITNarrativeEngine and generates one story, timing each step. The
+medians are checked against a startup budget. Bytecode caching is enabled
+for the child interpreters so imports are measured as a deployed worker
+sees them.
+
+Usage (from the repository root):
+    python benchmarks/startup.py
+    python benchmarks/startup.py --samples 20 --output startup.json
+    python benchmarks/startup.py --import-budget 40 --first-story-budget 10
+
+Exit status is 1 if a median exceeds its budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budgets in milliseconds (median over samples)
+IMPORT_BUDGET_MS = 60.0
+CONSTRUCT_BUDGET_MS = 1.0
+FIRST_STORY_BUDGET_MS = 10.0
+
+# Runs in the child interpreter; prints one JSON line of timings
+PROBE = """
+import sys, time
+t0 = time.perf_counter()
+import src.subit
+t1 = time.perf_counter()
+engine = src.subit.SUBITNarrativeEngine()
+t2 = time.perf_counter()
+engine.generate_story()
+t3 = time.perf_counter()
+deferred = [m for m in ("json", "hashlib") if m not in sys.modules]
+import json
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1e3,
+    "construct_ms": (t2 - t1) * 1e3,
+    "first_story_ms": (t3 - t2) * 1e3,
+    "modules": len(sys.modules),
+    "deferred": deferred
+}))
+"""
+
+
+def sample(python: str = sys.executable) -> Dict[str, Any]:
+    """Run one cold start in a child interpreter and return its timings."""
+    # Deployed workers import from cached bytecode; let the child write it
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    start = time.perf_counter()
+    out = subprocess.run(
+        [python, "-c", PROBE],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    timings = json.loads(out.strip().splitlines()[-1])
+    timings["process_ms"] = (time.perf_counter() - start) * 1e3
+    return timings
+
+
+def run(samples: int = 10) -> Dict[str, Any]:
+    """Collect cold-start samples and summarize them by median."""
+    sample()  # warm-up: populates the bytecode cache
+    runs = [sample() for _ in range(samples)]
+    summary = {}
+    for key in ("import_ms", "construct_ms", "first_story_ms", "process_ms"):
+        values = [r[key] for r in runs]
+        summary[key] = {"median": statistics.median(values), "min": min(values)}
+    return {
+        "samples": samples,
+        "summary": summary,
+        "modules": runs[-1]["modules"],
+        "deferred": runs[-1]["deferred"]
+    }
+
+
+def check(results: Dict[str, Any], budgets: Dict[str, float]) -> List[str]:
+    """Return the keys whose median exceeds their budget."""
+    return [key for key, budget in budgets.items()
+            if results["summary"][key]["median"] > budget]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="SUBIT cold-start benchmark")
+    parser.add_argument("--samples", type=int, default=10,
+                        help="Number of fresh interpreters to start")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS,
+                        help="Median import budget in ms")
+    parser.add_argument("--construct-budget", type=float, default=CONSTRUCT_BUDGET_MS,
+                        help="Median engine construction budget in ms")
+    parser.add_argument("--first-story-budget", type=float, default=FIRST_STORY_BUDGET_MS,
+                        help="Median first-story budget in ms")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Write JSON results to PATH")
+    args = parser.parse_args(argv)
+
+    budgets = {
+        "import_ms": args.import_budget,
+        "construct_ms": args.construct_budget,
+        "first_story_ms": args.first_story_budget
+    }
+    results = run(args.samples)
+    results["budgets"] = budgets
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    print(f"{'STEP':<16} {'MEDIAN':>10} {'MIN':>10} {'BUDGET':>10}")
+    print("-" * 50)
+    for key, stats in results["summary"].items():
+        budget = f"{budgets[key]:.1f} ms" if key in budgets else "-"
+        print(f"{key[:-3]:<16} {stats['median']:>7.2f} ms {stats['min']:>7.2f} ms {budget:>10}")
+    print(f"\nmodules loaded: {results['modules']}; deferred: {', '.join(results['deferred']) or 'none'}")
+
+    over = check(results, budgets)
+    if over:
+        print(f"Over budget: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
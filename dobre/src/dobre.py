@@ -1,12 +1,3 @@
-# 🐍 **dobre.py**
-
-## Python Implementation of the Dobre Language (DBR Edition)
-
-*A bridge between SUBIT archetypes and the resonant Dobre phonetic interface.*
-
----
-
-```python
 """
 dobre.py — Dobre Language Interface for SUBIT Narrative Engine
 
@@ -19,21 +10,36 @@ Dobre Formula:
 - WHERE (Space) → B (ba/be/bi/bo)
 - WHEN (Time) → R (ra/re/ri/ro)
 
+Command line:
+    python dobre.py --translate ME EAST SPRING   # ME-EAST-SPRING → di-bi-ri
+    python dobre.py --from-dobre di-bi-ri        # di-bi-ri → ME-EAST-SPRING
+    python dobre.py --code 42                    # Code 42 (101010): di-bi-ri
+    python dobre.py --list
+    python dobre.py --transmute di-bo-ra da-bi-ri de-be-ro
+    python dobre.py --verify philosopher
+    python dobre.py --stream < inputs.txt        # One result row per input line
+
+No external dependencies are required.
+
 6 bits = 64 archetypes = spoken reality
 """
 
 import sys
 import os
-from typing import Tuple, Optional, Dict, List
-
-# Add parent directory to path for importing original SUBIT
-sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+import re
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, Tuple, Optional, Dict, Iterable, Iterator, List, NamedTuple, Union
+
+# Add the repository root to the path for importing original SUBIT
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 try:
     from src.subit import Archetype as SubitArchetype
 except ImportError:
     # Fallback if original SUBIT not available
     SubitArchetype = None
-    print("Warning: Original SUBIT module not found. Running in standalone mode.")
+    print("Warning: Original SUBIT module not found. Running in standalone mode.", file=sys.stderr)
 
 
 # ============================================================================
@@ -103,35 +109,61 @@ class Dobre:
     
     Format: XXX-XXX-XXX where each XXX is a Dobre syllable (D/B/R + vowel)
     Example: di-bi-ri (Pioneer: ME-EAST-SPRING)
+    
+    There are exactly 64 words, each created once at import (a flyweight):
+    constructors return the shared instance for the word, so words are
+    immutable, compare by identity and convert through lookup tables.
     """
     
-    def __init__(self, syllable1: str, syllable2: str, syllable3: str):
+    __slots__ = ("s1", "s2", "s3", "code")
+    
+    def __new__(cls, syllable1: str, syllable2: str, syllable3: str) -> 'Dobre':
         """
-        Create a Dobre word from three syllables.
+        Get the Dobre word for three syllables.
         
         Args:
             syllable1: First syllable (WHO dimension) — must start with D
             syllable2: Second syllable (WHERE dimension) — must start with B
             syllable3: Third syllable (WHEN dimension) — must start with R
         """
+        word = _BY_SYLLABLES.get((syllable1, syllable2, syllable3))
+        if word is not None:
+            return word
+        
         # Validate syllables
-        if not syllable1[0] == 'd':
+        if not syllable1[:1] == 'd':
             raise ValueError(f"First syllable must start with 'd' (WHO), got '{syllable1}'")
-        if not syllable2[0] == 'b':
+        if not syllable2[:1] == 'b':
             raise ValueError(f"Second syllable must start with 'b' (WHERE), got '{syllable2}'")
-        if not syllable3[0] == 'r':
+        if not syllable3[:1] == 'r':
             raise ValueError(f"Third syllable must start with 'r' (WHEN), got '{syllable3}'")
-        
-        if syllable1 not in DOBRE_SYLLABLES:
-            raise ValueError(f"Invalid Dobre syllable: '{syllable1}'")
-        if syllable2 not in DOBRE_SYLLABLES:
-            raise ValueError(f"Invalid Dobre syllable: '{syllable2}'")
-        if syllable3 not in DOBRE_SYLLABLES:
-            raise ValueError(f"Invalid Dobre syllable: '{syllable3}'")
-        
-        self.s1 = syllable1  # WHO
-        self.s2 = syllable2  # WHERE
-        self.s3 = syllable3  # WHEN
+        for syllable in (syllable1, syllable2, syllable3):
+            if syllable not in DOBRE_SYLLABLES:
+                raise ValueError(f"Invalid Dobre syllable: '{syllable}'")
+        # Only reached while the table itself is being built
+        return cls._create(SYLLABLE_BITS[syllable1] << 4 | SYLLABLE_BITS[syllable2] << 2
+                           | SYLLABLE_BITS[syllable3])
+    
+    @classmethod
+    def _create(cls, code: int) -> 'Dobre':
+        """Create the single instance for a code (see the tables below the class)."""
+        word = object.__new__(cls)
+        for name, value in zip(cls.__slots__, CODE_SYLLABLES[code] + (code,)):
+            object.__setattr__(word, name, value)
+        return word
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Dobre words are immutable")
+    
+    def __reduce__(self):
+        # Unpickle to the interned instance
+        return (Dobre.from_code, (self.code,))
+    
+    def __copy__(self) -> 'Dobre':
+        return self
+    
+    def __deepcopy__(self, memo) -> 'Dobre':
+        return self
     
     @classmethod
     def from_string(cls, dobre_str: str) -> 'Dobre':
@@ -144,6 +176,9 @@ class Dobre:
         Returns:
             Dobre object
         """
+        word = _BY_STRING.get(dobre_str)
+        if word is not None:
+            return word
         parts = dobre_str.strip().split('-')
         if len(parts) != 3:
             raise ValueError(f"Dobre string must have exactly 3 parts, got {len(parts)}: {dobre_str}")
@@ -162,18 +197,14 @@ class Dobre:
         Returns:
             Dobre object
         """
+        word = _BY_DIMENSIONS.get((who, where, when))
+        if word is not None:
+            return word
         if who not in WHO_TO_D:
             raise ValueError(f"Invalid WHO: {who}")
         if where not in WHERE_TO_B:
             raise ValueError(f"Invalid WHERE: {where}")
-        if when not in WHEN_TO_R:
-            raise ValueError(f"Invalid WHEN: {when}")
-        
-        return cls(
-            WHO_TO_D[who],
-            WHERE_TO_B[where],
-            WHEN_TO_R[when]
-        )
+        raise ValueError(f"Invalid WHEN: {when}")
     
     @classmethod
     def from_code(cls, code: int) -> 'Dobre':
@@ -186,29 +217,9 @@ class Dobre:
         Returns:
             Dobre object
         """
-        if SubitArchetype:
-            arch = SubitArchetype.from_code(code)
-            return cls.from_archetype(arch.who, arch.where, arch.when)
-        else:
-            # Standalone mode — derive from bits
-            if code < 0 or code > 63:
-                raise ValueError(f"Code must be between 0 and 63, got {code}")
-            
-            bits = format(code, '06b')
-            who_bits = bits[0:2]
-            where_bits = bits[2:4]
-            when_bits = bits[4:6]
-            
-            # Reverse mapping from bits to dimensions
-            who_map = {'00': 'THEY', '01': 'YOU', '10': 'ME', '11': 'WE'}
-            where_map = {'00': 'NORTH', '01': 'WEST', '10': 'EAST', '11': 'SOUTH'}
-            when_map = {'00': 'WINTER', '01': 'AUTUMN', '10': 'SPRING', '11': 'SUMMER'}
-            
-            return cls.from_archetype(
-                who_map[who_bits],
-                where_map[where_bits],
-                when_map[when_bits]
-            )
+        if not 0 <= code <= 63:
+            raise ValueError(f"Code must be between 0 and 63, got {code}")
+        return _WORDS[code]
     
     def to_archetype(self) -> Tuple[str, str, str]:
         """
@@ -217,11 +228,7 @@ class Dobre:
         Returns:
             Tuple of (who, where, when)
         """
-        return (
-            D_TO_WHO[self.s1],
-            B_TO_WHERE[self.s2],
-            R_TO_WHEN[self.s3]
-        )
+        return CODE_DIMENSIONS[self.code]
     
     def to_bits(self) -> str:
         """
@@ -230,14 +237,7 @@ class Dobre:
         Returns:
             6-bit string like "101010"
         """
-        who, where, when = self.to_archetype()
-        
-        # Mapping from dimensions to bits
-        who_bits = {'ME': '10', 'WE': '11', 'YOU': '01', 'THEY': '00'}
-        where_bits = {'EAST': '10', 'SOUTH': '11', 'WEST': '01', 'NORTH': '00'}
-        when_bits = {'SPRING': '10', 'SUMMER': '11', 'AUTUMN': '01', 'WINTER': '00'}
-        
-        return who_bits[who] + where_bits[where] + when_bits[when]
+        return CODE_BITS[self.code]
     
     def to_code(self) -> int:
         """
@@ -246,7 +246,19 @@ class Dobre:
         Returns:
             Integer between 0 and 63
         """
-        return int(self.to_bits(), 2)
+        return self.code
+    
+    @property
+    def archetype(self) -> 'SubitArchetype':
+        """
+        A new SUBIT Archetype with this word's code.
+        
+        Raises:
+            ImportError: SUBIT is not available (standalone mode)
+        """
+        if SubitArchetype is None:
+            raise ImportError("Dobre.archetype needs the SUBIT module (src.subit)")
+        return SubitArchetype.from_int(self.code)
     
     def __str__(self) -> str:
         """String representation: "di-bi-ri" """
@@ -258,10 +270,11 @@ class Dobre:
         return f"<Dobre {self} = {who}-{where}-{when}>"
     
     def __eq__(self, other) -> bool:
-        """Equality comparison"""
-        if not isinstance(other, Dobre):
-            return False
-        return self.s1 == other.s1 and self.s2 == other.s2 and self.s3 == other.s3
+        """Equality comparison (words are interned, so identity)"""
+        return self is other
+    
+    def __hash__(self) -> int:
+        return self.code
     
     def __xor__(self, other: 'Dobre') -> 'Dobre':
         """
@@ -273,13 +286,43 @@ class Dobre:
         Returns:
             New Dobre word resulting from XOR operation
         """
-        bits1 = self.to_bits()
-        bits2 = other.to_bits()
-        
-        # XOR each bit
-        result_bits = ''.join(str(int(b1) ^ int(b2)) for b1, b2 in zip(bits1, bits2))
-        
-        return Dobre.from_code(int(result_bits, 2))
+        if not isinstance(other, Dobre):
+            return NotImplemented
+        return XOR_TABLE[self.code][other.code]
+
+
+# ============================================================================
+# WORD TABLES
+# ============================================================================
+
+# Each syllable's two bits: the vowel carries them in every position
+# (a = 00, e = 01, i = 10, o = 11), the consonant names the position
+SYLLABLE_BITS: Dict[str, int] = {s: 'aeio'.index(s[1]) for s in DOBRE_SYLLABLES}
+
+# Syllables, dimensions and bit strings by code
+CODE_SYLLABLES: Tuple[Tuple[str, str, str], ...] = tuple(
+    ('d' + 'aeio'[code >> 4], 'b' + 'aeio'[code >> 2 & 3], 'r' + 'aeio'[code & 3])
+    for code in range(64)
+)
+CODE_DIMENSIONS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (D_TO_WHO[s1], B_TO_WHERE[s2], R_TO_WHEN[s3]) for s1, s2, s3 in CODE_SYLLABLES
+)
+CODE_BITS: Tuple[str, ...] = tuple(format(code, '06b') for code in range(64))
+
+# Every valid code as a byte (bytes.translate deletes these to find bad ones)
+_CODE_BYTES = bytes(range(64))
+
+# The 64 words, and lookups by syllables, string and dimensions
+_BY_SYLLABLES: Dict[Tuple[str, str, str], Dobre] = {}
+_WORDS: Tuple[Dobre, ...] = tuple(Dobre(*syllables) for syllables in CODE_SYLLABLES)
+_BY_SYLLABLES.update(zip(CODE_SYLLABLES, _WORDS))
+_BY_STRING: Dict[str, Dobre] = {str(word): word for word in _WORDS}
+_BY_DIMENSIONS: Dict[Tuple[str, str, str], Dobre] = dict(zip(CODE_DIMENSIONS, _WORDS))
+
+# XOR_TABLE[a][b] is the word for code a ^ b
+XOR_TABLE: Tuple[Tuple[Dobre, ...], ...] = tuple(
+    tuple(_WORDS[a ^ b] for b in range(64)) for a in range(64)
+)
 
 
 # ============================================================================
@@ -289,11 +332,33 @@ class Dobre:
 class DobrePhrase:
     """
     A phrase in Dobre language — multiple words spoken in sequence.
+    
+    The first reduce or xor_range builds a prefix-XOR index of the words
+    (one byte per word), after which the XOR of any run of words is a
+    single lookup. Treat words as fixed once the index is built; add()
+    returns a new phrase.
     """
     
     def __init__(self, words: List[Dobre]):
         """Create a phrase from a list of Dobre words."""
         self.words = words
+        self._prefix: Optional[bytes] = None
+    
+    @classmethod
+    def from_codes(cls, codes: Iterable[int]) -> 'DobrePhrase':
+        """
+        Create a phrase from word codes, e.g. DobreTokenizer output.
+        
+        Args:
+            codes: Codes 0-63 (a list, bytes or any iterable)
+        
+        Raises:
+            ValueError: A code outside 0-63
+        """
+        codes = bytes(codes)
+        if codes and max(codes) > 63:
+            raise ValueError(f"Code must be between 0 and 63, got {max(codes)}")
+        return cls(list(map(_WORDS.__getitem__, codes)))
     
     @classmethod
     def from_string(cls, phrase_str: str) -> 'DobrePhrase':
@@ -328,6 +393,596 @@ class DobrePhrase:
         if len(self.words) != 3:
             return None
         return self.words[0] ^ self.words[1] ^ self.words[2]
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def prefix_xor(self) -> bytes:
+        """
+        Get the prefix-XOR index: byte i is the code of the XOR of the
+        first i words (so it has one more byte than the phrase has words).
+        """
+        if self._prefix is None:
+            self._prefix = _prefix_xor(bytes(w.code for w in self.words))
+        return self._prefix
+    
+    def reduce(self) -> Dobre:
+        """
+        XOR all the words together (da-ba-ra, the XOR identity, for none).
+        
+        Returns:
+            Resulting Dobre word
+        """
+        return _WORDS[self.prefix_xor()[-1]]
+    
+    def xor_range(self, start: int, end: int) -> Dobre:
+        """
+        XOR the words in self.words[start:end], in O(1).
+        
+        Args:
+            start: Index of the first word
+            end: Index after the last word
+        
+        Returns:
+            Resulting Dobre word (da-ba-ra for an empty range)
+        
+        Raises:
+            ValueError: Range outside the phrase
+        """
+        prefix = self.prefix_xor()
+        if not 0 <= start <= end < len(prefix):
+            raise ValueError(f"Range {start}:{end} outside a phrase of {len(prefix) - 1} words")
+        return _WORDS[prefix[start] ^ prefix[end]]
+
+
+# ============================================================================
+# STREAMING TOKENIZER
+# ============================================================================
+
+# Word codes by spelling, as text and as bytes
+_TOKEN_CODES: Dict[Union[str, bytes], int] = {}
+for _code, _syllables in enumerate(CODE_SYLLABLES):
+    _TOKEN_CODES['-'.join(_syllables)] = _code
+    _TOKEN_CODES['-'.join(_syllables).encode()] = _code
+
+# What each character of a word must be
+_WORD_SHAPE = ('d', 'aeio', '-', 'b', 'aeio', '-', 'r', 'aeio')
+
+_TOKENS = re.compile(r'\S+')
+_TOKENS_BYTES = re.compile(rb'\S+')
+
+
+class TokenError(NamedTuple):
+    """A token the tokenizer skipped."""
+    offset: int   # Offset of the first bad character in the input
+    token: str    # The whole whitespace-delimited token
+    message: str
+
+
+def _diagnose(token: str) -> Tuple[int, str]:
+    """
+    Run a bad token through the word state machine.
+    
+    Returns:
+        (index of the first bad character, what was expected there)
+    """
+    for i, allowed in enumerate(_WORD_SHAPE):
+        expected = "a vowel (a, e, i, o)" if len(allowed) > 1 else repr(allowed)
+        if i == len(token):
+            return i, f"Dobre word ends early, expected {expected}"
+        if token[i] not in allowed:
+            return i, f"Expected {expected}, got {token[i]!r}"
+    return len(_WORD_SHAPE), f"Expected whitespace after Dobre word, got {token[len(_WORD_SHAPE)]!r}"
+
+
+class DobreTokenizer:
+    """
+    Incremental tokenizer turning Dobre text into word codes (0-63).
+    
+    Feed it text or bytes in chunks of any size; a word split across
+    chunks is carried over. Valid words are looked up whole in a table
+    of the 64 spellings, one dict hit per word with no per-word object;
+    only tokens that miss are walked character by character to find the
+    offset of the first bad character. Bad tokens are recorded in errors
+    and skipped, so one typo does not stop a transcript.
+    
+    Usage:
+        tokenizer = DobreTokenizer()
+        with open("transcript.dbr", "rb") as f:
+            for code in tokenizer.tokenize(f):
+                ...
+        for error in tokenizer.errors:
+            print(error.offset, error.message)
+    
+    Attributes:
+        strict: Raise ValueError at the first bad token instead of skipping it
+        errors: TokenErrors for skipped tokens, in input order
+        offset: Characters (or bytes) consumed so far
+        words: Word codes produced so far
+    """
+    
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self.errors: List[TokenError] = []
+        self.offset = 0
+        self.words = 0
+        self._tail: Union[str, bytes] = ''
+    
+    def feed(self, data: Union[str, bytes]) -> List[int]:
+        """
+        Tokenize the next chunk.
+        
+        Args:
+            data: Text or bytes (the same type as earlier chunks)
+        
+        Returns:
+            Codes of the words completed by this chunk
+        
+        Raises:
+            ValueError: A bad token, in strict mode
+        """
+        start = self.offset - len(self._tail)
+        self.offset += len(data)
+        if self._tail:
+            data = self._tail + data
+        # Hold back a trailing word that may continue in the next chunk
+        if data and not data[-1:].isspace():
+            self._tail = data.rsplit(None, 1)[-1]
+            data = data[:len(data) - len(self._tail)]
+        else:
+            self._tail = data[:0]
+        return self._tokenize(data, start)
+    
+    def close(self) -> List[int]:
+        """
+        Finish the input, tokenizing any held-back word.
+        
+        Returns:
+            Codes of the final word, if any
+        """
+        tail, self._tail = self._tail, self._tail[:0]
+        return self._tokenize(tail, self.offset - len(tail))
+    
+    def tokenize(self, source: Any, chunk_size: int = 1 << 16) -> Iterator[int]:
+        """
+        Tokenize a whole source, reading it in chunks.
+        
+        Args:
+            source: Text, bytes, a text or binary file object, or an
+                iterable of text or bytes chunks
+            chunk_size: Characters (or bytes) per read from a file object
+        
+        Yields:
+            Word codes, in order
+        
+        Raises:
+            ValueError: A bad token, in strict mode
+        """
+        if isinstance(source, (str, bytes)):
+            chunks = (source,)
+        elif hasattr(source, 'read'):
+            chunks = iter(lambda: source.read(chunk_size), source.read(0))
+        else:
+            chunks = source
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+    
+    def _tokenize(self, data: Union[str, bytes], start: int) -> List[int]:
+        """Look up whole tokens, falling back to diagnosis when one misses."""
+        lookup = _TOKEN_CODES.get
+        codes = list(map(lookup, data.split()))
+        if None in codes:
+            codes = []
+            tokens = _TOKENS_BYTES if isinstance(data, bytes) else _TOKENS
+            for match in tokens.finditer(data):
+                code = lookup(match.group())
+                if code is None:
+                    self._error(match.group(), start + match.start())
+                else:
+                    codes.append(code)
+        self.words += len(codes)
+        return codes
+    
+    def _error(self, token: Union[str, bytes], offset: int) -> None:
+        if isinstance(token, bytes):
+            token = token.decode('latin-1')
+        index, message = _diagnose(token)
+        error = TokenError(offset + index, token, message)
+        if self.strict:
+            raise ValueError(f"{message} at offset {error.offset} in {token!r}")
+        self.errors.append(error)
+
+
+# ============================================================================
+# PACKED BINARY CODEC
+# ============================================================================
+#
+# Four 6-bit codes pack into three bytes, big-endian, most significant
+# code first. A packed buffer is whole three-byte groups (the last padded
+# with da-ba-ra codes) followed by one byte counting the padding codes,
+# so the word count survives a round trip: 0.75 bytes a word plus one,
+# against 9 for text.
+#
+# A code is exactly two octal digits, so packing spells the codes in
+# octal and lets int() read the digits as one number; unpacking writes
+# the number back out in octal. Both run in C, with no per-code Python.
+
+_OCTAL_HIGH = bytes.maketrans(_CODE_BYTES, bytes(48 + (c >> 3) for c in range(64)))
+_OCTAL_LOW = bytes.maketrans(_CODE_BYTES, bytes(48 + (c & 7) for c in range(64)))
+_HIGH_VALUES = bytes.maketrans(b'01234567', bytes(range(0, 64, 8)))
+_LOW_VALUES = bytes.maketrans(b'01234567', bytes(range(8)))
+
+# Codes decoded per window by iter_packed
+_WINDOW_GROUPS = 4096
+
+
+def _pack_groups(codes: bytes) -> bytes:
+    """Pack a multiple of four codes, three bytes per four."""
+    if codes.translate(None, _CODE_BYTES):
+        raise ValueError(f"Code must be between 0 and 63, got {max(codes)}")
+    if not codes:
+        return b''
+    digits = bytearray(2 * len(codes))
+    digits[0::2] = codes.translate(_OCTAL_HIGH)
+    digits[1::2] = codes.translate(_OCTAL_LOW)
+    return int(digits, 8).to_bytes(len(codes) // 4 * 3, 'big')
+
+
+def _unpack_groups(data: Union[bytes, memoryview]) -> bytes:
+    """Unpack whole three-byte groups, four codes per group."""
+    if not data:
+        return b''
+    digits = format(int.from_bytes(data, 'big'), 'o').encode().zfill(len(data) // 3 * 8)
+    high = digits[0::2].translate(_HIGH_VALUES)
+    low = digits[1::2].translate(_LOW_VALUES)
+    return (int.from_bytes(high, 'big') | int.from_bytes(low, 'big')).to_bytes(len(high), 'big')
+
+
+def _split_packed(packed: Union[bytes, memoryview]) -> Tuple[memoryview, int]:
+    """
+    Check a packed buffer's framing.
+    
+    Returns:
+        (a view of the groups, padding codes to drop from the end)
+    
+    Raises:
+        ValueError: Truncated buffer or bad padding count
+    """
+    view = memoryview(packed).cast('B')
+    if len(view) % 3 != 1:
+        raise ValueError(f"Packed Dobre buffer is truncated ({len(view)} bytes)")
+    padding = view[-1]
+    if padding > 3 or (padding and len(view) == 1):
+        raise ValueError(f"Bad padding count in packed Dobre buffer: {padding}")
+    return view[:-1], padding
+
+
+def pack_codes(codes: Iterable[int]) -> bytes:
+    """
+    Pack word codes into a packed buffer.
+    
+    Args:
+        codes: Codes 0-63 (bytes, a list, tokenizer output, ...)
+    
+    Returns:
+        Packed buffer (see PACKED BINARY CODEC)
+    
+    Raises:
+        ValueError: A code outside 0-63
+    """
+    codes = bytes(codes)
+    padding = -len(codes) % 4
+    return _pack_groups(codes + bytes(padding)) + bytes((padding,))
+
+
+def unpack_codes(packed: Union[bytes, bytearray, memoryview]) -> bytes:
+    """
+    Unpack a packed buffer into word codes, one per byte.
+    
+    Raises:
+        ValueError: Truncated or malformed buffer
+    """
+    groups, padding = _split_packed(packed)
+    codes = _unpack_groups(groups)
+    return codes[:len(codes) - padding]
+
+
+def iter_packed(packed: Union[bytes, bytearray, memoryview]) -> Iterator[int]:
+    """
+    Yield the word codes of a packed buffer without copying it.
+    
+    The buffer (bytes, an mmap, ...) is read through a memoryview a
+    window at a time, so memory stays bounded however large it is.
+    
+    Raises:
+        ValueError: Truncated or malformed buffer
+    """
+    groups, padding = _split_packed(packed)
+    window = 3 * _WINDOW_GROUPS
+    last = len(groups) - window
+    for start in range(0, len(groups), window):
+        codes = _unpack_groups(groups[start:start + window])
+        yield from (codes[:len(codes) - padding] if start >= last else codes)
+
+
+class PackedEncoder:
+    """
+    Streaming packer: feed codes in any amounts, write out what it returns.
+    
+    Attributes:
+        count: Codes fed so far
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self._pending = b''
+    
+    def feed(self, codes: Iterable[int]) -> bytes:
+        """
+        Pack the next codes.
+        
+        Returns:
+            Packed bytes for every complete group of four so far
+        
+        Raises:
+            ValueError: A code outside 0-63
+        """
+        codes = self._pending + bytes(codes)
+        self.count += len(codes) - len(self._pending)
+        whole = len(codes) - len(codes) % 4
+        self._pending = codes[whole:]
+        return _pack_groups(codes[:whole])
+    
+    def close(self) -> bytes:
+        """Pack the final, padded group and the padding count."""
+        pending, self._pending = self._pending, b''
+        return pack_codes(pending)
+
+
+class PackedDecoder:
+    """
+    Streaming unpacker: feed a packed buffer in chunks of any size.
+    
+    The last group and the padding byte are held back until close().
+    """
+    
+    def __init__(self):
+        self._pending = b''
+    
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        Unpack the next chunk.
+        
+        Returns:
+            Codes of the groups known not to be the last
+        """
+        data = self._pending + bytes(data)
+        whole = max(0, len(data) - 4) // 3 * 3
+        self._pending = data[whole:]
+        return _unpack_groups(data[:whole])
+    
+    def close(self) -> bytes:
+        """
+        Unpack the last group, dropping its padding.
+        
+        Raises:
+            ValueError: Truncated or malformed buffer
+        """
+        pending, self._pending = self._pending, b''
+        return unpack_codes(pending)
+
+
+# Word texts by code, for bulk formatting
+_CODE_TEXTS: Tuple[str, ...] = tuple('-'.join(syllables) for syllables in CODE_SYLLABLES)
+
+
+def pack_text(text: Union[str, bytes]) -> bytes:
+    """
+    Pack Dobre text (whitespace-separated words) into a packed buffer.
+    
+    Raises:
+        ValueError: A token that is not a Dobre word
+    """
+    tokenizer = DobreTokenizer(strict=True)
+    return pack_codes(tokenizer.feed(text) + tokenizer.close())
+
+
+def unpack_text(packed: Union[bytes, bytearray, memoryview]) -> str:
+    """Unpack a packed buffer into space-separated Dobre text."""
+    return ' '.join(map(_CODE_TEXTS.__getitem__, unpack_codes(packed)))
+
+
+def pack_archetypes(archetypes: Iterable[Any]) -> bytes:
+    """
+    Pack SUBIT Archetypes into a packed buffer.
+    
+    Args:
+        archetypes: src.subit Archetype instances
+    """
+    return pack_codes(arch.int_value for arch in archetypes)
+
+
+def unpack_archetypes(packed: Union[bytes, bytearray, memoryview]) -> List[Any]:
+    """
+    Unpack a packed buffer into new SUBIT Archetypes.
+    
+    Raises:
+        ImportError: SUBIT is not available (standalone mode)
+    """
+    if SubitArchetype is None:
+        raise ImportError("unpack_archetypes needs the SUBIT module (src.subit)")
+    make = SubitArchetype.from_int
+    return [make(code) for code in unpack_codes(packed)]
+
+
+# ============================================================================
+# FUZZY RESOLUTION
+# ============================================================================
+#
+# Speech-to-text hands over near misses ("dibiri", "ti-bi-ri",
+# "di-bi-rii"). Every word is indexed under each string left after
+# deleting up to two of its letters; a token probes the index with its
+# own deletions, which finds every word within two edits in a few dict
+# probes, and only those few candidates are ranked by phonetic distance.
+
+# Sounds heard in place of Dobre letters: voiceless consonants, v for b,
+# l for r, u for o. Tokens are folded before probing, so these confusions
+# never count against the two-edit reach of the index.
+_SOUND_FOLD = str.maketrans('tpvlu', 'dbbro')
+
+# Vowels close enough to be confused
+_CLOSE_VOWELS = {('e', 'i'), ('i', 'e')}
+
+# Edits the delete index reaches
+_MAX_EDITS = 2
+
+_NOT_LETTERS = re.compile(r'[^a-z]+')
+# No Dobre word repeats a letter, so a doubled letter is an echo
+_REPEATS = re.compile(r'(.)\1+')
+
+
+def _substitution_cost(a: str, b: str) -> float:
+    if a == b:
+        return 0.0
+    if a.translate(_SOUND_FOLD) == b.translate(_SOUND_FOLD) or (a, b) in _CLOSE_VOWELS:
+        return 0.5
+    return 1.0
+
+
+# Substitution costs by heard letter, then spelled letter
+_SUBSTITUTION_COSTS: Dict[str, Dict[str, float]] = {
+    a: {b: _substitution_cost(a, b) for b in 'abcdefghijklmnopqrstuvwxyz'}
+    for a in 'abcdefghijklmnopqrstuvwxyz'
+}
+
+
+class DobreMatch(NamedTuple):
+    """A candidate word for a noisy token."""
+    word: Dobre
+    distance: float
+
+
+def phonetic_distance(heard: str, spelled: str) -> float:
+    """
+    Edit distance between two letter strings, weighted by sound.
+    
+    Insertions and deletions cost 1; substituting a confusable sound
+    (t/d, p/b/v, l/r, u/o, e/i) costs 0.5 and any other letter 1.
+    
+    Args:
+        heard: Lowercase letters, e.g. "tibiri"
+        spelled: Lowercase letters, e.g. "dibiri"
+    """
+    previous = list(range(len(spelled) + 1))
+    for i, a in enumerate(heard, 1):
+        costs = _SUBSTITUTION_COSTS.get(a, {})
+        current = [i]
+        left = i
+        for j, b in enumerate(spelled):
+            # Cheapest of insertion, deletion and substitution
+            left += 1
+            up = previous[j + 1] + 1
+            if up < left:
+                left = up
+            diagonal = previous[j] + costs.get(b, 1.0)
+            if diagonal < left:
+                left = diagonal
+            current.append(left)
+        previous = current
+    return previous[-1]
+
+
+def _deletions(key: str, depth: int) -> set:
+    """key and every string left after deleting up to depth letters."""
+    found = {key}
+    layer = {key}
+    for _ in range(depth):
+        layer = {k[:i] + k[i + 1:] for k in layer for i in range(len(k))}
+        found |= layer
+    return found
+
+
+@lru_cache(maxsize=None)
+def _deletion_index() -> Dict[str, Tuple[int, ...]]:
+    """Codes of the words reachable from each deletion variant (built on first use)."""
+    index: Dict[str, List[int]] = {}
+    for code, syllables in enumerate(CODE_SYLLABLES):
+        for variant in _deletions(''.join(syllables), _MAX_EDITS):
+            index.setdefault(variant, []).append(code)
+    return {variant: tuple(codes) for variant, codes in index.items()}
+
+
+@lru_cache(maxsize=1 << 16)
+def _candidates(letters: str, max_distance: float) -> Tuple[DobreMatch, ...]:
+    """All words within max_distance of a letter string, nearest first."""
+    folded = letters.translate(_SOUND_FOLD)
+    if abs(len(folded) - 6) > _MAX_EDITS:
+        return ()
+    index = _deletion_index()
+    codes = set()
+    for variant in _deletions(folded, _MAX_EDITS):
+        codes.update(index.get(variant, ()))
+    matches = []
+    for code in codes:
+        distance = phonetic_distance(letters, ''.join(CODE_SYLLABLES[code]))
+        if distance <= max_distance:
+            matches.append(DobreMatch(_WORDS[code], distance))
+    matches.sort(key=lambda m: (m.distance, m.word.code))
+    return tuple(matches)
+
+
+def resolve(token: str, max_distance: float = 1.5, limit: int = 3) -> List[DobreMatch]:
+    """
+    Find the Dobre words nearest a noisy token.
+    
+    Case, hyphens and other non-letters are ignored and doubled letters
+    read as one, so "Di Bi Ri", "dibiri" and "di-bi-rii" resolve like
+    "di-bi-ri". Results for a token are cached.
+    
+    Args:
+        token: Heard word
+        max_distance: Largest phonetic_distance to accept (at most 2)
+        limit: Matches to return
+    
+    Returns:
+        Up to limit DobreMatches, nearest first (ties by code)
+    
+    Raises:
+        ValueError: max_distance beyond what the index reaches
+    """
+    if not 0 <= max_distance <= _MAX_EDITS:
+        raise ValueError(f"max_distance must be between 0 and {_MAX_EDITS}")
+    word = _BY_STRING.get(token)
+    if word is not None:
+        return [DobreMatch(word, 0.0)][:limit]
+    letters = _REPEATS.sub(r'\1', _NOT_LETTERS.sub('', token.lower()))
+    return list(_candidates(letters, max_distance)[:limit])
+
+
+def resolve_transcript(text: str, max_distance: float = 1.5) -> List[Optional[DobreMatch]]:
+    """
+    Resolve every whitespace-separated token of a transcript.
+    
+    Args:
+        text: Heard transcript
+        max_distance: Largest phonetic_distance to accept (at most 2)
+    
+    Returns:
+        For each token, its nearest DobreMatch, or None when nothing is
+        within max_distance or two words tie for nearest
+    
+    Raises:
+        ValueError: max_distance beyond what the index reaches
+    """
+    results = []
+    for token in text.split():
+        matches = resolve(token, max_distance, limit=2)
+        if not matches or (len(matches) == 2 and matches[1].distance == matches[0].distance):
+            results.append(None)
+        else:
+            results.append(matches[0])
+    return results
 
 
 # ============================================================================
@@ -344,6 +999,26 @@ def translate_from_dobre(dobre_str: str) -> Tuple[str, str, str]:
     return Dobre.from_string(dobre_str).to_archetype()
 
 
+@lru_cache(maxsize=None)
+def canon_names() -> Tuple[str, ...]:
+    """
+    Archetype names by code from the CANON catalog (data/archetypes_dbr.json).
+    
+    The catalog is read on first call only; names are "Unknown" if it
+    is missing.
+    """
+    import json
+    path = os.path.join(os.path.dirname(__file__), '..', 'data', 'archetypes_dbr.json')
+    names = ['Unknown'] * 64
+    try:
+        with open(path, encoding='utf-8') as f:
+            for entry in json.load(f)['archetypes']:
+                names[entry['id']] = entry['name']
+    except (OSError, ValueError, KeyError):
+        pass
+    return tuple(names)
+
+
 def list_all_archetypes() -> List[Dict]:
     """
     List all 64 archetypes with their Dobre pronunciations.
@@ -356,14 +1031,6 @@ def list_all_archetypes() -> List[Dict]:
         dobre = Dobre.from_code(code)
         who, where, when = dobre.to_archetype()
         
-        # Get name from CANON if available
-        name = "Unknown"
-        try:
-            from data.archetypes_dbr import ARCHETYPES_DBR
-            name = ARCHETYPES_DBR.get(code, {}).get('name', 'Unknown')
-        except ImportError:
-            pass
-        
         result.append({
             'code': code,
             'bits': dobre.to_bits(),
@@ -371,7 +1038,7 @@ def list_all_archetypes() -> List[Dict]:
             'where': where,
             'when': when,
             'dobre': str(dobre),
-            'name': name
+            'name': canon_names()[code]
         })
     
     return result
@@ -443,6 +1110,59 @@ def transmute(a: Dobre, b: Dobre, c: Dobre) -> Dobre:
     return a ^ b ^ c
 
 
+def reduce_phrases(codes: bytes, lengths: Iterable[int]) -> bytes:
+    """
+    XOR-reduce many phrases packed end to end in one code buffer.
+    
+    One prefix-XOR pass covers the whole buffer; each phrase's result is
+    then the XOR of the prefixes at its two ends.
+    
+    Args:
+        codes: Word codes (0-63), one per byte, phrases back to back
+        lengths: Words in each phrase, in buffer order
+    
+    Returns:
+        One code per phrase
+    
+    Raises:
+        ValueError: A code outside 0-63, or lengths running past the buffer
+    """
+    codes = bytes(codes)
+    if codes.translate(None, _CODE_BYTES):
+        raise ValueError(f"Code must be between 0 and 63, got {max(codes)}")
+    lengths = list(lengths)
+    if min(lengths, default=0) < 0:
+        raise ValueError("Phrase lengths must not be negative")
+    ends = list(accumulate(lengths, initial=0))
+    if ends[-1] > len(codes):
+        raise ValueError(f"Phrase lengths cover {ends[-1]} words, the buffer has {len(codes)}")
+    if len(ends) == 1:
+        return b''
+    bounds = bytes(itemgetter(*ends)(_prefix_xor(codes)))
+    count = len(ends) - 1
+    return (int.from_bytes(bounds[1:], 'little')
+            ^ int.from_bytes(bounds[:-1], 'little')).to_bytes(count, 'little')
+
+
+
+def _prefix_xor(codes: bytes) -> bytes:
+    """
+    Prefix XOR of a code buffer, with a leading zero.
+    
+    The buffer is read as one little-endian integer and XORed with
+    copies of itself shifted by 1, 2, 4, ... bytes, so every byte ends
+    up holding the XOR of all bytes up to it in log2(n) whole-integer
+    operations rather than n Python-level ones.
+    """
+    n = len(codes)
+    prefix = int.from_bytes(codes, 'little')
+    shift = 8
+    while shift < 8 * n:
+        prefix ^= prefix << shift
+        shift <<= 1
+    return b'\0' + (prefix & ((1 << 8 * n) - 1)).to_bytes(n, 'little')
+
+
 def verify_transmutation(transmutation: Dict) -> bool:
     """
     Verify that a transmutation formula is correct.
@@ -465,6 +1185,73 @@ def verify_transmutation(transmutation: Dict) -> bool:
 # COMMAND LINE INTERFACE
 # ============================================================================
 
+# Stream mode inputs: codes, bit strings (plain or spaced like
+# Archetype.bits), dimension triples and Dobre words, all lowercase and
+# single-spaced
+_STREAM_KEYS: Dict[str, int] = {}
+for _code, (_who, _where, _when) in enumerate(CODE_DIMENSIONS):
+    _bits = CODE_BITS[_code]
+    for _key in (str(_code), _bits, f"{_bits[:2]} {_bits[2:4]} {_bits[4:]}", _CODE_TEXTS[_code],
+                 f"{_who} {_where} {_when}", f"{_who}-{_where}-{_when}"):
+        _STREAM_KEYS[_key.lower()] = _code
+
+# Stream mode output rows: word, code, bits and dimensions, tab-separated
+_STREAM_ROWS: Tuple[str, ...] = tuple(
+    f"{_CODE_TEXTS[code]}\t{code}\t{CODE_BITS[code]}\t{'-'.join(CODE_DIMENSIONS[code])}\n"
+    for code in range(64)
+)
+
+
+def stream(infile, outfile, errfile=sys.stderr, batch: int = 4096) -> int:
+    """
+    Translate newline-delimited inputs, one output row per input line.
+    
+    Each line is detected as a code (0-63), 6 bits ("101010" or
+    "10 10 10"), a WHO WHERE WHEN triple (space- or hyphen-separated), a
+    Dobre word, or a phrase of Dobre words, which evaluates to their XOR;
+    case and runs of whitespace are ignored. Each gives the row
+    "word<TAB>code<TAB>bits<TAB>WHO-WHERE-WHEN"; blank and unreadable
+    lines give an empty row (so output lines up with input), and
+    unreadable ones are reported to errfile.
+    
+    Args:
+        infile: Text input, e.g. sys.stdin
+        outfile: Text output, e.g. sys.stdout
+        errfile: Where to report unreadable lines
+        batch: Rows written per write call
+    
+    Returns:
+        Number of unreadable lines
+    """
+    lookup = _STREAM_KEYS.get
+    words = _TOKEN_CODES.get
+    rows = _STREAM_ROWS
+    out = []
+    bad = 0
+    for number, line in enumerate(infile, 1):
+        key = " ".join(line.split()).lower()
+        code = lookup(key)
+        if code is None:
+            codes = list(map(words, key.split()))
+            if len(codes) > 1 and None not in codes:
+                code = 0
+                for word in codes:
+                    code ^= word
+            else:
+                if key:
+                    bad += 1
+                    errfile.write(f"line {number}: cannot read {line.strip()!r}\n")
+                out.append("\n")
+                continue
+        out.append(rows[code])
+        if len(out) >= batch:
+            outfile.write("".join(out))
+            out.clear()
+    outfile.write("".join(out))
+    outfile.flush()
+    return bad
+
+
 def main():
     """Simple command-line interface."""
     import argparse
@@ -482,10 +1269,20 @@ def main():
                        help='Apply XOR transmutation to three Dobre words')
     parser.add_argument('--verify', metavar='NAME',
                        help='Verify a famous transmutation (philosopher, hero, marriage)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Translate codes, bits, WHO WHERE WHEN triples, Dobre words or '
+                            'phrases (XOR-folded), one per line of stdin, to tab-separated '
+                            'word/code/bits/dimensions rows on stdout')
     
     args = parser.parse_args()
     
-    if args.translate:
+    if args.stream:
+        # Flush each row when typing at a terminal
+        batch = 1 if sys.stdin.isatty() else 4096
+        if stream(sys.stdin, sys.stdout, sys.stderr, batch):
+            sys.exit(1)
+    
+    elif args.translate:
         who, where, when = args.translate
         try:
             dobre = Dobre.from_archetype(who.upper(), where.upper(), when.upper())
@@ -596,84 +1393,3 @@ if __name__ == "__main__":
         print("\n" + "="*60)
         print("For more: python dobre.py --help")
         print("="*60 + "\n")
-```
-
----
-
-## 📦 **Requirements & Installation**
-
-### requirements.txt
-```txt
-# No external dependencies required
-# Optional: for integration with original SUBIT
-# subit @ git+https://github.com/sciganec/subit-narrative-engine.git
-```
-
-### setup.py (optional)
-```python
-from setuptools import setup, find_packages
-
-setup(
-    name="dobre",
-    version="1.0.0",
-    description="Dobre Language — Resonant Voice of SUBIT",
-    author="SUBIT Narrative Engine",
-    packages=find_packages(),
-    python_requires=">=3.6",
-    entry_points={
-        "console_scripts": [
-            "dobre=dobre:main",
-        ],
-    },
-)
-```
-
----
-
-## 🚀 **Usage Examples**
-
-```bash
-# Translate dimensions to Dobre
-python dobre.py --translate ME EAST SPRING
-# Output: ME-EAST-SPRING → di-bi-ri
-
-# Translate Dobre to dimensions
-python dobre.py --from-dobre di-bi-ri
-# Output: di-bi-ri → ME-EAST-SPRING
-
-# Get Dobre for a code
-python dobre.py --code 42
-# Output: Code 42 (101010): di-bi-ri = ME-EAST-SPRING
-
-# List all 64 archetypes
-python dobre.py --list
-
-# Apply XOR transmutation
-python dobre.py --transmute di-bo-ra da-bi-ri de-be-ro
-# Output: di-bo-ra ⊕ da-bi-ri ⊕ de-be-ro = do-be-ro
-
-# Verify famous transmutation
-python dobre.py --verify philosopher
-```
-
----
-
-## 🔗 **Integration with Original SUBIT**
-
-```python
-from src.subit import Archetype
-from dobre import Dobre
-
-# Create from original SUBIT
-arch = Archetype("ME", "EAST", "SPRING")
-dobre = Dobre.from_archetype(arch.who, arch.where, arch.when)
-print(dobre)  # di-bi-ri
-
-# Convert back
-who, where, when = dobre.to_archetype()
-arch2 = Archetype(who, where, when)
-```
-
----
-
-**6 bits. 64 archetypes. One voice. Dobre.** 🜁 🜂 🜃 🜄
@@ -0,0 +1,404 @@
+"""
+synth.py — Offline speech synthesis for the Dobre language
+
+Renders Dobre words and phrases to 16-bit mono WAV, following the
+pronunciation in PHONETICS.md: each vowel is a harmonic series of the
+voice pitch shaped by its formants, D and B are voiced plosives (a
+voice bar, then a bright alveolar or a soft bilabial noise burst), and R
+is an alveolar approximant gliding into its vowel.
+
+The 12 syllables are synthesized once and the 64 words built once from
+them with crossfaded joins, so rendering a phrase is only a join of
+cached PCM slices. Long phrases are written a chunk of words at a time:
+an hour-long chant renders in seconds, in the memory of one chunk.
+
+NumPy builds the cache with vectorized operations when it is installed;
+without it the same samples are computed in pure Python, which only
+makes building the cache slower.
+
+Usage:
+    synth = DobreSynth()
+    synth.write_wav("di-bi-ri da-ba-ra", "phrase.wav")
+    with open("chant.dbr") as f:
+        synth.write_wav(f, "chant.wav")
+
+Command line:
+    python synth.py chant.dbr chant.wav --pitch 110
+"""
+
+import sys
+import os
+import math
+import random
+import wave
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+# Add the repository root to the path for importing the Dobre interface
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+try:
+    from dobre.src.dobre import CODE_SYLLABLES, DOBRE_SYLLABLES, Dobre, DobrePhrase, DobreTokenizer
+except ImportError:
+    # Run as a script: dobre.py is a sibling module and shadows the package
+    from dobre import CODE_SYLLABLES, DOBRE_SYLLABLES, Dobre, DobrePhrase, DobreTokenizer
+
+try:
+    import numpy as np
+except ImportError:
+    # Fallback: build the cache in pure Python
+    np = None
+
+
+# ============================================================================
+# VOICE PARAMETERS
+# ============================================================================
+
+# Vowel formants (F1, F2 from PHONETICS.md, plus a typical F3) in Hz
+VOWEL_FORMANTS: Dict[str, Tuple[float, float, float]] = {
+    'i': (300.0, 2500.0, 3000.0),
+    'e': (500.0, 2000.0, 2800.0),
+    'a': (850.0, 1200.0, 2600.0),
+    'o': (500.0, 900.0, 2500.0),
+}
+
+# Formants of the R glide: the low F3 of an alveolar approximant
+R_FORMANTS: Tuple[float, float, float] = (350.0, 1200.0, 1600.0)
+
+# Formant bandwidths (F1, F2, F3) in Hz
+_BANDWIDTHS = (80.0, 120.0, 200.0)
+
+# Harmonics above this carry little of the vowel and are left out
+_MAX_PARTIAL = 4500.0
+
+# Plosive voice bar and burst, and the R glide, in seconds
+_CLOSURE_SECONDS = 0.03
+_BURST_SECONDS = 0.008
+_GLIDE_SECONDS = 0.05
+
+# Burst brightness and level: D alveolar and hard, B bilabial and soft
+_BURSTS = {'d': (True, 0.5), 'b': (False, 0.3)}
+
+# Syllable attack and release, in seconds
+_ATTACK_SECONDS = 0.003
+_RELEASE_SECONDS = 0.02
+
+# Peak level of the loudest syllable (1.0 = full scale)
+_PEAK = 0.9
+
+
+# ============================================================================
+# SIGNAL HELPERS (NumPy arrays, or lists of floats without NumPy)
+# ============================================================================
+
+def _partials(formants: Tuple[float, ...], pitch: float, level: float) -> List[Tuple[float, float]]:
+    """
+    Harmonics of the pitch with amplitudes shaped by formant resonances.
+
+    The source falls off as 1/k, and each formant adds a resonance peak
+    of its bandwidth; the amplitudes are scaled to sum to level.
+    """
+    partials = []
+    for k in range(1, int(_MAX_PARTIAL // pitch) + 1):
+        freq = k * pitch
+        gain = sum(1.0 / (1.0 + ((freq - f) / (bw / 2)) ** 2)
+                   for f, bw in zip(formants, _BANDWIDTHS))
+        partials.append((freq, gain / k))
+    total = sum(amp for _, amp in partials)
+    return [(freq, amp * level / total) for freq, amp in partials]
+
+
+def _tone(partials: List[Tuple[float, float]], n: int, rate: int):
+    """n samples of a sum of sines, all starting at phase 0."""
+    step = 2 * math.pi / rate
+    if np is not None:
+        freqs = np.array([freq for freq, _ in partials])
+        amps = np.array([amp for _, amp in partials])
+        return amps @ np.sin(np.outer(freqs * step, np.arange(n)))
+    samples = [0.0] * n
+    for freq, amp in partials:
+        w = freq * step
+        samples = [s + amp * math.sin(w * i) for i, s in enumerate(samples)]
+    return samples
+
+
+def _burst(n: int, bright: bool, level: float, seed: int):
+    """
+    n samples of noise fading out linearly.
+
+    Differences of white noise give a bright (alveolar) burst, sums a
+    dark (bilabial) one. The noise comes from a seeded random.Random
+    either way, so both backends render the same burst.
+    """
+    rng = random.Random(seed)
+    noise = [rng.uniform(-1.0, 1.0) for _ in range(n + 1)]
+    if np is not None:
+        noise = np.array(noise)
+        shaped = noise[1:] - noise[:-1] if bright else (noise[1:] + noise[:-1]) / 2
+        return shaped * (level * _fade(n)[::-1])
+    sign = -1.0 if bright else 1.0
+    weight = 1.0 if bright else 0.5
+    return [(b + sign * a) * weight * level * (n - i) / (n + 1)
+            for i, (a, b) in enumerate(zip(noise, noise[1:]))]
+
+
+def _fade(n: int):
+    """n linear fade-in weights, strictly between 0 and 1."""
+    if np is not None:
+        return np.arange(1, n + 1) / (n + 1)
+    return [i / (n + 1) for i in range(1, n + 1)]
+
+
+def _envelope(samples, attack: int, release: int):
+    """Fade a segment in over its first attack and out over its last release samples."""
+    n = len(samples)
+    fade_in, fade_out = _fade(attack), _fade(release)[::-1]
+    if np is not None:
+        samples = samples.copy()
+        samples[:attack] *= fade_in
+        samples[n - release:] *= fade_out
+        return samples
+    samples = list(samples)
+    for i, w in enumerate(fade_in):
+        samples[i] *= w
+    for i, w in enumerate(fade_out, n - release):
+        samples[i] *= w
+    return samples
+
+
+def _crossfade(a, b, overlap: int):
+    """Join two segments, fading a out and b in over overlap samples."""
+    overlap = min(overlap, len(a), len(b))
+    head = len(a) - overlap
+    w = _fade(overlap)
+    if np is not None:
+        mixed = a[head:] * w[::-1] + b[:overlap] * w
+        return np.concatenate((a[:head], mixed, b[overlap:]))
+    mixed = [x * (1 - v) + y * v for x, y, v in zip(a[head:], b, w)]
+    return a[:head] + mixed + b[overlap:]
+
+
+def _peak(samples) -> float:
+    if np is not None:
+        return float(np.abs(samples).max())
+    return max(map(abs, samples))
+
+
+def _pcm(samples, gain: float) -> bytes:
+    """Scale, round and clip samples to 16-bit little-endian PCM."""
+    scale = gain * 32767
+    if np is not None:
+        return np.clip(np.rint(samples * scale), -32768, 32767).astype('<i2').tobytes()
+    pcm = array('h', [max(-32768, min(32767, round(s * scale))) for s in samples])
+    if sys.byteorder == 'big':
+        pcm.byteswap()
+    return pcm.tobytes()
+
+
+# ============================================================================
+# SYNTHESIZER
+# ============================================================================
+
+class DobreSynth:
+    """
+    Offline synthesizer for Dobre words and phrases.
+
+    All 64 words render to the same length, so a phrase of n words is
+    n * word_frames frames long.
+
+    Attributes:
+        rate: Sample rate in Hz
+        pitch: Voice fundamental in Hz
+        syllables: 16-bit PCM of the 12 syllables, by syllable string
+        words: 16-bit PCM of the 64 words with their trailing pause, by code
+        word_frames: Frames per word, pause included
+    """
+
+    def __init__(self, rate: int = 22050, pitch: float = 120.0, syllable_seconds: float = 0.18,
+                 crossfade_seconds: float = 0.02, pause_seconds: float = 0.12):
+        """
+        Synthesize the syllable and word caches.
+
+        Args:
+            rate: Sample rate in Hz (8000-96000)
+            pitch: Voice fundamental in Hz (50-400)
+            syllable_seconds: Length of a syllable, consonant included
+            crossfade_seconds: Overlap of the syllables within a word
+            pause_seconds: Silence after each word
+
+        Raises:
+            ValueError: Parameters outside these ranges, or a syllable too
+                short for its consonant
+        """
+        if not 8000 <= rate <= 96000:
+            raise ValueError(f"Sample rate must be between 8000 and 96000, got {rate}")
+        if not 50.0 <= pitch <= 400.0:
+            raise ValueError(f"Pitch must be between 50 and 400 Hz, got {pitch}")
+        onset = max(_CLOSURE_SECONDS + _BURST_SECONDS, _GLIDE_SECONDS)
+        if syllable_seconds <= onset + crossfade_seconds:
+            raise ValueError(f"Syllables must be longer than {onset + crossfade_seconds:.3f}s, "
+                             f"got {syllable_seconds}")
+        if crossfade_seconds < 0 or pause_seconds < 0:
+            raise ValueError("Crossfade and pause must not be negative")
+        self.rate = rate
+        self.pitch = pitch
+
+        waves = self._syllable_waves(syllable_seconds)
+        gain = _PEAK / max(map(_peak, waves.values()))
+        self.syllables: Dict[str, bytes] = {s: _pcm(w, gain) for s, w in waves.items()}
+
+        overlap = round(crossfade_seconds * rate)
+        pause = bytes(2 * round(pause_seconds * rate))
+        self.words: Tuple[bytes, ...] = tuple(
+            _pcm(_crossfade(_crossfade(waves[s1], waves[s2], overlap), waves[s3], overlap), gain)
+            + pause
+            for s1, s2, s3 in CODE_SYLLABLES
+        )
+        self.word_frames = len(self.words[0]) // 2
+
+    def _syllable_waves(self, seconds: float) -> Dict[str, Any]:
+        """Synthesize the 12 syllables as float samples, in DOBRE_SYLLABLES order."""
+        rate, pitch = self.rate, self.pitch
+        n = round(seconds * rate)
+        closure = round(_CLOSURE_SECONDS * rate)
+        burst = round(_BURST_SECONDS * rate)
+        glide = round(_GLIDE_SECONDS * rate)
+        attack = round(_ATTACK_SECONDS * rate)
+        release = round(_RELEASE_SECONDS * rate)
+
+        # A plosive's closure hums at the pitch, muffled by the closed mouth
+        voice_bar = _tone([(pitch, 0.1), (2 * pitch, 0.03)], closure, rate)
+        onsets = {
+            c: _crossfade(voice_bar, _burst(burst, bright, level, seed=ord(c)), attack)
+            for c, (bright, level) in _BURSTS.items()
+        }
+        onsets['r'] = _tone(_partials(R_FORMANTS, pitch, 0.6), glide, rate)
+        # R glides into its vowel; the plosives release into it
+        overlaps = {'d': attack, 'b': attack, 'r': glide // 2}
+
+        waves = {}
+        for syllable in DOBRE_SYLLABLES:
+            consonant, vowel = syllable
+            onset = onsets[consonant]
+            body = n - len(onset) + overlaps[consonant]
+            sound = _tone(_partials(VOWEL_FORMANTS[vowel], pitch, 1.0), body, rate)
+            waves[syllable] = _envelope(_crossfade(onset, sound, overlaps[consonant]),
+                                        attack, release)
+        return waves
+
+    def word(self, word: Union[Dobre, int, str]) -> bytes:
+        """
+        PCM of one word, pause included.
+
+        Args:
+            word: A Dobre word, its code (0-63) or its spelling
+
+        Raises:
+            ValueError: An invalid code or spelling
+        """
+        if isinstance(word, str):
+            word = Dobre.from_string(word)
+        code = word.code if isinstance(word, Dobre) else word
+        if not 0 <= code <= 63:
+            raise ValueError(f"Code must be between 0 and 63, got {code}")
+        return self.words[code]
+
+    def chunks(self, source: Any, chunk_words: int = 256) -> Iterator[bytes]:
+        """
+        Render a phrase as PCM, a chunk of words at a time.
+
+        Args:
+            source: Dobre text (a str or a text or binary file, tokenized
+                strictly), a DobrePhrase, or any iterable of Dobre words
+                or codes (e.g. bytes of DobreTokenizer output)
+            chunk_words: Words per chunk
+
+        Yields:
+            PCM of up to chunk_words words
+
+        Raises:
+            ValueError: A bad token in the text, or a code outside 0-63
+        """
+        if chunk_words < 1:
+            raise ValueError(f"chunk_words must be positive, got {chunk_words}")
+        words = self.words
+        codes = _codes(source)
+        for chunk in iter(lambda: bytes(islice(codes, chunk_words)), b''):
+            if max(chunk) > 63:
+                raise ValueError(f"Code must be between 0 and 63, got {max(chunk)}")
+            yield b''.join(map(words.__getitem__, chunk))
+
+    def render(self, source: Any) -> bytes:
+        """PCM of a whole phrase (see chunks for the sources accepted)."""
+        return b''.join(self.chunks(source, 4096))
+
+    def write_wav(self, source: Any, target: Any, chunk_words: int = 256) -> int:
+        """
+        Stream a phrase to a WAV file.
+
+        Only one chunk of PCM is held at a time. When the source has a
+        length the header is written up front and target may be a pipe;
+        otherwise the header is patched on close and target must be
+        seekable.
+
+        Args:
+            source: Phrase, as accepted by chunks
+            target: Path or binary file object (left open)
+            chunk_words: Words per chunk
+
+        Returns:
+            Frames written
+
+        Raises:
+            ValueError: A bad token or code in the source
+        """
+        with wave.open(target, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.rate)
+            if hasattr(source, '__len__') and not isinstance(source, str):
+                wav.setnframes(len(source) * self.word_frames)
+            frames = 0
+            for pcm in self.chunks(source, chunk_words):
+                wav.writeframesraw(pcm)
+                frames += len(pcm) // 2
+        return frames
+
+
+def _codes(source: Any) -> Iterator[int]:
+    """Word codes of a phrase source (see DobreSynth.chunks)."""
+    if isinstance(source, str) or hasattr(source, 'read'):
+        return DobreTokenizer(strict=True).tokenize(source)
+    if isinstance(source, DobrePhrase):
+        source = source.words
+    return (item.code if isinstance(item, Dobre) else item for item in source)
+
+
+def main():
+    """Render a Dobre text file (or stdin) to a WAV file."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render Dobre text to speech')
+    parser.add_argument('input', help="Dobre text file ('-' for stdin)")
+    parser.add_argument('output', help='WAV file to write')
+    parser.add_argument('--pitch', type=float, default=120.0, help='Voice pitch in Hz')
+    parser.add_argument('--rate', type=int, default=22050, help='Sample rate in Hz')
+    parser.add_argument('--pause', type=float, default=0.12, help='Seconds between words')
+
+    args = parser.parse_args()
+
+    try:
+        synth = DobreSynth(rate=args.rate, pitch=args.pitch, pause_seconds=args.pause)
+        if args.input == '-':
+            frames = synth.write_wav(sys.stdin.buffer, args.output)
+        else:
+            with open(args.input, 'rb') as f:
+                frames = synth.write_wav(f, args.output)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{args.output}: {frames / synth.rate:.1f}s, {frames // synth.word_frames} words")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+SUBIT Story Archive
+Append-only story storage with random access by id
+
+Saving one file per story leaves millions of small files behind. An
+archive keeps every story in two files instead:
+
+    stories.sar       8-byte magic, then one record per story:
+                      length (4 bytes), flags (1 byte), payload
+    stories.sar.idx   one 8-byte data-file offset per story, by id
+
+Payloads are the stories' to_dict JSON, each optionally zlib-compressed
+(flagged per record, so archives may mix both). All integers are
+little-endian. Readers mmap both files: a story by id is two slices of
+the mapping, and a scan walks the length prefixes in order.
+
+The writer appends data before index and fsyncs both once per batch of
+records. An index entry is only written once its record is durable, so
+after a crash the index never points past the data; reopening for
+append cuts off any unindexed tail.
+
+Usage:
+    Story.save_many(engine.generate_story() for _ in range(100000), "stories.sar")
+    with StoryArchive.open("stories.sar") as archive:
+        story = archive[123]
+        for record in archive.scan():
+            ...
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from typing import Any, Dict, Iterator, Union
+
+# Add parent directory to path for importing base SUBIT
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.subit import Story
+
+
+MAGIC = b"SUBITAR\x01"
+
+# Record header: payload length, flags
+_RECORD = struct.Struct("<IB")
+_OFFSET = struct.Struct("<Q")
+
+# Record flags
+FLAG_ZLIB = 1
+
+
+def index_path(path: str) -> str:
+    """Index file of an archive's data file."""
+    return path + ".idx"
+
+
+def _map(f) -> Union[mmap.mmap, bytes]:
+    """Read-only mapping of a whole file (empty files cannot be mapped)."""
+    size = os.fstat(f.fileno()).st_size
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+
+class StoryArchive:
+    """
+    Read-only, memory-mapped view of an archive.
+
+    The view covers the records indexed when it was opened; open it
+    again to see later appends.
+
+    Attributes:
+        path: Archive data file
+    """
+
+    def __init__(self, path: str):
+        """
+        Map an archive.
+
+        Raises:
+            FileNotFoundError: No archive at path
+            ValueError: Not an archive, or an index past the end of the data
+        """
+        self.path = path
+        with open(path, "rb") as data, open(index_path(path), "rb") as index:
+            self._data = _map(data)
+            self._index = _map(index)
+        if self._data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a story archive: {path}")
+        self._count = len(self._index) // _OFFSET.size
+        try:
+            past_end = self._count and self._locate(self._count - 1)[1] > len(self._data)
+        except struct.error:
+            past_end = True
+        if past_end:
+            self.close()
+            raise ValueError(f"Archive index points past the end of the data: {path}")
+
+    @classmethod
+    def open(cls, path: str) -> 'StoryArchive':
+        """Map the archive at path (see __init__)."""
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _locate(self, story_id: int):
+        """Payload start and end, and flags, of a record."""
+        offset = _OFFSET.unpack_from(self._index, story_id * _OFFSET.size)[0]
+        length, flags = _RECORD.unpack_from(self._data, offset)
+        start = offset + _RECORD.size
+        return start, start + length, flags
+
+    def _decode(self, start: int, end: int, flags: int) -> Dict[str, Any]:
+        payload = self._data[start:end]
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
+    def read(self, story_id: int) -> Dict[str, Any]:
+        """
+        A story's to_dict record, by id.
+
+        Raises:
+            IndexError: No story with that id
+        """
+        if not 0 <= story_id < self._count:
+            raise IndexError(f"Story id {story_id} out of range (0-{self._count - 1})")
+        return self._decode(*self._locate(story_id))
+
+    def __getitem__(self, story_id: int) -> Story:
+        """A story by id (see read)."""
+        return Story.from_dict(self.read(story_id))
+
+    def scan(self, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Records in id order, walking the data file by length prefix.
+
+        Args:
+            start: First id to yield
+
+        Yields:
+            to_dict records
+        """
+        if not 0 <= start < self._count:
+            return
+        data = self._data
+        offset = self._locate(start)[0] - _RECORD.size
+        for _ in range(start, self._count):
+            length, flags = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            yield self._decode(offset, offset + length, flags)
+            offset += length
+
+    def __iter__(self) -> Iterator[Story]:
+        return map(Story.from_dict, self.scan())
+
+    def close(self) -> None:
+        """Unmap the files."""
+        for mapping in (self._data, self._index):
+            if isinstance(mapping, mmap.mmap):
+                mapping.close()
+
+    def __enter__(self) -> 'StoryArchive':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class StoryArchiveWriter:
+    """
+    Appends stories to an archive, creating it if needed.
+
+    Records are buffered and made durable in batches: every sync_every
+    appends (and on flush and close) the data file is fsynced, then the
+    batch's index entries are written and the index fsynced.
+
+    Attributes:
+        path: Archive data file
+        compress: zlib-compress each record that shrinks
+        sync_every: Records appended between fsyncs
+    """
+
+    def __init__(self, path: str, compress: bool = False, sync_every: int = 1000):
+        """
+        Open an archive for appending.
+
+        A tail left by a crash (a partial index entry, or data not yet
+        indexed) is truncated first.
+
+        Raises:
+            ValueError: sync_every below 1, or an existing file that is
+                not an archive
+        """
+        if sync_every < 1:
+            raise ValueError(f"sync_every must be positive, got {sync_every}")
+        self.path = path
+        self.compress = compress
+        self.sync_every = sync_every
+        self._data = open(path, "a+b")
+        self._index = open(index_path(path), "a+b")
+        try:
+            self._offset, self._count = self._recover()
+        except ValueError:
+            self._data.close()
+            self._index.close()
+            raise
+        self._pending = bytearray()
+
+    def _recover(self):
+        """Truncate both files to their last durable, indexed record."""
+        data, index = self._data, self._index
+        data.seek(0)
+        head = data.read(len(MAGIC))
+        if not head:
+            index.truncate(0)
+            data.write(MAGIC)
+            data.flush()
+            return len(MAGIC), 0
+        if head != MAGIC:
+            raise ValueError(f"Not a story archive: {self.path}")
+        size = data.seek(0, os.SEEK_END)
+        count = index.seek(0, os.SEEK_END) // _OFFSET.size
+        end = len(MAGIC)
+        while count:
+            index.seek((count - 1) * _OFFSET.size)
+            offset = _OFFSET.unpack(index.read(_OFFSET.size))[0]
+            data.seek(offset)
+            header = data.read(_RECORD.size)
+            if len(header) == _RECORD.size:
+                end = offset + _RECORD.size + _RECORD.unpack(header)[0]
+                if end <= size:
+                    break
+            count -= 1
+            end = len(MAGIC)
+        index.truncate(count * _OFFSET.size)
+        data.truncate(end)
+        return end, count
+
+    def __len__(self) -> int:
+        """Stories in the archive, pending ones included."""
+        return self._count
+
+    def append(self, story: Union[Story, Dict[str, Any]]) -> int:
+        """
+        Append a story.
+
+        Args:
+            story: A Story, or its to_dict record
+
+        Returns:
+            The story's id
+        """
+        record = story.to_dict() if isinstance(story, Story) else story
+        payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode()
+        flags = 0
+        if self.compress:
+            packed = zlib.compress(payload)
+            if len(packed) < len(payload):
+                payload, flags = packed, FLAG_ZLIB
+        self._data.write(_RECORD.pack(len(payload), flags))
+        self._data.write(payload)
+        self._pending += _OFFSET.pack(self._offset)
+        self._offset += _RECORD.size + len(payload)
+        story_id = self._count
+        self._count += 1
+        if len(self._pending) >= self.sync_every * _OFFSET.size:
+            self.flush()
+        return story_id
+
+    def flush(self, sync: bool = True) -> None:
+        """
+        Write out pending records and their index entries.
+
+        Args:
+            sync: fsync the data before indexing it, and the index after
+        """
+        self._data.flush()
+        if sync:
+            os.fsync(self._data.fileno())
+        self._index.write(self._pending)
+        self._index.flush()
+        if sync:
+            os.fsync(self._index.fileno())
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush with fsync and close both files."""
+        if self._data.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._data.close()
+            self._index.close()
+
+    def __enter__(self) -> 'StoryArchiveWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,416 @@
+"""
+SUBIT HTTP Service
+JSON endpoints over the standard-library HTTP server
+
+Connections are handled by lightweight I/O threads. Generation runs on a
+bounded worker pool; when every worker is busy and the request queue is
+full, new requests get 429 Too Many Requests with a Retry-After header.
+Connections are kept alive (HTTP/1.1) between requests.
+
+Endpoints:
+    GET  /health
+    POST /story            {"formula_name": "Philosopher's Stone", "seed": "x"}
+    POST /poem             {"archetype": "Steadfast", "form": "haiku"}
+    POST /story_poem       {"formula_name": "Healing", "form": "ballad"}  (one shared arc)
+    GET  /path?start=Pioneer&end=11+00+10
+    GET  /formula?name=Healing      (all formulas without a name)
+    GET  /dobre?word=di-bi-ri       (or code, bits, archetype, who/where/when)
+    POST /batch/story      {"count": 100, "args": {...}}  or  {"items": [{...}, ...]}
+    POST /batch/poem       (as /batch/story)
+
+Every single-request endpoint also accepts POST with a JSON body. Batch
+endpoints stream one JSON line per item as it completes, in request
+order, using chunked transfer encoding:
+
+    {"index": 0, "ok": true, "result": {...}}
+    {"index": 1, "ok": false, "error": "..."}
+
+Usage:
+    python src/http_service.py --port 8064 --workers 4 --queue-limit 64
+"""
+
+import gc
+import json
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# Add parent directory to path for importing base SUBIT
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.service import SUBITService, describe_error
+
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 1 << 20
+
+# Most items accepted in one batch request
+MAX_BATCH_ITEMS = 10000
+
+# Operations that may be batched
+BATCH_OPS = {"story", "poem"}
+
+# Service used by pool worker processes (inherited on fork)
+_WORKER_SERVICE: Optional[SUBITService] = None
+
+
+class Overloaded(Exception):
+    """Raised when the worker pool and its queue are full."""
+
+
+def _init_worker() -> None:
+    """Pool process initializer: build a service unless one was inherited."""
+    global _WORKER_SERVICE
+    if _WORKER_SERVICE is None:
+        _WORKER_SERVICE = SUBITService()
+        _WORKER_SERVICE.warm()
+    gc.enable()
+
+
+def _run(op: str, args: Dict[str, Any]) -> Any:
+    """Run one operation in a pool worker process."""
+    return _WORKER_SERVICE.handle(op, args)
+
+
+class GenerationPool:
+    """
+    Bounded pool running service operations.
+
+    At most `workers` operations run at once and at most `queue_limit`
+    more wait for a worker; submitting beyond that raises Overloaded.
+
+    Args:
+        service: Request dispatcher (a new SUBITService if None)
+        workers: Number of workers
+        queue_limit: Operations allowed to wait for a free worker
+        processes: Run operations in forked processes rather than threads.
+            Thread workers share the engines' RNG, so seeded results are
+            only reproducible with processes.
+    """
+
+    def __init__(
+        self,
+        service: Optional[SUBITService] = None,
+        workers: int = 4,
+        queue_limit: int = 64,
+        processes: bool = True
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_limit < 0:
+            raise ValueError("queue_limit must not be negative")
+        self.service = service or SUBITService()
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.processes = processes and hasattr(os, "fork")
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.executor = self._create_executor()
+
+    def _create_executor(self):
+        """Warm the service and create the executor."""
+        self.service.warm()
+        if not self.processes:
+            return ThreadPoolExecutor(max_workers=self.workers,
+                                      thread_name_prefix="subit-worker")
+        import multiprocessing
+        global _WORKER_SERVICE
+        # Forked workers inherit the warm service; freeze it so their
+        # collections do not touch (and copy) the shared pages
+        _WORKER_SERVICE = self.service
+        gc.freeze()
+        executor = ProcessPoolExecutor(max_workers=self.workers,
+                                       mp_context=multiprocessing.get_context("fork"),
+                                       initializer=_init_worker)
+        # Fork every worker now, before the server starts its I/O threads
+        executor.submit(os.getpid).result()
+        gc.unfreeze()
+        return executor
+
+    def submit(self, op: str, args: Dict[str, Any], block: bool = False) -> Future:
+        """
+        Queue one operation.
+
+        Args:
+            op: Operation name
+            args: Operation arguments
+            block: Wait for queue space instead of raising Overloaded
+
+        Raises:
+            Overloaded: No queue space and block is False
+        """
+        if not self._slots.acquire(blocking=block):
+            with self._lock:
+                self.rejected += 1
+            raise Overloaded(f"{self.workers + self.queue_limit} requests already queued")
+        with self._lock:
+            self.pending += 1
+        try:
+            if self.processes:
+                future = self.executor.submit(_run, op, args)
+            else:
+                future = self.executor.submit(self.service.handle, op, args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self.completed += 1
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            self.pending -= 1
+        self._slots.release()
+
+    def run(self, op: str, args: Dict[str, Any]) -> Any:
+        """
+        Run one operation and return its result.
+
+        Raises:
+            Overloaded: The pool and its queue are full
+            ValueError: Invalid operation or arguments
+        """
+        return self.submit(op, args).result()
+
+    def stream(
+        self,
+        op: str,
+        items: Iterable[Dict[str, Any]]
+    ) -> Iterator[Tuple[int, bool, Any]]:
+        """
+        Run many operations, yielding (index, ok, result or error) in order.
+
+        The first item is admitted like a single request (Overloaded if the
+        queue is full); later items wait for queue space, and no more than
+        `workers` items of one stream are in flight at a time.
+        """
+        in_flight: deque = deque()
+        for index, args in enumerate(items):
+            in_flight.append((index, self.submit(op, args, block=index > 0)))
+            if len(in_flight) >= self.workers:
+                yield _outcome(*in_flight.popleft())
+        while in_flight:
+            yield _outcome(*in_flight.popleft())
+
+    def stats(self) -> Dict[str, Any]:
+        """Report pool size and request counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "processes": self.processes,
+                "pending": self.pending,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self) -> None:
+        """Stop the workers once queued operations finish."""
+        self.executor.shutdown(wait=True)
+
+
+def _outcome(index: int, future: Future) -> Tuple[int, bool, Any]:
+    """Wait for one streamed operation and report its result or error."""
+    try:
+        return index, True, future.result()
+    except Exception as e:
+        return index, False, describe_error(e)[1]
+
+
+class SUBITRequestHandler(BaseHTTPRequestHandler):
+    """Route HTTP requests to the generation pool."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "SUBIT/1.0"
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = 30
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        self._dispatch(url.path, dict(parse_qsl(url.query)))
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        try:
+            args = self._read_json()
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._dispatch(url.path, args)
+
+    def _read_json(self) -> Any:
+        """Read and parse the request body (an empty body is {})."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise ValueError(f"Request body exceeds {MAX_BODY_BYTES} bytes")
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length))
+
+    def _dispatch(self, path: str, args: Any) -> None:
+        parts = [p for p in path.split("/") if p]
+        if parts == ["health"]:
+            self._send_json(200, {"ok": True, "pool": self.server.pool.stats()})
+        elif len(parts) == 2 and parts[0] == "batch" and parts[1] in BATCH_OPS:
+            self._batch(parts[1], args)
+        elif len(parts) == 1 and parts[0] in self.server.pool.service.handlers:
+            self._single(parts[0], args)
+        else:
+            self._send_json(404, {"error": f"Not found: {path}"})
+
+    def _single(self, op: str, args: Any) -> None:
+        try:
+            result = self.server.pool.run(op, args)
+        except Overloaded as e:
+            self._send_overloaded(e)
+            return
+        except Exception as e:
+            status, message = describe_error(e)
+            self._send_json(status, {"error": message})
+            return
+        self._send_json(200, result)
+
+    def _batch(self, op: str, body: Any) -> None:
+        try:
+            items = _batch_items(body)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        results = self.server.pool.stream(op, items)
+        try:
+            first = next(results, None)
+        except Overloaded as e:
+            self._send_overloaded(e)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            if first is not None:
+                self._write_chunk(first)
+                for outcome in results:
+                    self._write_chunk(outcome)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; queued items still finish and free their slots
+            self.close_connection = True
+
+    def _write_chunk(self, outcome: Tuple[int, bool, Any]) -> None:
+        index, ok, value = outcome
+        record = {"index": index, "ok": ok, ("result" if ok else "error"): value}
+        line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.flush()
+
+    def _send_overloaded(self, error: Overloaded) -> None:
+        self._send_json(429, {"error": f"Server overloaded: {error}"},
+                        headers={"Retry-After": "1"})
+
+    def _send_json(self, status: int, payload: Any,
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def _batch_items(body: Any) -> List[Dict[str, Any]]:
+    """Expand a batch body into one argument dict per item."""
+    if not isinstance(body, dict):
+        raise ValueError("Batch body must be an object")
+    if "items" in body:
+        items = body["items"]
+        if not isinstance(items, list):
+            raise ValueError("items must be a list")
+    else:
+        count = int(body.get("count", 1))
+        if count < 0:
+            raise ValueError("count must not be negative")
+        items = [body.get("args", {})] * min(count, MAX_BATCH_ITEMS + 1)
+    if len(items) > MAX_BATCH_ITEMS:
+        raise ValueError(f"Batch exceeds {MAX_BATCH_ITEMS} items")
+    return items
+
+
+class SUBITHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server backed by a GenerationPool.
+
+    Args:
+        address: (host, port) to listen on
+        pool: Generation pool (a new GenerationPool if None)
+        verbose: Log each request to stderr
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        pool: Optional[GenerationPool] = None,
+        verbose: bool = False
+    ):
+        self.pool = pool or GenerationPool()
+        self.verbose = verbose
+        super().__init__(address, SUBITRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SUBIT HTTP service")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8064, help="TCP port")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4,
+                        help="Number of generation workers")
+    parser.add_argument("--queue-limit", type=int, default=64,
+                        help="Requests allowed to wait for a worker before 429")
+    parser.add_argument("--threads", action="store_true",
+                        help="Use worker threads instead of processes")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    pool = GenerationPool(workers=args.workers, queue_limit=args.queue_limit,
+                          processes=not args.threads)
+    server = SUBITHTTPServer((args.host, args.port), pool, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    print(f"SUBIT HTTP service on http://{host}:{port} with {args.workers} workers",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
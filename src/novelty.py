@@ -0,0 +1,316 @@
+"""
+SUBIT Novelty Filter
+Streaming near-duplicate rejection for large story and poem runs
+
+Each text is reduced to its word n-gram shingles, and the shingles to a
+MinHash signature (one-permutation hashing with densification, so one
+hash per shingle). The signature is cut into LSH bands; a text whose
+band matches a band of any earlier text is a near-duplicate.
+
+Only band hashes are kept, in a scalable Bloom filter: no text or
+signature is stored, memory is a fixed number of bits per accepted text,
+and checking a candidate costs the same after ten texts or ten million.
+
+Usage:
+    novelty = NoveltyFilter(threshold=0.7)
+    for poem in novelty.filter(engine.generate_batch(specs), key=lambda p: p["text"]):
+        ...
+"""
+
+import math
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+_MASK64 = (1 << 64) - 1
+
+# Byte table turning everything but ASCII letters and apostrophes into spaces
+_SEPARATORS = bytes(b for b in range(256) if not (chr(b).isalpha() and b < 128 or b == ord("'")))
+_TO_SPACES = bytes.maketrans(_SEPARATORS, b" " * len(_SEPARATORS))
+
+
+def shingles(text: str, n: int = 3) -> List[int]:
+    """
+    Hash a text's word n-grams.
+
+    Words are lowercased ASCII letter runs, hashed with CRC-32 and
+    combined as int tuples (only str hashes are salted per process);
+    texts shorter than n words give a single shingle of all their words.
+
+    Args:
+        text: Any text
+        n: Words per shingle
+
+    Returns:
+        64-bit shingle hashes (with repeats), stable across processes
+    """
+    words = list(map(zlib.crc32, text.lower().encode().translate(_TO_SPACES).split()))
+    if len(words) <= n:
+        return [hash(tuple(words)) & _MASK64] if words else []
+    windows = zip(*(words[i:] for i in range(n)))
+    return [h & _MASK64 for h in map(hash, windows)]
+
+
+def minhash(hashes: Iterable[int], num_perm: int = 32) -> Tuple[int, ...]:
+    """
+    MinHash signature by one-permutation hashing.
+
+    Each hash falls into one of num_perm bins and each bin keeps its
+    minimum. Empty bins borrow from the next non-empty bin to their
+    right, offset by the distance (rotation densification), so short
+    texts still get full signatures and two texts still agree on a bin
+    with probability equal to their Jaccard similarity.
+
+    Args:
+        hashes: 64-bit shingle hashes
+        num_perm: Signature length
+
+    Returns:
+        num_perm bin minima (empty tuple for no hashes)
+    """
+    # Visiting hashes in descending order leaves each bin's minimum last
+    bins = {h % num_perm: h for h in sorted(set(hashes), reverse=True)}
+    if not bins:
+        return ()
+    signature = [bins.get(i) for i in range(num_perm)]
+    if len(bins) < num_perm:
+        # One pass right to left, wrapping around once
+        borrowed, distance = 0, 0
+        for i in range(2 * num_perm - 1, -1, -1):
+            j = i % num_perm
+            value = bins.get(j)
+            if value is not None:
+                borrowed, distance = value, 0
+            else:
+                distance += 1
+                if i < num_perm:
+                    signature[j] = borrowed + distance * _MASK64
+    return tuple(signature)
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Choose LSH (bands, rows) for a signature length and Jaccard threshold.
+
+    Picks the split whose S-curve midpoint, (1/bands) ** (1/rows), lies
+    closest to the threshold.
+
+    Raises:
+        ValueError: Threshold outside (0, 1)
+    """
+    if not 0.0 < threshold < 1.0:
+        raise ValueError("threshold must be between 0 and 1")
+    splits = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(splits, key=lambda s: abs((1.0 / s[0]) ** (1.0 / s[1]) - threshold))
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 64-bit integer items.
+
+    Positions come from double hashing the item's two 32-bit halves.
+
+    Attributes:
+        capacity: Items the filter is sized for
+        error_rate: False-positive rate at capacity
+        count: Items added
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity < 1 or not 0.0 < error_rate < 1.0:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self._probes = range(self.num_hashes)
+
+    def add(self, item: int) -> None:
+        """Add an item."""
+        bits = self.bits
+        m = self.num_bits
+        h1 = item & 0xFFFFFFFF
+        h2 = (item >> 32) | 1
+        for i in self._probes:
+            p = (h1 + i * h2) % m
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def __contains__(self, item: int) -> bool:
+        bits = self.bits
+        m = self.num_bits
+        h1 = item & 0xFFFFFFFF
+        h2 = (item >> 32) | 1
+        for i in self._probes:
+            p = (h1 + i * h2) % m
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows in slices as items arrive.
+
+    Each full slice is followed by one `growth` times larger with a
+    `tightening` times smaller error rate, so the overall false-positive
+    rate stays below error_rate however many items are added.
+
+    Attributes:
+        slices: The fixed-size filters, oldest first
+    """
+
+    def __init__(self, initial_capacity: int = 1 << 16, error_rate: float = 0.001,
+                 growth: int = 2, tightening: float = 0.5):
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        # The slice error rates form a geometric series summing to error_rate
+        self.slices = [BloomFilter(initial_capacity, error_rate * (1 - tightening))]
+
+    def add(self, item: int) -> None:
+        """Add an item, opening a new slice when the current one is full."""
+        current = self.slices[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * self.growth,
+                                  current.error_rate * self.tightening)
+            self.slices.append(current)
+        current.add(item)
+
+    def __contains__(self, item: int) -> bool:
+        return any(item in s for s in self.slices)
+
+    def __len__(self) -> int:
+        return sum(s.count for s in self.slices)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of bit storage across all slices."""
+        return sum(len(s.bits) for s in self.slices)
+
+
+class NoveltyFilter:
+    """
+    Streaming near-duplicate filter over texts.
+
+    A text is novel unless one of its LSH bands matches a band of an
+    earlier accepted text, which happens with high probability when the
+    two texts' shingle sets have Jaccard similarity above the threshold
+    (the usual LSH S-curve: rarely below it, almost always well above).
+
+    Attributes:
+        threshold: Jaccard similarity treated as a near-duplicate
+        ngram: Words per shingle
+        num_perm: MinHash signature length
+        bands: LSH bands (rows per band = num_perm // bands)
+        accepted: Texts accepted so far
+        rejected: Texts rejected so far
+    """
+
+    def __init__(self, threshold: float = 0.7, ngram: int = 8, num_perm: int = 64,
+                 capacity: int = 1 << 16, error_rate: float = 0.001):
+        """
+        Initialize the filter.
+
+        The engines build texts from small template pools, so short
+        shingles recur across unrelated texts; 8-word shingles span line
+        and sentence joins, where the variety is.
+
+        Args:
+            threshold: Jaccard similarity treated as a near-duplicate (0-1)
+            ngram: Words per shingle
+            num_perm: MinHash signature length
+            capacity: Band hashes the first Bloom slice holds before growing
+            error_rate: Overall Bloom false-positive rate
+
+        Raises:
+            ValueError: Invalid threshold or Bloom parameters
+        """
+        self.threshold = threshold
+        self.ngram = ngram
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        self.accepted = 0
+        self.rejected = 0
+        self._seen = ScalableBloomFilter(capacity, error_rate)
+
+    def _band_hashes(self, text: str) -> List[int]:
+        signature = minhash(shingles(text, self.ngram), self.num_perm)
+        rows = self.rows
+        return [hash((band,) + signature[band * rows:(band + 1) * rows]) & _MASK64
+                for band in range(self.bands)]
+
+    def is_novel(self, text: str) -> bool:
+        """Check a text without recording it."""
+        seen = self._seen
+        return not any(h in seen for h in self._band_hashes(text))
+
+    def add(self, text: str) -> bool:
+        """
+        Record a text if it is novel.
+
+        Returns:
+            True if accepted, False if rejected as a near-duplicate
+        """
+        hashes = self._band_hashes(text)
+        seen = self._seen
+        if any(h in seen for h in hashes):
+            self.rejected += 1
+            return False
+        for h in hashes:
+            seen.add(h)
+        self.accepted += 1
+        return True
+
+    def filter(self, items: Iterable[T], key: Optional[Callable[[T], str]] = None) -> Iterator[T]:
+        """
+        Yield the novel items of a stream, recording each one.
+
+        Args:
+            items: Texts, or any items with key giving their text
+            key: Text of an item (the item itself if None)
+
+        Yields:
+            Items whose text was accepted
+        """
+        for item in items:
+            if self.add(key(item) if key else item):
+                yield item
+
+    def generate(self, make: Callable[[], T], key: Optional[Callable[[T], str]] = None,
+                 max_attempts: int = 8) -> T:
+        """
+        Call make until it returns a novel item, and record it.
+
+        Args:
+            make: Generator of candidates, e.g. a bound generate_free_verse
+            key: Text of an item (the item itself if None)
+            max_attempts: Candidates tried before giving up
+
+        Returns:
+            The first novel candidate
+
+        Raises:
+            ValueError: No novel candidate within max_attempts
+        """
+        for _ in range(max_attempts):
+            item = make()
+            if self.add(key(item) if key else item):
+                return item
+        raise ValueError(f"No novel text in {max_attempts} attempts")
+
+    def stats(self) -> Dict[str, Any]:
+        """Report counters and memory use."""
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "rows": self.rows,
+            "bloom_slices": len(self._seen.slices),
+            "bloom_bytes": self._seen.nbytes
+        }
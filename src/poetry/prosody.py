@@ -0,0 +1,292 @@
+"""
+SUBIT Prosody
+Syllables, stress, meter and rhyme for the poetry engine
+
+Words are looked up in a precompiled pronunciation lexicon covering the
+engine's own vocabulary; anything else falls back to memoized spelling
+rules. Lexicon entries are stress patterns, one digit per syllable
+(1 = stressed, 0 = unstressed), so a word's syllable count is the
+length of its pattern.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict
+
+
+# Stress patterns for the engine vocabulary: every word with more than
+# one syllable, plus words the spelling rules get wrong
+PRONUNCIATIONS: Dict[str, str] = {
+    # Imagery
+    "architecture": "1010",
+    "horizon": "010",
+    "threshold": "10",
+    "sunrise": "10",
+    "sunset": "10",
+    "morning": "10",
+    "burning": "10",
+    "summer": "10",
+    "zenith": "10",
+    "city": "10",
+    "mirror": "10",
+    "silence": "10",
+    # Lexicon
+    "begin": "01",
+    "arise": "01",
+    "awaken": "010",
+    "emerge": "01",
+    "passion": "10",
+    "desire": "01",
+    "intense": "01",
+    "consume": "01",
+    "consumes": "01",
+    "structure": "10",
+    "measure": "10",
+    "order": "10",
+    "precise": "01",
+    "eternal": "010",
+    "reflect": "01",
+    # Template vocabulary
+    "again": "01",
+    "answer": "10",
+    "become": "01",
+    "beloved": "010",
+    "before": "01",
+    "beyond": "01",
+    "cannot": "10",
+    "common": "10",
+    "descend": "01",
+    "divided": "010",
+    "forget": "01",
+    "frozen": "10",
+    "gather": "10",
+    "gentle": "10",
+    "into": "10",
+    "living": "10",
+    "never": "10",
+    "nothing": "10",
+    "poem": "10",
+    "potential": "010",
+    "question": "10",
+    "remains": "01",
+    "remembers": "010",
+    "return": "01",
+    "returning": "010",
+    "teaches": "10",
+    "together": "010",
+    "unfinished": "010",
+    "united": "010",
+    "unspoken": "010",
+    "unwritten": "010",
+    "upon": "01",
+    "waiting": "10",
+    "winter": "10",
+    "without": "01",
+    "zero": "10",
+    "autumn": "10",
+    "alone": "01",
+    "only": "10",
+    "always": "10",
+    "after": "10",
+    "every": "10",
+    "evening": "10",
+    "someone": "10",
+    "something": "10",
+    "over": "10",
+    "under": "10",
+    "even": "10",
+    "carry": "10",
+    "carries": "10",
+    "ever": "10",
+    "quiet": "10",
+    "remember": "010",
+    "waking": "10",
+    "slowly": "10",
+    "beside": "01",
+    "between": "01",
+    "along": "01",
+    "across": "01",
+    "listen": "10",
+    "open": "10",
+}
+
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+_WORDS = re.compile(r"[A-Za-z']+")
+
+
+# Stress patterns of common meters, one digit per syllable
+METERS: Dict[str, str] = {
+    "iambic_trimeter": "010101",
+    "iambic_tetrameter": "01010101",
+    "iambic_pentameter": "0101010101",
+    "iambic_hexameter": "010101010101",
+}
+
+# Prefixes that push a word's stress to its second syllable
+_UNSTRESSED_PREFIXES = ("a", "be", "de", "re", "un", "for", "with", "con", "en", "pre")
+
+
+@lru_cache(maxsize=4096)
+def word_syllables(word: str) -> int:
+    """
+    Count the syllables in one word.
+
+    Args:
+        word: A single word (case and apostrophes are ignored)
+
+    Returns:
+        Number of syllables (at least 1 for any word with letters)
+    """
+    w = word.lower().replace("'", "")
+    pattern = PRONUNCIATIONS.get(w)
+    if pattern is not None:
+        return len(pattern)
+    return _rule_syllables(w)
+
+
+def _rule_syllables(word: str) -> int:
+    """Estimate syllables from spelling: vowel groups, less silent endings."""
+    if not word:
+        return 0
+    count = len(_VOWEL_GROUPS.findall(word))
+    if count > 1:
+        if word.endswith("e") and not word.endswith(("le", "ee", "ye")):
+            count -= 1
+        elif word.endswith("ed") and word[-3:-2] not in ("t", "d"):
+            count -= 1
+        elif word.endswith("es") and word[-3:-2] not in ("s", "x", "z", "c", "g", "h"):
+            count -= 1
+    return max(1, count)
+
+
+@lru_cache(maxsize=4096)
+def word_stress(word: str) -> str:
+    """
+    Get one word's stress pattern.
+
+    Monosyllables are "x" (either stress, as in English verse). Longer
+    words come from the lexicon or, failing that, stress their first
+    syllable, or their second after an unstressed prefix.
+
+    Args:
+        word: A single word
+
+    Returns:
+        One character per syllable: "1" stressed, "0" unstressed, "x" either
+    """
+    w = word.lower().replace("'", "")
+    pattern = PRONUNCIATIONS.get(w)
+    if pattern is not None:
+        return "x" if len(pattern) == 1 else pattern
+    count = _rule_syllables(w)
+    if count == 1:
+        return "x"
+    if w.startswith(_UNSTRESSED_PREFIXES) and count == 2:
+        return "01"
+    return "1" + "0" * (count - 1)
+
+
+def scan(text: str) -> str:
+    """
+    Scan a line into its stress pattern.
+
+    Args:
+        text: A line of verse
+
+    Returns:
+        Concatenated word stress patterns (see word_stress)
+    """
+    return "".join(word_stress(w) for w in _WORDS.findall(text))
+
+
+def fits_meter(pattern: str, meter: str) -> bool:
+    """
+    Check a scanned stress pattern against a meter.
+
+    Args:
+        pattern: Output of scan()
+        meter: A METERS name or a pattern of "0" and "1"
+
+    Returns:
+        True if the lengths match and every fixed stress agrees
+    """
+    target = METERS.get(meter, meter)
+    if len(pattern) != len(target):
+        return False
+    return all(p == "x" or p == t for p, t in zip(pattern, target))
+
+
+def count_syllables(text: str) -> int:
+    """
+    Count the syllables in a line of text.
+
+    Args:
+        text: Any text; punctuation is ignored
+
+    Returns:
+        Total syllables over all words
+    """
+    return sum(word_syllables(w) for w in _WORDS.findall(text))
+
+
+# Rhyme classes for words whose spelling hides their rhyme
+RHYME_OVERRIDES: Dict[str, str] = {
+    "heart": "art",
+    "again": "en",
+    "been": "in",
+    "one": "un",
+    "gone": "on",
+    "done": "un",
+    "love": "uv",
+    "move": "oov",
+    "through": "oo",
+    "you": "oo",
+    "true": "oo",
+    "me": "ee",
+    "be": "ee",
+    "we": "ee",
+    "sea": "ee",
+    "go": "ow",
+    "ago": "ow",
+    "know": "ow",
+    "height": "ite",
+    "was": "uz",
+}
+
+_VOWELS = "aeiouy"
+
+
+@lru_cache(maxsize=4096)
+def rhyme_key(word: str) -> str:
+    """
+    Get a word's rhyme class: its last vowel sound and what follows.
+
+    Words in RHYME_OVERRIDES use their listed class; others are keyed by
+    spelling from the last vowel group, keeping a silent final e
+    ("name" -> "ame", "night" -> "ight", "tree" -> "ee").
+
+    Args:
+        word: A single word
+
+    Returns:
+        Rhyme class; words with equal keys rhyme
+    """
+    w = word.lower().replace("'", "")
+    key = RHYME_OVERRIDES.get(w)
+    if key is not None:
+        return key
+    silent_e = len(w) > 2 and w.endswith("e") and w[-2] not in _VOWELS
+    core = w[:-1] if silent_e else w
+    start = len(core)
+    while start > 0 and core[start - 1] not in _VOWELS:
+        start -= 1
+    # A leading y is a consonant ("year" -> "ear")
+    while start > 0 and core[start - 1] in _VOWELS and not (start == 1 and core[0] == "y"):
+        start -= 1
+    return (core[start:] + ("e" if silent_e else "")) or w
+
+
+def line_rhyme(line: str) -> str:
+    """Get the rhyme class of a line's last word."""
+    words = _WORDS.findall(line)
+    return rhyme_key(words[-1]) if words else ""
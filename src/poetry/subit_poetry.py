@@ -11,17 +11,26 @@ to poetic voice, imagery, meter, and form.
 import random
 import sys
 import os
-from typing import Dict, List, Optional, Tuple, Any, Union
+import threading
+from collections import OrderedDict
+from itertools import product
+from string import Formatter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, IO, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 # Add parent directory to path for importing base SUBIT
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.subit import (
     WHO, WHERE, WHEN,
-    Archetype, ArchetypeCatalog,
+    Archetype, ArchetypeCatalog, NarrativeArc, PlotGenerator, seed_bytes,
     ZERO, PIONEER, CONCILIAR, CONFESSOR,
     STEADFAST, GHOST, BELOVED, COUNCIL
 )
+from src.poetry.prosody import METERS, count_syllables, fits_meter, line_rhyme, scan
+
+if TYPE_CHECKING:
+    from src.novelty import NoveltyFilter
 
 
 # ============================================================================
@@ -34,6 +43,8 @@ POETIC_VOICE = {
         "name": "Confessional",
         "voice": "First-person, intimate, personal",
         "pronoun": "I",
+        "object": "me",
+        "possessive": "my",
         "tone": "Bittersweet, vulnerable, authentic",
         "rhyme": "Irregular, internal rhymes, assonance"
     },
@@ -41,6 +52,8 @@ POETIC_VOICE = {
         "name": "Choral",
         "voice": "Plural, communal, prophetic",
         "pronoun": "we",
+        "object": "us",
+        "possessive": "our",
         "tone": "Epic, ritual, ceremonial",
         "rhyme": "Repetitive, incantatory, refrains"
     },
@@ -48,6 +61,8 @@ POETIC_VOICE = {
         "name": "Dialogic",
         "voice": "Second-person, addressing another",
         "pronoun": "you",
+        "object": "you",
+        "possessive": "your",
         "tone": "Intimate, dramatic, urgent",
         "rhyme": "Direct address, echoes, call-and-response"
     },
@@ -55,6 +70,8 @@ POETIC_VOICE = {
         "name": "Impersonal",
         "voice": "Detached, observational, oracular",
         "pronoun": "they",
+        "object": "them",
+        "possessive": "their",
         "tone": "Philosophical, cold, timeless",
         "rhyme": "Free verse, prose poetry, no rhyme"
     }
@@ -66,24 +83,28 @@ POETIC_IMAGERY = {
         "name": "Dawn",
         "images": ["dawn", "horizon", "road", "threshold", "sunrise", "first light", "morning star"],
         "lexicon": ["begin", "first", "new", "arise", "awaken", "emerge"],
+        "verb": "arise",
         "atmosphere": "Expectant, hopeful, anticipatory"
     },
     WHERE.SOUTH: {
         "name": "Fire",
         "images": ["fire", "flame", "blood", "heart", "summer", "sun at zenith", "burning"],
         "lexicon": ["burn", "passion", "desire", "intense", "consume", "blaze"],
+        "verb": "burn",
         "atmosphere": "Passionate, ardent, overwhelming"
     },
     WHERE.WEST: {
         "name": "Structure",
         "images": ["city", "walls", "books", "laws", "architecture", "sunset", "bridge"],
         "lexicon": ["build", "form", "structure", "measure", "order", "precise"],
+        "verb": "build",
         "atmosphere": "Melancholic, wise, ordered"
     },
     WHERE.NORTH: {
         "name": "Ice",
         "images": ["snow", "ice", "stars", "silence", "night", "mirror", "death"],
         "lexicon": ["cold", "still", "eternal", "reflect", "pause", "silence"],
+        "verb": "pause",
         "atmosphere": "Cold, deep, still, contemplative"
     }
 }
@@ -180,6 +201,152 @@ POETIC_FORMS = {
 }
 
 
+# Free verse refrain lines, one every FREE_VERSE_REFRAIN_EVERY lines,
+# bringing in the imagery lexicon. Slots: {image} and {word}.
+FREE_VERSE_REFRAINS = [
+    "{image} - {word}",
+    "{word}, and then {image}",
+    "{word}."
+]
+FREE_VERSE_REFRAIN_EVERY = 4
+
+
+# Short haiku line templates by WHO axis. Slots: {image} and {image2}
+# (two different images), {word} (imagery lexicon) and {season} (WHEN).
+HAIKU_TEMPLATES = {
+    WHO.ME: [
+        "I wait by the {image}",
+        "I hold the {image}",
+        "my {image}, my {season}",
+        "I carry the {image}",
+        "alone with the {image}",
+        "I remember {image}"
+    ],
+    WHO.WE: [
+        "we gather at the {image}",
+        "our {image}",
+        "together by the {image}",
+        "we carry the {image} home",
+        "all of us, the {image}"
+    ],
+    WHO.YOU: [
+        "you are the {image}",
+        "your {image} stays",
+        "for you, the {image}",
+        "you carry the {image}",
+        "listen: the {image}"
+    ],
+    WHO.THEY: [
+        "they pass the {image}",
+        "the {image} alone",
+        "someone's {image}",
+        "no one sees the {image}",
+        "the {image} is not theirs"
+    ]
+}
+
+# Haiku line templates shared by every voice
+HAIKU_COMMON_TEMPLATES = [
+    "{season} {image}",
+    "the {image} of {season}",
+    "{image} - {word}",
+    "in the {season} {image}",
+    "{image} and {image2}",
+    "under the {image}",
+    "after the {image}",
+    "a {season} of {image}",
+    "between {image} and {image2}",
+    "{word}, and then {image}"
+]
+
+
+# Sonnet line openings by WHO axis; each is completed by a rhyming ending
+SONNET_HEADS = {
+    WHO.ME: [
+        "I keep the {image}",
+        "I carry {image}",
+        "I whisper to the {image}",
+        "I walk beside the {image}",
+        "I linger by the {image}"
+    ],
+    WHO.WE: [
+        "We keep the {image}",
+        "We raise the {image}",
+        "We walk beside the {image}",
+        "Our {image} waits",
+        "We wander through the {image}"
+    ],
+    WHO.YOU: [
+        "You hold the {image}",
+        "You are the {image}",
+        "Your {image} waits",
+        "You turn toward the {image}",
+        "You wander through the {image}"
+    ],
+    WHO.THEY: [
+        "The {image} stands",
+        "They pass the {image}",
+        "The {image} is kept",
+        "No one keeps the {image}",
+        "They linger by the {image}"
+    ]
+}
+
+# Line endings for sonnets; rhyme classes are computed, not listed
+SONNET_ENDINGS = [
+    "through the endless night", "beyond all sight", "in the failing light", "and burning bright",
+    "until the break of day", "and then it slips away", "where the shadows stay", "along the way",
+    "that has no name", "and stays the same", "like a quiet flame", "when the evening came",
+    "upon the farther shore", "as it was before", "and asks for nothing more", "down to the core",
+    "without a sound", "beneath the frozen ground", "where nothing can be found", "and turning round",
+    "and leaves the world behind", "within the restless mind", "the hardest thing to find",
+    "and breaks apart", "within the heart", "before the start", "a work of art",
+    "and draws it near", "to calm the fear", "and whispers clear", "through every year",
+    "the winds that blow", "in fields of snow", "where rivers flow", "in the ember's glow",
+    "the whole day long", "a wordless song", "where we belong", "and holds on strong",
+    "with all desire", "and never tire", "the climbing spire",
+    "for all to see", "beneath the tree", "and set it free", "on bended knee",
+    "and fall like rain", "through joy and pain", "the open plain", "and still remain"
+]
+
+
+# Metrical forms: the meter of each line of a stanza, and default stanzas.
+# English elegies use elegiac couplets in accentual-syllabic form
+# (an alexandrine followed by a pentameter line).
+METRICAL_FORMS = {
+    "blank_verse": {
+        "stanza": ["iambic_pentameter"],
+        "stanzas": 12
+    },
+    "ballad": {
+        "stanza": ["iambic_tetrameter", "iambic_trimeter",
+                   "iambic_tetrameter", "iambic_trimeter"],
+        "stanzas": 4
+    },
+    "hymn": {
+        "stanza": ["iambic_tetrameter", "iambic_trimeter",
+                   "iambic_tetrameter", "iambic_trimeter"],
+        "stanzas": 3
+    },
+    "ode": {
+        "stanza": ["iambic_pentameter"] * 7 + ["iambic_trimeter"] + ["iambic_pentameter"] * 2,
+        "stanzas": 2
+    },
+    "elegy": {
+        "stanza": ["iambic_hexameter", "iambic_pentameter"],
+        "stanzas": 6
+    }
+}
+
+
+# Lines per stanza of an arc poem, when no line count is given
+ARC_STANZA_LINES = 4
+
+# Part of every poem cache key; bump whenever the same seed would
+# generate a different poem
+ENGINE_VERSION = 2
+
+
 # ============================================================================
 # 2. POETRY ENGINE CLASS
 # ============================================================================
@@ -191,19 +358,55 @@ class SUBITPoetryEngine:
     Extends the SUBIT system into verse, generating poems from archetypal states.
     """
     
-    def __init__(self, catalog: Optional[ArchetypeCatalog] = None):
+    def __init__(self,
+                 catalog: Optional[ArchetypeCatalog] = None,
+                 plot_gen: Optional[PlotGenerator] = None,
+                 cache: Optional['PoemCache'] = None):
         """
         Initialize the poetry engine.
         
         Args:
             catalog: Optional ArchetypeCatalog instance
+            plot_gen: Optional PlotGenerator for transmutation arcs (e.g. a
+                narrative engine's, so stories and poems share one)
+            cache: Optional cache for seeded generate_poem results (a
+                default-sized PoemCache if None; PoemCache(maxsize=0)
+                disables caching)
         """
         self.catalog = catalog or ArchetypeCatalog()
+        self._plot_gen = plot_gen
         self.forms = POETIC_FORMS
+        self.rng = random
+        self.cache = cache if cache is not None else PoemCache()
+
+        # Lowercase name -> archetype (built on first lookup by name)
+        self._by_name: Optional[Dict[str, Archetype]] = None
         
-        # Line templates for different archetypes
+        # Hand-written line templates for some archetypes, by lowercase name
         self.line_templates = self._initialize_templates()
-    
+
+        # Profile and line templates for all 64 archetypes (built on first use)
+        self._poetics: Optional[Dict[Archetype, 'ArchetypePoetics']] = None
+
+        # Haiku lines by archetype, then by syllable count (built on first use)
+        self._haiku_lines: Dict[Archetype, Dict[int, List[str]]] = {}
+
+        # Sonnet templates by archetype, then rhyme class, then end word
+        self._rhyme_index: Dict[Archetype, 'RhymeIndex'] = {}
+
+        # Metrical lines by archetype, then meter; the voice-and-imagery
+        # part is shared by the four archetypes with the same WHO and WHERE
+        self._meter_lines: Dict[Archetype, Dict[str, List[str]]] = {}
+        self._meter_shared: Dict[Tuple[WHO, WHERE], Dict[str, List[str]]] = {}
+
+    def warm(self) -> None:
+        """Build every lazily constructed table now (e.g. before forking)."""
+        self._get_poetics(ZERO)
+        for arch in self.catalog.all():
+            self._get_haiku_lines(arch)
+            self._get_rhyme_index(arch)
+            self._get_meter_lines(arch)
+
     def _initialize_templates(self) -> Dict[str, List[str]]:
         """Initialize line templates for different archetypes."""
         return {
@@ -265,7 +468,46 @@ class SUBITPoetryEngine:
             ]
         }
     
-    def _get_archetype_poetic_profile(self, archetype: Archetype) -> Dict[str, Any]:
+    def _resolve(self, archetype: Union[Archetype, str]) -> Archetype:
+        """
+        Resolve an archetype given by name (case-insensitive) or instance.
+
+        Raises:
+            ValueError: Unknown archetype name
+        """
+        if not isinstance(archetype, str):
+            return archetype
+        if self._by_name is None:
+            self._by_name = {arch.name.lower(): arch for arch in self.catalog.all()}
+        arch = self._by_name.get(archetype.lower())
+        if arch is None:
+            raise ValueError(f"Unknown archetype: {archetype}")
+        return arch
+
+    def _get_poetics(self, archetype: Archetype) -> 'ArchetypePoetics':
+        """Get an archetype's precompiled profile and templates."""
+        if self._poetics is None:
+            self._poetics = {
+                arch: self._compile_poetics(arch) for arch in self.catalog.all()
+            }
+        return self._poetics[archetype]
+
+    def _compile_poetics(self, arch: Archetype) -> 'ArchetypePoetics':
+        """Freeze an archetype's profile and split its line templates."""
+        profile = MappingProxyType({
+            "who": POETIC_VOICE[arch.who],
+            "where": POETIC_IMAGERY[arch.where],
+            "when": POETIC_TIME[arch.when],
+            "archetype_name": arch.name,
+            "archetype_bits": arch.bits
+        })
+        templates = tuple(
+            self.line_templates.get(arch.name.lower()) or derive_line_templates(arch)
+        )
+        segments = tuple(tuple(t.split("{image}")) for t in templates)
+        return ArchetypePoetics(profile, templates, segments)
+
+    def _get_archetype_poetic_profile(self, archetype: Archetype) -> Mapping[str, Any]:
         """
         Get complete poetic profile for an archetype.
         
@@ -273,161 +515,443 @@ class SUBITPoetryEngine:
             archetype: The archetype to profile
             
         Returns:
-            Dictionary with poetic voice, imagery, time, and form tendencies
+            Read-only mapping with poetic voice, imagery, time, and form
+            tendencies (shared, built once per archetype)
         """
-        return {
-            "who": POETIC_VOICE[archetype.who],
-            "where": POETIC_IMAGERY[archetype.where],
-            "when": POETIC_TIME[archetype.when],
-            "archetype_name": archetype.name,
-            "archetype_bits": archetype.bits
-        }
+        return self._get_poetics(archetype).profile
+    
+    def _rng(self, seed: Any) -> Any:
+        """
+        Get the RNG for one call: the engine's own if seed is None, the
+        seed itself if it is an RNG, else a new generator seeded from
+        str(seed) (so 7 and "7" give the same poem).
+        """
+        if seed is None:
+            return self.rng
+        if _is_rng(seed):
+            return seed
+        return random.Random(seed_bytes(str(seed)))
     
-    def _select_images(self, profile: Dict[str, Any], count: int = 3) -> List[str]:
-        """Select random images from the archetype's imagery cluster."""
-        images = profile["where"]["images"]
-        return random.sample(images, min(count, len(images)))
+    def _imagery_decks(self, decks: Dict[WHERE, Tuple['ImageDeck', 'ImageDeck']],
+                       where: WHERE, rng: Any) -> Tuple['ImageDeck', 'ImageDeck']:
+        """Get (dealing on first use) the image and lexicon decks for a WHERE."""
+        pair = decks.get(where)
+        if pair is None:
+            imagery = POETIC_IMAGERY[where]
+            pair = decks[where] = (ImageDeck(imagery["images"], rng),
+                                   ImageDeck(imagery["lexicon"], rng))
+        return pair
     
-    def _generate_line(self, template_key: str, image: str) -> str:
-        """Generate a line from a template."""
-        templates = self.line_templates.get(template_key, ["The {image} waits"])
-        template = random.choice(templates)
-        return template.format(image=image)
+    def _generate_line(self, archetype: Archetype, image: str, rng: Any = None) -> str:
+        """Generate a line from one of the archetype's templates."""
+        return image.join((rng or self.rng).choice(self._get_poetics(archetype).segments))
     
-    def generate_haiku(self, archetype: Union[Archetype, str]) -> str:
+    def generate_haiku(self, archetype: Union[Archetype, str], seed: Any = None) -> str:
         """
         Generate a haiku from an archetype.
         
         Args:
             archetype: Archetype instance or name
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
             
         Returns:
             Haiku as a string (3 lines)
         """
-        if isinstance(archetype, str):
-            arch = self.catalog.get_by_name(archetype)
-            if not arch:
-                raise ValueError(f"Unknown archetype: {archetype}")
-        else:
-            arch = archetype
-        
-        profile = self._get_archetype_poetic_profile(arch)
-        images = self._select_images(profile, 3)
-        
-        # Map archetype to template key
-        template_key = arch.name.lower()
-        
-        lines = []
-        for i, image in enumerate(images):
-            line = self._generate_line(template_key, image)
-            # Adjust line to approximate haiku syllable count (5-7-5)
-            # This is a simplification - real haiku generation would need syllable counting
-            lines.append(line)
-        
-        return "\n".join(lines)
+        return self._compose_haiku(self._get_haiku_lines(self._resolve(archetype)),
+                                   self._rng(seed))
+
+    def _compose_haiku(self, lines: Dict[int, List[str]], rng: Any = None) -> str:
+        """Pick one line per haiku line length, never repeating a line."""
+        # Every candidate line already has its exact syllable count
+        rng = rng or self.rng
+        counts = self.forms["haiku"]["syllables"]
+        picks = {}
+        for count in dict.fromkeys(counts):
+            pool, k = lines[count], counts.count(count)
+            picks[count] = (_pick_distinct(rng, pool, k) if len(pool) >= k
+                            else [rng.choice(pool) for _ in range(k)])
+        return "\n".join(picks[count].pop() for count in counts)
+
+    def iter_haiku(self, archetype: Union[Archetype, str], seed: Any = None) -> Iterator[str]:
+        """
+        Generate haiku from an archetype without end.
+
+        The archetype and its line index are resolved once, so each haiku
+        costs three random choices.
+
+        Args:
+            archetype: Archetype instance or name
+            seed: Optional seed for a reproducible stream (or an RNG to
+                draw from)
+
+        Yields:
+            Haiku strings (3 lines)
+        """
+        lines = self._get_haiku_lines(self._resolve(archetype))
+        rng = self._rng(seed)
+        while True:
+            yield self._compose_haiku(lines, rng)
+
+    def _get_haiku_lines(self, arch: Archetype) -> Dict[int, List[str]]:
+        """Get (building on first use) an archetype's haiku lines by syllable count."""
+        lines = self._haiku_lines.get(arch)
+        if lines is None:
+            lines = self._haiku_lines[arch] = self._build_haiku_lines(arch)
+        return lines
+
+    def _build_haiku_lines(self, arch: Archetype) -> Dict[int, List[str]]:
+        """
+        Fill every haiku template with every combination of slot values and
+        keep the lines whose syllable count is a haiku line length.
+
+        Template syllables are counted once per template and slot values
+        once per value, so each line's count is a sum, not a re-scan.
+
+        Raises:
+            ValueError: No line fits one of the haiku line lengths
+        """
+        imagery = POETIC_IMAGERY[arch.where]
+        images = [(image, count_syllables(image)) for image in imagery["images"]]
+        season = arch.when.value.lower()
+        values = {
+            "image": images,
+            "image2": images,
+            "word": [(word, count_syllables(word)) for word in imagery["lexicon"]],
+            "season": [(season, count_syllables(season))]
+        }
+        targets = set(self.forms["haiku"]["syllables"])
+        lines: Dict[int, List[str]] = {count: [] for count in targets}
+
+        templates = (
+            list(self._get_poetics(arch).templates)
+            + HAIKU_TEMPLATES[arch.who]
+            + HAIKU_COMMON_TEMPLATES
+        )
+        for template in templates:
+            fixed, fields = _split_template(template)
+            names = list(dict.fromkeys(fields))
+            for combo in product(*(values[name] for name in names)):
+                chosen = dict(zip(names, combo))
+                if "image2" in chosen and chosen["image2"] == chosen["image"]:
+                    continue
+                count = fixed + sum(chosen[name][1] for name in fields)
+                if count in lines:
+                    line = template.format(**{k: v[0] for k, v in chosen.items()})
+                    lines[count].append(line[0].upper() + line[1:])
+
+        for count, candidates in lines.items():
+            if not candidates:
+                raise ValueError(f"No {count}-syllable haiku line for {arch.name}")
+        return lines
     
-    def generate_haiku_sequence(self, archetype: Union[Archetype, str], count: int = 5) -> List[str]:
+    def generate_haiku_sequence(self, archetype: Union[Archetype, str], count: int = 5,
+                                seed: Any = None) -> List[str]:
         """
         Generate a sequence of haiku from an archetype.
         
         Args:
             archetype: Archetype instance or name
             count: Number of haiku to generate
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
             
         Returns:
             List of haiku strings
         """
-        if isinstance(archetype, str):
-            arch = self.catalog.get_by_name(archetype)
-            if not arch:
-                raise ValueError(f"Unknown archetype: {archetype}")
-        else:
-            arch = archetype
-        
-        sequence = []
-        for _ in range(count):
-            haiku = self.generate_haiku(arch)
-            sequence.append(haiku)
-        
-        return sequence
+        lines = self._get_haiku_lines(self._resolve(archetype))
+        rng = self._rng(seed)
+        return [self._compose_haiku(lines, rng) for _ in range(count)]
     
     def generate_sonnet(self, archetype: Union[Archetype, str], 
-                        rhyme_scheme: str = "shakespearean") -> str:
+                        rhyme_scheme: str = "shakespearean",
+                        seed: Any = None) -> str:
         """
         Generate a sonnet from an archetype.
         
         Args:
             archetype: Archetype instance or name
             rhyme_scheme: 'shakespearean', 'petrarchan', or 'spenserian'
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
             
         Returns:
-            Sonnet as a string (14 lines)
+            Sonnet as a string (14 lines rhyming under the scheme)
+            
+        Raises:
+            ValueError: Unknown archetype or rhyme scheme
         """
-        if isinstance(archetype, str):
-            arch = self.catalog.get_by_name(archetype)
-            if not arch:
-                raise ValueError(f"Unknown archetype: {archetype}")
-        else:
-            arch = archetype
+        arch = self._resolve(archetype)
         
-        profile = self._get_archetype_poetic_profile(arch)
-        images = self._select_images(profile, 7)  # Need enough images
+        layout = SONNET_LAYOUTS.get(rhyme_scheme)
+        if layout is None:
+            raise ValueError(f"Unknown rhyme scheme: {rhyme_scheme}")
+        letters, needs = layout
+        index = self._get_rhyme_index(arch)
         
-        template_key = arch.name.lower()
+        rng = self._rng(seed)
+        draw = ImageDeck(POETIC_IMAGERY[arch.where]["images"], rng).draw
         
-        lines = []
-        for i in range(14):
-            image = images[i % len(images)]
-            line = self._generate_line(template_key, image)
-            lines.append(line)
+        # One rhyme class per letter, then distinct end words within each class
+        classes = _pick_distinct(rng, index.eligible[max(needs.values())], len(needs))
+        queues = {}
+        for letter, rhyme in zip(needs, classes):
+            queues[letter] = [
+                rng.choice(templates).format(image=draw())
+                for templates in _pick_distinct(rng, index.classes[rhyme], needs[letter])
+            ]
         
-        # In a real implementation, we would add rhyme and meter
-        # This is a placeholder
+        return "\n".join(queues[letter].pop() for letter in letters)
+
+    def _get_rhyme_index(self, arch: Archetype) -> 'RhymeIndex':
+        """Get (building on first use) an archetype's sonnet rhyme index."""
+        index = self._rhyme_index.get(arch)
+        if index is None:
+            index = self._rhyme_index[arch] = self._build_rhyme_index(arch)
+        return index
+
+    def _build_rhyme_index(self, arch: Archetype) -> 'RhymeIndex':
+        """
+        Group an archetype's sonnet line templates by rhyme class and end word.
+
+        Candidates are the archetype's own templates and its voice's sonnet
+        openings with every ending. Templates ending in an image slot are
+        filled with each image first, since the image is what rhymes.
+
+        Raises:
+            ValueError: Too few rhyme classes for one of the schemes
+        """
+        images = POETIC_IMAGERY[arch.where]["images"]
+        templates = list(self._get_poetics(arch).templates)
+        for head in SONNET_HEADS[arch.who]:
+            templates.extend(f"{head} {ending}" for ending in SONNET_ENDINGS)
         
-        return "\n".join(lines)
+        by_class: Dict[str, Dict[str, List[str]]] = {}
+        for template in templates:
+            if template.endswith("}"):
+                filled = [template.format(image=image) for image in images]
+            else:
+                filled = [template]
+            for line in filled:
+                end_word = line.rsplit(None, 1)[-1].lower()
+                words = by_class.setdefault(line_rhyme(line), {})
+                words.setdefault(end_word, []).append(line)
+        
+        classes = {rhyme: list(words.values()) for rhyme, words in by_class.items()}
+        most = max(max(layout[1].values()) for layout in SONNET_LAYOUTS.values())
+        eligible = {
+            size: [rhyme for rhyme, words in classes.items() if len(words) >= size]
+            for size in range(1, most + 1)
+        }
+        for name, (_, needs) in SONNET_LAYOUTS.items():
+            if len(eligible[max(needs.values())]) < len(needs):
+                raise ValueError(f"Too few rhymes for a {name} sonnet of {arch.name}")
+        return RhymeIndex(classes, eligible)
     
     def generate_free_verse(self, archetype: Union[Archetype, str], 
-                            line_count: int = 12) -> str:
+                            line_count: int = 12, seed: Any = None) -> str:
         """
         Generate free verse from an archetype.
         
+        Images and lexicon words are dealt from shuffled decks, so every
+        image appears before any repeats, and every FREE_VERSE_REFRAIN_EVERY
+        lines a refrain brings in a lexicon word.
+        
         Args:
             archetype: Archetype instance or name
             line_count: Number of lines to generate
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
             
         Returns:
             Free verse poem as a string
         """
-        if isinstance(archetype, str):
-            arch = self.catalog.get_by_name(archetype)
-            if not arch:
-                raise ValueError(f"Unknown archetype: {archetype}")
-        else:
-            arch = archetype
-        
-        profile = self._get_archetype_poetic_profile(arch)
-        images = self._select_images(profile, line_count // 2)
-        
-        template_key = arch.name.lower()
+        arch = self._resolve(archetype)
+        return self._compose_free_verse(arch, line_count, self._rng(seed), {})
+    
+    def _compose_free_verse(self, arch: Archetype, line_count: int, rng: Any,
+                            decks: Dict[WHERE, Tuple['ImageDeck', 'ImageDeck']]) -> str:
+        """Write free verse drawing from decks shared with the rest of the poem."""
+        images, words = self._imagery_decks(decks, arch.where, rng)
+        draw_image, draw_word = images.draw, words.draw
+        segments = self._get_poetics(arch).segments
+        choice = rng.choice
         
         lines = []
-        for i in range(line_count):
-            image = random.choice(images)
-            line = self._generate_line(template_key, image)
-            lines.append(line)
+        for i in range(1, line_count + 1):
+            if i % FREE_VERSE_REFRAIN_EVERY:
+                lines.append(draw_image().join(choice(segments)))
+            else:
+                line = choice(FREE_VERSE_REFRAINS).format(image=draw_image(), word=draw_word())
+                lines.append(line[0].upper() + line[1:])
         
         return "\n".join(lines)
     
+    def generate_blank_verse(self, archetype: Union[Archetype, str],
+                             line_count: int = 12, seed: Any = None) -> str:
+        """
+        Generate blank verse (unrhymed iambic pentameter).
+
+        Args:
+            archetype: Archetype instance or name
+            line_count: Number of lines
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
+
+        Returns:
+            Poem as a string
+        """
+        return self._generate_metered(self._resolve(archetype), "blank_verse", line_count,
+                                     self._rng(seed))
+
+    def generate_ballad(self, archetype: Union[Archetype, str], stanzas: int = 4,
+                        seed: Any = None) -> str:
+        """
+        Generate a ballad: quatrains alternating four and three stresses.
+
+        Args:
+            archetype: Archetype instance or name
+            stanzas: Number of quatrains
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
+
+        Returns:
+            Poem as a string, stanzas separated by blank lines
+        """
+        return self._generate_metered(self._resolve(archetype), "ballad", stanzas,
+                                     self._rng(seed))
+
+    def generate_hymn(self, archetype: Union[Archetype, str], stanzas: int = 3,
+                      seed: Any = None) -> str:
+        """
+        Generate a hymn in common meter (8.6.8.6).
+
+        Args:
+            archetype: Archetype instance or name
+            stanzas: Number of quatrains
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
+
+        Returns:
+            Poem as a string, stanzas separated by blank lines
+        """
+        return self._generate_metered(self._resolve(archetype), "hymn", stanzas,
+                                     self._rng(seed))
+
+    def generate_ode(self, archetype: Union[Archetype, str], stanzas: int = 2,
+                     seed: Any = None) -> str:
+        """
+        Generate an ode in ten-line stanzas of pentameter with a short eighth line.
+
+        Args:
+            archetype: Archetype instance or name
+            stanzas: Number of stanzas
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
+
+        Returns:
+            Poem as a string, stanzas separated by blank lines
+        """
+        return self._generate_metered(self._resolve(archetype), "ode", stanzas,
+                                     self._rng(seed))
+
+    def generate_elegy(self, archetype: Union[Archetype, str], couplets: int = 6,
+                       seed: Any = None) -> str:
+        """
+        Generate an elegy in elegiac couplets (hexameter, then pentameter).
+
+        Args:
+            archetype: Archetype instance or name
+            couplets: Number of couplets
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
+
+        Returns:
+            Poem as a string, couplets separated by blank lines
+        """
+        return self._generate_metered(self._resolve(archetype), "elegy", couplets,
+                                     self._rng(seed))
+
+    def _generate_metered(self, arch: Archetype, form: str, stanzas: int,
+                          rng: Any = None) -> str:
+        """Fill each line of each stanza with a line already scanned to fit its meter."""
+        lines = self._get_meter_lines(arch)
+        layout = [lines[meter] for meter in METRICAL_FORMS[form]["stanza"]]
+        choice = (rng or self.rng).choice
+        text = ["\n".join(choice(candidates) for candidates in layout) for _ in range(stanzas)]
+        return ("\n" if len(layout) == 1 else "\n\n").join(text)
+
+    def _get_meter_lines(self, arch: Archetype) -> Dict[str, List[str]]:
+        """
+        Get (building on first use) an archetype's lines by meter.
+
+        Raises:
+            ValueError: No line fits one of the meters
+        """
+        lines = self._meter_lines.get(arch)
+        if lines is None:
+            shared = self._meter_shared.get((arch.who, arch.where))
+            if shared is None:
+                shared = self._meter_shared[arch.who, arch.where] = \
+                    self._build_shared_meter_lines(arch.who, arch.where)
+            own = self._build_meter_lines(arch)
+            lines = {meter: shared[meter] + own[meter] for meter in METERS}
+            for meter, candidates in lines.items():
+                if not candidates:
+                    raise ValueError(f"No {meter} line for {arch.name}")
+            self._meter_lines[arch] = lines
+        return lines
+
+    def _build_shared_meter_lines(self, who: WHO, where: WHERE) -> Dict[str, List[str]]:
+        """
+        Scan the voice's sonnet openings (alone and with each ending) and
+        the endings alone, keeping lines that fit a meter.
+
+        Openings, images and endings are scanned once each; a line's
+        pattern is the concatenation of its parts' patterns.
+        """
+        fitter = _MeterFitter()
+        images = [(image, scan(image)) for image in POETIC_IMAGERY[where]["images"]]
+        endings = [(ending, scan(ending)) for ending in SONNET_ENDINGS]
+        for ending, pattern in endings:
+            fitter.add(ending[0].upper() + ending[1:], pattern)
+        for head in SONNET_HEADS[who]:
+            before, after = head.split("{image}")
+            head_before, head_after = scan(before), scan(after)
+            for image, image_pattern in images:
+                line = before + image + after
+                pattern = head_before + image_pattern + head_after
+                fitter.add(line, pattern)
+                for ending, ending_pattern in endings:
+                    fitter.add(f"{line} {ending}", pattern + ending_pattern)
+        return fitter.lines
+
+    def _build_meter_lines(self, arch: Archetype) -> Dict[str, List[str]]:
+        """Scan the archetype's own templates with each image, keeping lines that fit a meter."""
+        fitter = _MeterFitter()
+        images = [(image, scan(image)) for image in POETIC_IMAGERY[arch.where]["images"]]
+        for segments in self._get_poetics(arch).segments:
+            patterns = [scan(segment) for segment in segments]
+            for image, image_pattern in images:
+                fitter.add(image.join(segments), image_pattern.join(patterns))
+        return fitter.lines
+
     def generate_poem(self, 
                       archetype: Union[Archetype, str],
                       form: str = "free_verse",
                       mood: Optional[str] = None,
                       key_images: Optional[List[str]] = None,
                       line_count: Optional[int] = None,
-                      title: Optional[str] = None) -> Dict[str, Any]:
+                      title: Optional[str] = None,
+                      rhyme_scheme: Optional[str] = None,
+                      seed: Any = None) -> Dict[str, Any]:
         """
         Generate a complete poem with metadata.
         
+        Seeded poems are cached (see PoemCache) under the archetype, form,
+        rhyme scheme, line count, seed and ENGINE_VERSION; mood, key_images
+        and title only change the returned metadata, so they share entries.
+        
         Args:
             archetype: Archetype instance or name
             form: Poetic form ('haiku', 'sonnet', 'free_verse', 'blank_verse', etc.)
@@ -435,38 +959,43 @@ class SUBITPoetryEngine:
             key_images: Optional list of images to include
             line_count: Optional line count override
             title: Optional title override
+            rhyme_scheme: Sonnet rhyme scheme (default 'shakespearean')
+            seed: Optional seed for a reproducible (and cached) poem, also
+                recorded in the metadata; an RNG (random.Random or the
+                random module) is drawn from instead, uncached
             
         Returns:
             Dictionary with poem text and metadata
         """
-        if isinstance(archetype, str):
-            arch = self.catalog.get_by_name(archetype)
-            if not arch:
-                raise ValueError(f"Unknown archetype: {archetype}")
-        else:
-            arch = archetype
+        arch = self._resolve(archetype)
         
-        # Select form
+        # Select form, keeping only the options it uses
         if form not in self.forms:
             form = "free_verse"
+        if form == "sonnet":
+            rhyme_scheme = rhyme_scheme or "shakespearean"
+        else:
+            rhyme_scheme = None
+        if form in ("haiku", "haiku_sequence", "sonnet"):
+            line_count = None
+        elif form not in METRICAL_FORMS:
+            line_count = line_count or 12
         
         form_info = self.forms[form]
         
-        # Generate poem based on form
-        if form == "haiku":
-            text = self.generate_haiku(arch)
-        elif form == "haiku_sequence":
-            poems = self.generate_haiku_sequence(arch, count=5)
-            text = "\n\n".join(poems)
-        elif form == "sonnet":
-            text = self.generate_sonnet(arch)
-        else:  # free_verse or other
-            lc = line_count or 12
-            text = self.generate_free_verse(arch, lc)
+        if seed is None or _is_rng(seed):
+            text, default_title = self._compose_poem(arch, form, line_count, rhyme_scheme,
+                                                     self._rng(seed))
+        else:
+            key = (arch.int_value, form, rhyme_scheme, line_count, str(seed), ENGINE_VERSION)
+            entry = self.cache.get(key)
+            if entry is None:
+                entry = self._compose_poem(arch, form, line_count, rhyme_scheme,
+                                           self._rng(seed))
+                self.cache.put(key, entry)
+            text, default_title = entry
         
-        # Generate title if not provided
-        if not title:
-            title = self._generate_title(arch, form)
+        title = title or default_title
         
         # Build metadata
         profile = self._get_archetype_poetic_profile(arch)
@@ -482,6 +1011,12 @@ class SUBITPoetryEngine:
             "mood": mood or profile["where"]["atmosphere"],
             "key_images": key_images or profile["where"]["images"][:3]
         }
+        if form == "sonnet":
+            metadata["rhyme_scheme"] = rhyme_scheme
+        if form in METRICAL_FORMS:
+            metadata["meter"] = form_info["meter"]
+        if seed is not None and not _is_rng(seed):
+            metadata["seed"] = seed
         
         return {
             "title": title,
@@ -489,43 +1024,552 @@ class SUBITPoetryEngine:
             "metadata": metadata
         }
     
-    def _generate_title(self, archetype: Archetype, form: str) -> str:
+    def _compose_poem(self, arch: Archetype, form: str, line_count: Optional[int],
+                      rhyme_scheme: Optional[str], rng: Any) -> Tuple[str, str]:
+        """Generate a poem's text and default title (always drawn, after the text)."""
+        if form == "haiku":
+            text = self.generate_haiku(arch, seed=rng)
+        elif form == "haiku_sequence":
+            poems = self.generate_haiku_sequence(arch, count=5, seed=rng)
+            text = "\n\n".join(poems)
+        elif form == "sonnet":
+            text = self.generate_sonnet(arch, rhyme_scheme, seed=rng)
+        elif form in METRICAL_FORMS:
+            stanza = len(METRICAL_FORMS[form]["stanza"])
+            if line_count:
+                stanzas = -(-line_count // stanza)
+            else:
+                stanzas = METRICAL_FORMS[form]["stanzas"]
+            text = self._generate_metered(arch, form, stanzas, rng)
+        else:  # free_verse or other
+            text = self.generate_free_verse(arch, line_count, seed=rng)
+        return text, self._generate_title(arch, form, rng)
+    
+    def generate_batch(self,
+                       specs: Iterable[Union[Tuple, Dict[str, Any]]],
+                       processes: Optional[int] = None,
+                       chunksize: int = 32) -> Iterator[Dict[str, Any]]:
+        """
+        Generate many poems, in order, across a process pool.
+        
+        Each spec is an (archetype, form, seed) tuple (form and seed
+        optional) or a dict of generate_poem arguments plus an optional
+        "seed". Archetype names are resolved once per distinct name, before
+        any work is sent out. Seeded specs are reproducible.
+        
+        Args:
+            specs: Poem specifications
+            processes: Worker processes (CPU count if None; 0 or 1 runs
+                in this process)
+            chunksize: Specs sent to a worker at a time
+            
+        Yields:
+            Poem dictionaries as from generate_poem, with the seed (if any)
+            in the metadata
+            
+        Raises:
+            ValueError: Unknown archetype in a spec
+        """
+        jobs = self._resolve_specs(specs)
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes <= 1 or not hasattr(os, "fork"):
+            for job in jobs:
+                yield _run_poem_job(self, job)
+            return
+        
+        import multiprocessing
+        global _BATCH_ENGINE
+        # Forked workers inherit this engine, warm, with its templates
+        self.warm()
+        _BATCH_ENGINE = self
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            yield from pool.imap(_run_batch_job, jobs, chunksize)
+    
+    def _resolve_specs(self, specs: Iterable[Union[Tuple, Dict[str, Any]]]) -> List[Tuple]:
+        """Turn specs into picklable (archetype int, kwargs, seed) jobs."""
+        codes: Dict[Any, int] = {}
+        jobs = []
+        for spec in specs:
+            if isinstance(spec, dict):
+                kwargs = dict(spec)
+                archetype = kwargs.pop("archetype")
+                seed = kwargs.pop("seed", None)
+            else:
+                archetype, form, seed = (tuple(spec) + ("free_verse", None))[:3]
+                kwargs = {"form": form}
+            key = archetype if isinstance(archetype, str) else archetype.int_value
+            code = codes.get(key)
+            if code is None:
+                code = codes[key] = self._resolve(archetype).int_value
+            jobs.append((code, kwargs, seed))
+        return jobs
+    
+    def write_batch(self,
+                    specs: Iterable[Union[Tuple, Dict[str, Any]]],
+                    out: Union[str, IO[str]],
+                    processes: Optional[int] = None,
+                    chunksize: int = 32,
+                    novelty: Optional['NoveltyFilter'] = None) -> int:
+        """
+        Generate many poems and write them as JSON lines, one per poem.
+        
+        Args:
+            specs: Poem specifications (as for generate_batch)
+            out: Output file path or text file object
+            processes: Worker processes (as for generate_batch)
+            chunksize: Specs sent to a worker at a time
+            novelty: Optional NoveltyFilter; near-duplicates of poems
+                already written (in this or earlier calls) are skipped
+            
+        Returns:
+            Number of poems written
+        """
+        import json
+        
+        if isinstance(out, str):
+            with open(out, "w", encoding="utf-8") as f:
+                return self.write_batch(specs, f, processes, chunksize, novelty)
+        
+        poems = self.generate_batch(specs, processes, chunksize)
+        if novelty is not None:
+            poems = novelty.filter(poems, key=_poem_text)
+        
+        count = 0
+        buffer = []
+        for poem in poems:
+            buffer.append(json.dumps(poem, ensure_ascii=False))
+            count += 1
+            if len(buffer) >= chunksize:
+                out.write("\n".join(buffer) + "\n")
+                buffer.clear()
+        if buffer:
+            out.write("\n".join(buffer) + "\n")
+        return count
+    
+    def _generate_title(self, archetype: Archetype, form: str, rng: Any = None) -> str:
         """Generate a title for a poem."""
+        rng = rng or self.rng
         templates = [
             f"{archetype.name} {form.title()}",
             f"The {archetype.name}'s {form.title()}",
             f"{form.title()} of the {archetype.name}",
-            f"{random.choice(['Song', 'Ode', 'Hymn', 'Lament'])} of the {archetype.name}",
-            f"{random.choice(['Winter', 'Summer', 'Spring', 'Autumn'])} {archetype.name}"
+            f"{rng.choice(['Song', 'Ode', 'Hymn', 'Lament'])} of the {archetype.name}",
+            f"{rng.choice(['Winter', 'Summer', 'Spring', 'Autumn'])} {archetype.name}"
         ]
-        return random.choice(templates)
+        return rng.choice(templates)
+    
+    def generate_from_arc(self,
+                          arc: NarrativeArc,
+                          form: str = "free_verse",
+                          mood: Optional[str] = None,
+                          key_images: Optional[List[str]] = None,
+                          line_count: Optional[int] = None,
+                          title: Optional[str] = None,
+                          rhyme_scheme: Optional[str] = None,
+                          seed: Any = None) -> Dict[str, Any]:
+        """
+        Generate a multi-stanza poem following a narrative arc, one stanza
+        per state of the protagonist.
+        
+        The arc is only read, so the same arc can be rendered as a story
+        (SUBITNarrativeEngine.generate_story(arc=arc)) without being
+        generated again.
+        
+        Args:
+            arc: Narrative arc, e.g. a Story's arc
+            form: Stanza form ('haiku', 'sonnet', 'free_verse', 'ballad', etc.)
+            mood: Optional mood override
+            key_images: Optional list of images to include
+            line_count: Optional lines per stanza
+            title: Optional title override
+            rhyme_scheme: Sonnet rhyme scheme (default 'shakespearean')
+            seed: Optional seed for a reproducible result (or an RNG to
+                draw from)
+            
+        Returns:
+            Dictionary with poem text and metadata
+        """
+        if form not in self.forms:
+            form = "free_verse"
+        if form == "sonnet":
+            rhyme_scheme = rhyme_scheme or "shakespearean"
+        rng = self._rng(seed)
+        
+        states = arc.states
+        # Free verse stanzas share decks, so images spread over the poem
+        decks: Dict[WHERE, Tuple[ImageDeck, ImageDeck]] = {}
+        text = "\n\n".join(
+            self._generate_stanza(state, form, line_count, rhyme_scheme, rng, decks)
+            for state in states
+        )
+        
+        if not title:
+            title = self._generate_arc_title(arc, rng)
+        
+        final = arc.final_state
+        profile = self._get_archetype_poetic_profile(final)
+        
+        metadata = {
+            "title": title,
+            "form": form,
+            "archetype": final.name,
+            "archetype_bits": final.bits,
+            "protagonist": arc.protagonist.name,
+            "states": [{"bits": s.bits, "name": s.name} for s in states],
+            "stanzas": len(states),
+            "mood": mood or profile["where"]["atmosphere"],
+            "key_images": key_images or profile["where"]["images"][:3]
+        }
+        if form == "sonnet":
+            metadata["rhyme_scheme"] = rhyme_scheme
+        if form in METRICAL_FORMS:
+            metadata["meter"] = self.forms[form]["meter"]
+        
+        return {
+            "title": title,
+            "text": text,
+            "metadata": metadata
+        }
+    
+    def _generate_stanza(self, arch: Archetype, form: str,
+                         line_count: Optional[int],
+                         rhyme_scheme: Optional[str], rng: Any,
+                         decks: Dict[WHERE, Tuple['ImageDeck', 'ImageDeck']]) -> str:
+        """Generate one arc stanza for a state in the given form."""
+        if form in ("haiku", "haiku_sequence"):
+            return self.generate_haiku(arch, seed=rng)
+        if form == "sonnet":
+            return self.generate_sonnet(arch, rhyme_scheme, seed=rng)
+        lines = line_count or ARC_STANZA_LINES
+        if form in METRICAL_FORMS:
+            stanza = len(METRICAL_FORMS[form]["stanza"])
+            return self._generate_metered(arch, form, -(-lines // stanza), rng)
+        return self._compose_free_verse(arch, lines, rng, decks)
+    
+    def _generate_arc_title(self, arc: NarrativeArc, rng: Any = None) -> str:
+        """Generate a title for an arc poem."""
+        templates = [
+            f"From {arc.initial_state.name} to {arc.final_state.name}",
+            f"{arc.protagonist.name}, Becoming {arc.final_state.name}",
+            f"The {arc.final_state.name}'s Passage",
+            f"Songs of the {arc.initial_state.name}"
+        ]
+        return (rng or self.rng).choice(templates)
+    
+    def _get_plot_generator(self) -> PlotGenerator:
+        """Get (building on first use) the plot generator for transmutation arcs."""
+        if self._plot_gen is None:
+            from src.subit import CharacterGenerator, WorldGenerator, TransmutationCatalog
+            
+            self._plot_gen = PlotGenerator(
+                CharacterGenerator(self.catalog),
+                WorldGenerator(self.catalog),
+                TransmutationCatalog()
+            )
+        return self._plot_gen
     
     def generate_from_transmutation(self,
                                     formula_name: str,
                                     form: str = "free_verse",
+                                    protagonist_name: Optional[str] = None,
                                     **kwargs) -> Dict[str, Any]:
         """
         Generate a poem based on a transmutation formula.
         
+        Stanzas follow the formula's arc: the initial state, the state
+        after the impulse, and the result after the catalyst. A seed
+        (in kwargs) fixes the verse; the protagonist and arc events come
+        from the plot generator, so pass protagonist_name as well for a
+        fully reproducible result.
+        
         Args:
             formula_name: Name of the transmutation formula
             form: Poetic form
-            **kwargs: Additional arguments for generate_poem
+            protagonist_name: Optional name for the arc's protagonist
+            **kwargs: Additional arguments for generate_from_arc (including seed)
             
         Returns:
             Dictionary with poem and metadata
+            
+        Raises:
+            ValueError: Unknown formula
         """
-        # This would use the transmutation catalog
-        # For now, just use the result archetype
-        from src.subit import TransmutationCatalog
-        
-        catalog = TransmutationCatalog()
-        formula = catalog.find_by_name(formula_name)
+        plot_gen = self._get_plot_generator()
+        formula = plot_gen.transmutations.find_by_name(formula_name)
         
         if not formula:
             raise ValueError(f"Unknown formula: {formula_name}")
         
-        return self.generate_poem(formula.result, form, **kwargs)
+        arc = plot_gen.arc_from_formula(formula, protagonist_name)
+        poem = self.generate_from_arc(arc, form, **kwargs)
+        poem["metadata"]["formula"] = formula.name
+        return poem
+
+
+def _poem_text(poem: Dict[str, Any]) -> str:
+    """Text of a generated poem dictionary."""
+    return poem["text"]
+
+
+def _is_rng(seed: Any) -> bool:
+    """Check whether a seed argument is an RNG to draw from (e.g. random.Random)."""
+    return hasattr(seed, "choice") and hasattr(seed, "random")
+
+
+# Engine used by batch worker processes (inherited on fork)
+_BATCH_ENGINE: Optional[SUBITPoetryEngine] = None
+
+
+def _run_batch_job(job: Tuple) -> Dict[str, Any]:
+    """Run one batch job in a worker process."""
+    return _run_poem_job(_BATCH_ENGINE, job)
+
+
+def _run_poem_job(engine: SUBITPoetryEngine, job: Tuple) -> Dict[str, Any]:
+    """Generate one poem from an (archetype int, kwargs, seed) job."""
+    code, kwargs, seed = job
+    return engine.generate_poem(Archetype.from_int(code), seed=seed, **kwargs)
+
+
+class PoemCache:
+    """
+    Thread-safe least-recently-used cache of seeded poems.
+    
+    Entries are (text, default title) pairs. The cache is bounded both by
+    entry count and by total characters stored; passing either bound
+    evicts the least recently used poems. One cache may be shared by
+    several engines.
+    
+    Attributes:
+        maxsize: Most poems kept (0 disables caching)
+        max_chars: Most characters of text and titles kept
+        hits: Lookups answered from the cache
+        misses: Lookups that had to generate
+        evictions: Poems dropped to respect the bounds
+    """
+    
+    def __init__(self, maxsize: int = 4096, max_chars: int = 4_000_000):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple, Tuple[str, str]]' = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Tuple) -> Optional[Tuple[str, str]]:
+        """Look up a poem, marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, key: Tuple, entry: Tuple[str, str]) -> None:
+        """Store a poem, evicting older ones past either bound."""
+        size = len(entry[0]) + len(entry[1])
+        if self.maxsize <= 0 or size > self.max_chars:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._chars -= len(old[0]) + len(old[1])
+            self._entries[key] = entry
+            self._chars += size
+            while len(self._entries) > self.maxsize or self._chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted[0]) + len(evicted[1])
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every poem and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+            self.hits = self.misses = self.evictions = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Report size, bounds, counters and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "chars": self._chars,
+                "max_chars": self.max_chars,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+class _MeterFitter:
+    """Collect candidate lines under the meter their stress pattern fits."""
+
+    # Each meter has its own syllable count
+    BY_LENGTH = {len(pattern): meter for meter, pattern in METERS.items()}
+
+    def __init__(self):
+        self.lines: Dict[str, List[str]] = {meter: [] for meter in METERS}
+
+    def add(self, line: str, pattern: str) -> None:
+        meter = self.BY_LENGTH.get(len(pattern))
+        if meter is not None and fits_meter(pattern, meter):
+            self.lines[meter].append(line)
+
+
+class ArchetypePoetics:
+    """
+    Precompiled poetic data for one archetype.
+
+    Attributes:
+        profile: Read-only poetic profile
+        templates: Line templates with {image} slots
+        segments: Each template split at its {image} slots, so a line is
+            image.join(segments)
+    """
+
+    __slots__ = ("profile", "templates", "segments")
+
+    def __init__(self, profile: Mapping[str, Any], templates: Tuple[str, ...],
+                 segments: Tuple[Tuple[str, ...], ...]):
+        self.profile = profile
+        self.templates = templates
+        self.segments = segments
+
+
+def derive_line_templates(archetype: Archetype) -> List[str]:
+    """
+    Derive line templates for an archetype from its three axes.
+
+    Used for archetypes without a hand-written template set: the voice
+    supplies the pronouns, the imagery its verb and atmosphere, the time
+    its name.
+
+    Args:
+        archetype: The archetype to write templates for
+
+    Returns:
+        Five templates, each with an {image} slot
+    """
+    voice = POETIC_VOICE[archetype.who]
+    imagery = POETIC_IMAGERY[archetype.where]
+    subject = voice["pronoun"].capitalize()
+    possessive = voice["possessive"].capitalize()
+    verb = imagery["verb"]
+    mood = imagery["atmosphere"].split(",")[0].lower()
+    time = POETIC_TIME[archetype.when]["name"].lower()
+    return [
+        f"{subject} {verb} with the {{image}}",
+        f"The {{image}} {verb}s for {voice['object']}",
+        f"{subject} {verb} in the {time} of the {{image}}",
+        f"{possessive} {{image}}, {mood} in the {time}",
+        f"In the {time}, the {{image}} {verb}s"
+    ]
+
+
+class RhymeIndex:
+    """
+    Sonnet line templates grouped for rhyming.
+
+    Attributes:
+        classes: Rhyme class -> one list of templates per distinct end word
+        eligible: n -> rhyme classes with at least n distinct end words
+    """
+
+    __slots__ = ("classes", "eligible")
+
+    def __init__(self, classes: Dict[str, List[List[str]]], eligible: Dict[int, List[str]]):
+        self.classes = classes
+        self.eligible = eligible
+
+
+class ImageDeck:
+    """
+    A shuffled deck of images (or words), dealt one card at a time.
+
+    Every card is dealt once before any is dealt again, and a card is
+    never dealt twice in a row across a reshuffle. Each draw finishes one
+    step of an in-place Fisher-Yates shuffle, so it is O(1) with no list
+    rebuilt.
+    """
+
+    def __init__(self, cards: Iterable[str], rng: Any = random):
+        self.cards = list(cards)
+        if not self.cards:
+            raise ValueError("ImageDeck needs at least one card")
+        self._random = rng.random
+        self._size = len(self.cards)
+        self._next = 0
+
+    def draw(self) -> str:
+        """Deal the next card."""
+        i = self._next
+        if i == self._size:
+            # Reshuffle: the card dealt last (at the end) can't come first
+            i, skip = 0, self._size > 1
+        else:
+            skip = False
+        cards = self.cards
+        j = i + int(self._random() * (self._size - i - skip))
+        cards[i], cards[j] = cards[j], cards[i]
+        self._next = i + 1
+        return cards[i]
+
+
+def _pick_distinct(rng: Any, items: List[Any], k: int) -> List[Any]:
+    """
+    Pick k distinct items uniformly (Floyd's algorithm).
+
+    Cheaper than random.sample for the handful of picks a sonnet needs.
+    """
+    n = len(items)
+    picked: List[int] = []
+    for j in range(n - k, n):
+        t = int(rng.random() * (j + 1))
+        picked.append(j if t in picked else t)
+    return [items[i] for i in picked]
+
+
+def _scheme_layout(scheme: str) -> Tuple[str, Dict[str, int]]:
+    """Turn "abab cdcd efef gg" into ("ababcdcdefefgg", {"a": 2, ...})."""
+    letters = scheme.replace(" ", "")
+    needs: Dict[str, int] = {}
+    for letter in letters:
+        needs[letter] = needs.get(letter, 0) + 1
+    return letters, needs
+
+
+# Line order and lines per rhyme for each sonnet scheme
+SONNET_LAYOUTS = {
+    name: _scheme_layout(scheme)
+    for name, scheme in POETIC_FORMS["sonnet"]["rhyme_schemes"].items()
+}
+
+
+def _split_template(template: str) -> Tuple[int, List[str]]:
+    """
+    Split a line template into its fixed syllable count and slot names.
+
+    Returns:
+        (syllables outside the slots, slot names in order, repeats included)
+    """
+    fixed = []
+    fields = []
+    for literal, field, _, _ in Formatter().parse(template):
+        fixed.append(literal)
+        if field is not None:
+            fields.append(field)
+    return count_syllables(" ".join(fixed)), fields
 
 
 # ============================================================================
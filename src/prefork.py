@@ -0,0 +1,286 @@
+"""
+SUBIT Pre-fork Server
+Worker processes forked from a warm, frozen parent
+
+The parent builds every catalog and table once, calls gc.freeze() and
+forks workers that share those pages copy-on-write. Workers accept
+connections on one local socket and answer newline-delimited JSON:
+
+    {"op": "story", "args": {"formula_name": "Philosopher's Stone"}}
+    {"op": "poem", "args": {"archetype": "Steadfast", "form": "haiku"}}
+    {"op": "stats"}
+
+Each request gets one JSON line back: {"ok": true, "result": ...} or
+{"ok": false, "error": "..."}. A connection may carry many requests.
+
+Usage:
+    python src/prefork.py --socket /tmp/subit.sock --workers 4
+"""
+
+import gc
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Any, List, Optional, Tuple, Union
+
+# Add parent directory to path for importing base SUBIT
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.service import SUBITService, describe_error
+
+
+Address = Union[str, Tuple[str, int]]
+
+# Longest request line accepted, in bytes
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def _error_line(message: str) -> bytes:
+    """A response line reporting a failed request."""
+    return json.dumps({"ok": False, "error": message}, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class PreforkServer:
+    """
+    Pre-fork server for story and poetry requests.
+
+    Args:
+        address: Unix socket path, or (host, port) for TCP
+        workers: Number of worker processes
+        service: Request dispatcher (a new SUBITService if None)
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        workers: int = 4,
+        service: Optional[SUBITService] = None,
+        backlog: int = 128
+    ):
+        self.address = address
+        self.workers = workers
+        self.backlog = backlog
+        self.service = service or SUBITService()
+        self.sock: Optional[socket.socket] = None
+        self.pids: List[int] = []
+        self.requests = 0
+
+    def start(self) -> None:
+        """Warm the service, bind the socket, freeze the heap and fork workers."""
+        # No collections while warming: freed holes would be dirtied later
+        gc.disable()
+        self.service.warm()
+        self.sock = self._bind()
+        gc.freeze()
+        for _ in range(self.workers):
+            self._spawn()
+        gc.enable()
+
+    def serve_forever(self) -> None:
+        """Start, then respawn workers that exit until SIGTERM or SIGINT."""
+        signal.signal(signal.SIGTERM, _raise_exit)
+        self.start()
+        try:
+            while True:
+                try:
+                    pid, _ = os.wait()
+                except ChildProcessError:
+                    break
+                if pid in self.pids:
+                    self.pids.remove(pid)
+                    self._spawn()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop all workers and remove the socket."""
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.pids = []
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def _bind(self) -> socket.socket:
+        """Create the listening socket shared by all workers."""
+        if isinstance(self.address, str):
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(self.address)
+        sock.listen(self.backlog)
+        return sock
+
+    def _spawn(self) -> None:
+        """Fork one worker."""
+        pid = os.fork()
+        if pid:
+            self.pids.append(pid)
+            return
+        # Child: never return into the parent's control flow
+        code = 0
+        try:
+            self._worker()
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+
+    def _worker(self) -> None:
+        """Accept and serve connections until terminated."""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        self.pids = []
+        gc.enable()
+        while True:
+            conn, _ = self.sock.accept()
+            with conn:
+                self._serve_connection(conn)
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        """Answer every request line on one connection."""
+        stream = conn.makefile("rwb")
+        try:
+            while True:
+                line = stream.readline(MAX_REQUEST_BYTES)
+                if not line:
+                    break
+                if len(line) >= MAX_REQUEST_BYTES and not line.endswith(b"\n"):
+                    # The rest of the line would be read as another request
+                    # and every later reply would be one behind, so give up
+                    # on the connection
+                    stream.write(_error_line(f"Request exceeds {MAX_REQUEST_BYTES} bytes"))
+                    stream.flush()
+                    break
+                if not line.strip():
+                    continue
+                stream.write(self._respond(line))
+                stream.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            stream.close()
+
+    def _respond(self, line: bytes) -> bytes:
+        """Turn one request line into one response line."""
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            op = request.get("op")
+            if op == "stats":
+                result = self.stats()
+            else:
+                result = self.service.handle(op, request.get("args"))
+            response = {"ok": True, "result": result}
+        except Exception as e:
+            return _error_line(describe_error(e)[1])
+        return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def stats(self) -> dict:
+        """Report this worker's pid, request count, frozen objects and peak RSS."""
+        import resource
+        return {
+            "pid": os.getpid(),
+            "requests": self.requests,
+            "frozen_objects": gc.get_freeze_count(),
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        }
+
+
+class PreforkClient:
+    """Client for a PreforkServer, holding one connection open."""
+
+    def __init__(self, address: Address, timeout: Optional[float] = 30.0):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(address)
+        self.stream = self.sock.makefile("rwb")
+
+    def request(self, op: str, **args) -> Any:
+        """
+        Send one request and return its result.
+
+        Raises:
+            ValueError: The server rejected the request
+        """
+        payload = {"op": op, "args": args}
+        self.stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+        self.stream.flush()
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def story(self, **args) -> dict:
+        """Generate a story (arguments as for SUBITNarrativeEngine.generate_story)."""
+        return self.request("story", **args)
+
+    def poem(self, **args) -> dict:
+        """Generate a poem (arguments as for SUBITPoetryEngine.generate_poem)."""
+        return self.request("poem", **args)
+
+    def stats(self) -> dict:
+        """Return the serving worker's stats."""
+        return self.request("stats")
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.stream.close()
+        self.sock.close()
+
+    def __enter__(self) -> 'PreforkClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _raise_exit(signum, frame):
+    """Signal handler turning SIGTERM into SystemExit."""
+    raise SystemExit(0)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SUBIT pre-fork worker server")
+    parser.add_argument("--socket", metavar="PATH",
+                        help="Unix socket path (default /tmp/subit.sock)")
+    parser.add_argument("--host", help="Listen on TCP instead of a Unix socket")
+    parser.add_argument("--port", type=int, default=7064, help="TCP port (with --host)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4,
+                        help="Number of worker processes")
+    args = parser.parse_args(argv)
+
+    address: Address = (args.host, args.port) if args.host else (args.socket or "/tmp/subit.sock")
+    server = PreforkServer(address, workers=args.workers)
+    print(f"SUBIT pre-fork server on {address} with {args.workers} workers", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+SUBIT Service
+Request dispatch shared by the SUBIT servers
+
+Maps an operation name and a JSON-compatible argument dict onto the
+narrative and poetry engines, returning JSON-compatible results.
+"""
+
+import sys
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Add parent directory to path for importing base SUBIT
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.subit import (
+    Archetype, SUBITNarrativeEngine,
+    parse_archetype, find_path
+)
+from src.poetry.subit_poetry import SUBITPoetryEngine
+from dobre.src.dobre import Dobre
+
+
+# Arguments accepted by each operation
+STORY_ARGS = {"initial", "target", "formula_name", "protagonist_name",
+              "style", "complexity", "seed"}
+POEM_ARGS = {"archetype", "form", "mood", "key_images", "line_count", "title",
+             "rhyme_scheme", "seed"}
+STORY_POEM_ARGS = STORY_ARGS | {"form", "line_count", "rhyme_scheme"}
+PATH_ARGS = {"start", "end", "max_steps"}
+FORMULA_ARGS = {"name"}
+DOBRE_ARGS = {"word", "code", "bits", "archetype", "who", "where", "when"}
+
+# Upper bound on find_path depth accepted from requests
+MAX_PATH_STEPS = 3
+
+# Upper bound on poem line_count (lines per stanza for story_poem)
+MAX_LINE_COUNT = 100
+
+
+class SUBITService:
+    """
+    Dispatch requests to one narrative engine and one poetry engine.
+
+    Both engines share a single ArchetypeCatalog and PlotGenerator.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[SUBITNarrativeEngine] = None,
+        poetry: Optional[SUBITPoetryEngine] = None
+    ):
+        self.engine = engine or SUBITNarrativeEngine()
+        self.poetry = poetry or SUBITPoetryEngine(
+            catalog=self.engine.catalog, plot_gen=self.engine.plot_gen
+        )
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "story": self.story,
+            "poem": self.poem,
+            "story_poem": self.story_poem,
+            "path": self.path,
+            "formula": self.formula,
+            "dobre": self.dobre
+        }
+
+    def warm(self) -> None:
+        """Build every catalog and table both engines use."""
+        self.engine.warm()
+        self.poetry.warm()
+
+    def handle(self, op: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run one operation.
+
+        Raises:
+            ValueError: Unknown operation or invalid arguments
+        """
+        handler = self.handlers.get(op)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {op}")
+        return handler(args or {})
+
+    def story(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a story; initial and target may be names or bits."""
+        _check_args("story", args, STORY_ARGS)
+        return self.engine.generate_story(**_story_kwargs(args)).to_dict()
+
+    def poem(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a poem with metadata."""
+        _check_args("poem", args, POEM_ARGS)
+        kwargs = dict(args)
+        kwargs["archetype"] = _require_archetype(args, "archetype")
+        if "line_count" in kwargs:
+            kwargs["line_count"] = _line_count(args)
+        return self.poetry.generate_poem(**kwargs)
+
+    def story_poem(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate a story and a poem from the same narrative arc.
+
+        Takes the story arguments plus the poem's form, line_count
+        (per stanza) and rhyme_scheme; the arc is generated once.
+        """
+        _check_args("story_poem", args, STORY_POEM_ARGS)
+        line_count = _line_count(args)
+        story = self.engine.generate_story(**_story_kwargs(args))
+        poem = self.poetry.generate_from_arc(
+            story.arc,
+            form=args.get("form", "free_verse"),
+            line_count=line_count,
+            rhyme_scheme=args.get("rhyme_scheme"),
+            seed=args.get("seed")
+        )
+        return {"story": story.to_dict(), "poem": poem}
+
+    def path(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Find transmutation paths between two archetypes."""
+        _check_args("path", args, PATH_ARGS)
+        start = _require_archetype(args, "start")
+        end = _require_archetype(args, "end")
+        max_steps = int(args.get("max_steps", MAX_PATH_STEPS))
+        if not 1 <= max_steps <= MAX_PATH_STEPS:
+            raise ValueError(f"max_steps must be between 1 and {MAX_PATH_STEPS}")
+        paths = find_path(start, end, max_steps=max_steps)
+        return {
+            "start": start.bits,
+            "end": end.bits,
+            "paths": [
+                [{"impulse": i.bits, "catalyst": c.bits} for i, c in path]
+                for path in paths
+            ]
+        }
+
+    def formula(self, args: Dict[str, Any]) -> Any:
+        """Look up a master formula by name, or list all of them."""
+        _check_args("formula", args, FORMULA_ARGS)
+        catalog = self.engine.transmutations
+        if "name" not in args:
+            return [f.to_dict() for f in catalog.all()]
+        formula = catalog.find_by_name(args["name"])
+        if formula is None:
+            raise ValueError(f"Unknown formula: {args['name']}")
+        return formula.to_dict()
+
+    def dobre(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Translate to and from Dobre.
+
+        Accepts one of: word ("di-bi-ri"), code (0-63), bits ("101010"),
+        archetype (name or bits), or who/where/when dimensions.
+        """
+        _check_args("dobre", args, DOBRE_ARGS)
+        if "word" in args:
+            word = Dobre.from_string(_require_str(args, "word"))
+            archetype = word.archetype
+        else:
+            if "code" in args:
+                archetype = Archetype.from_int(int(args["code"]))
+            elif "bits" in args:
+                archetype = Archetype.from_bits(_require_str(args, "bits"))
+            elif "archetype" in args:
+                archetype = _require_archetype(args, "archetype")
+            elif {"who", "where", "when"} <= set(args):
+                archetype = Dobre.from_archetype(
+                    *(_require_str(args, key).upper() for key in ("who", "where", "when"))
+                ).archetype
+            else:
+                raise ValueError("dobre requires word, code, bits, archetype or who/where/when")
+            word = archetype.dobre
+        return {
+            "dobre": str(word),
+            "code": archetype.int_value,
+            "bits": archetype.binary,
+            "who": archetype.who.value,
+            "where": archetype.where.value,
+            "when": archetype.when.value,
+            "name": archetype.name
+        }
+
+
+def describe_error(error: Exception) -> Tuple[int, str]:
+    """
+    Classify an exception raised while handling a request.
+
+    ValueError and TypeError mean the request was invalid; anything else
+    is a fault in the service.
+
+    Returns:
+        HTTP status (400 or 500) and the error message to report
+    """
+    if isinstance(error, (ValueError, TypeError)):
+        return 400, str(error)
+    return 500, f"Internal error: {type(error).__name__}: {error}"
+
+
+def _story_kwargs(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick out generate_story arguments, parsing initial and target."""
+    kwargs = {key: value for key, value in args.items() if key in STORY_ARGS}
+    if kwargs.get("seed") is not None:
+        _require_str(kwargs, "seed")
+    for key in ("initial", "target"):
+        if kwargs.get(key) is not None:
+            kwargs[key] = _require_archetype(kwargs, key)
+    return kwargs
+
+
+def _require_str(args: Dict[str, Any], key: str) -> str:
+    """Get a string argument, rejecting other JSON types."""
+    value = args[key]
+    if not isinstance(value, str):
+        raise ValueError(f"{key} must be a string, got {type(value).__name__}")
+    return value
+
+
+def _line_count(args: Dict[str, Any]) -> Optional[int]:
+    """Parse an optional line_count, bounded by MAX_LINE_COUNT."""
+    if args.get("line_count") is None:
+        return None
+    line_count = int(args["line_count"])
+    if not 1 <= line_count <= MAX_LINE_COUNT:
+        raise ValueError(f"line_count must be between 1 and {MAX_LINE_COUNT}")
+    return line_count
+
+
+def _require_archetype(args: Dict[str, Any], key: str) -> Archetype:
+    """Parse a required archetype argument (name or bits)."""
+    if key not in args:
+        raise ValueError(f"Missing argument: {key}")
+    archetype = parse_archetype(str(args[key]))
+    if archetype is None:
+        raise ValueError(f"Unknown archetype: {args[key]}")
+    return archetype
+
+
+def _check_args(op: str, args: Dict[str, Any], allowed: set) -> None:
+    """Reject arguments an operation does not accept."""
+    if not isinstance(args, dict):
+        raise ValueError(f"{op} arguments must be an object")
+    unknown = set(args) - allowed
+    if unknown:
+        raise ValueError(f"Unknown {op} argument(s): {', '.join(sorted(unknown))}")
@@ -0,0 +1,250 @@
+"""
+SUBIT Story Store
+SQLite persistence for stories, with indexed structural queries
+
+Each story is one row: its initial and final archetype codes (0-63),
+formula name, dramatic tension, complexity and seed in indexed columns,
+and its to_dict JSON in a text column. Structural queries ("Steadfast
+to Council, tension above 0.6, complexity 3") are answered from the
+indexes; a story's JSON is only read and parsed as the query result is
+iterated.
+
+The database runs in WAL mode with synchronous=NORMAL, and inserts are
+made in batched transactions, so bulk loads commit once per batch
+rather than once per story.
+
+Usage:
+    with StoryStore("stories.db") as store:
+        store.add_many(engine.generate_story(seed=str(i)) for i in range(100000))
+        for story in store.query("Steadfast", "Council", min_tension=0.6, complexity=3):
+            print(story.title)
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Add parent directory to path for importing base SUBIT
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.subit import Archetype, Story, parse_archetype
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    id INTEGER PRIMARY KEY,
+    initial INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    formula TEXT,
+    tension REAL NOT NULL,
+    complexity INTEGER NOT NULL,
+    seed TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stories_states ON stories (initial, final, complexity, tension);
+CREATE INDEX IF NOT EXISTS stories_formula ON stories (formula, tension);
+CREATE INDEX IF NOT EXISTS stories_tension ON stories (tension);
+CREATE INDEX IF NOT EXISTS stories_seed ON stories (seed);
+"""
+
+_INSERT = ("INSERT INTO stories (initial, final, formula, tension, complexity, seed, data) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+# Rows fetched from SQLite at a time while a query is iterated
+_FETCH_ROWS = 256
+
+
+def _code(archetype: Union[Archetype, int, str]) -> int:
+    """
+    Integer code of an archetype, code, bit string or name.
+
+    Raises:
+        ValueError: An unknown name or bit string, or a code outside 0-63
+    """
+    if isinstance(archetype, Archetype):
+        return archetype.int_value
+    if isinstance(archetype, int):
+        if not 0 <= archetype <= 63:
+            raise ValueError(f"Expected 0-63, got {archetype}")
+        return archetype
+    parsed = parse_archetype(archetype)
+    if parsed is None:
+        raise ValueError(f"Unknown archetype: {archetype}")
+    return parsed.int_value
+
+
+def _row(story: Story) -> Tuple[Any, ...]:
+    """Insert parameters for a story."""
+    record = story.to_dict()
+    metadata = story.metadata
+    return (
+        story.arc.initial_state.int_value,
+        story.arc.final_state.int_value,
+        metadata.get("formula"),
+        story.arc.dramatic_tension,
+        metadata.get("complexity", len(story.arc.plot_points)),
+        metadata.get("seed"),
+        json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    )
+
+
+class StoryStore:
+    """
+    SQLite-backed story store.
+
+    Attributes:
+        path: Database file (":memory:" for a private in-memory store)
+        batch_size: Stories inserted per transaction by add_many
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1000):
+        """
+        Open (creating if needed) a store.
+
+        Raises:
+            ValueError: batch_size below 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def add(self, story: Story) -> int:
+        """Insert one story in its own transaction and return its id."""
+        with self._conn:
+            return self._conn.execute(_INSERT, _row(story)).lastrowid
+
+    def add_many(self, stories: Iterable[Story]) -> int:
+        """
+        Insert stories in transactions of batch_size.
+
+        Each batch is committed before the next is read from stories, so
+        a generator of stories is never held in memory whole.
+
+        Returns:
+            Stories inserted
+        """
+        stories = iter(stories)
+        total = 0
+        while True:
+            rows = [_row(story) for story in islice(stories, self.batch_size)]
+            if not rows:
+                return total
+            with self._conn:
+                self._conn.executemany(_INSERT, rows)
+            total += len(rows)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM stories").fetchone()[0]
+
+    def get(self, story_id: int) -> Story:
+        """
+        A story by id.
+
+        Raises:
+            KeyError: No story with that id
+        """
+        row = self._conn.execute("SELECT data FROM stories WHERE id = ?", (story_id,)).fetchone()
+        if row is None:
+            raise KeyError(story_id)
+        return Story.from_dict(json.loads(row[0]))
+
+    def _where(self, initial=None, final=None, formula=None, min_tension=None,
+               max_tension=None, complexity=None, seed=None) -> Tuple[str, List[Any]]:
+        """WHERE clause and parameters for the query filters."""
+        clauses, params = [], []
+        for column, op, value in (
+            ("initial", "=", None if initial is None else _code(initial)),
+            ("final", "=", None if final is None else _code(final)),
+            ("formula", "=", formula),
+            ("tension", ">=", min_tension),
+            ("tension", "<=", max_tension),
+            ("complexity", "=", complexity),
+            ("seed", "=", seed),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def ids(self, *args, limit: Optional[int] = None, **filters) -> List[int]:
+        """Ids of the matching stories, in id order (filters as in query)."""
+        where, params = self._where(*args, **filters)
+        sql = f"SELECT id FROM stories{where} ORDER BY id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [row[0] for row in self._conn.execute(sql, params)]
+
+    def count(self, *args, **filters) -> int:
+        """Number of matching stories (filters as in query), from the indexes alone."""
+        where, params = self._where(*args, **filters)
+        return self._conn.execute(f"SELECT COUNT(*) FROM stories{where}", params).fetchone()[0]
+
+    def query(self, initial: Union[Archetype, int, str, None] = None,
+              final: Union[Archetype, int, str, None] = None,
+              formula: Optional[str] = None,
+              min_tension: Optional[float] = None, max_tension: Optional[float] = None,
+              complexity: Optional[int] = None, seed: Optional[str] = None,
+              limit: Optional[int] = None) -> Iterator[Story]:
+        """
+        Matching stories, in id order, hydrated one at a time.
+
+        Rows are fetched a few hundred at a time, and a story's JSON is
+        only parsed when the iterator reaches it.
+
+        Args:
+            initial: Initial archetype (Archetype, code, bits or name)
+            final: Final archetype (Archetype, code, bits or name)
+            formula: Transmutation formula name
+            min_tension: Lowest dramatic tension (inclusive)
+            max_tension: Highest dramatic tension (inclusive)
+            complexity: Requested plot points
+            seed: Generation seed
+            limit: Most stories to return
+
+        Yields:
+            Story objects
+
+        Raises:
+            ValueError: An unknown archetype
+        """
+        where, params = self._where(initial, final, formula, min_tension, max_tension,
+                                    complexity, seed)
+        sql = f"SELECT data FROM stories{where} ORDER BY id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        cursor = self._conn.execute(sql, params)
+        return self._hydrate(cursor)
+
+    @staticmethod
+    def _hydrate(cursor: sqlite3.Cursor) -> Iterator[Story]:
+        while True:
+            rows = cursor.fetchmany(_FETCH_ROWS)
+            if not rows:
+                return
+            for (data,) in rows:
+                yield Story.from_dict(json.loads(data))
+
+    def stats(self) -> Dict[str, Any]:
+        """Report story count and the database's journal mode."""
+        return {
+            "stories": len(self),
+            "journal_mode": self._conn.execute("PRAGMA journal_mode").fetchone()[0],
+        }
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def __enter__(self) -> 'StoryStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
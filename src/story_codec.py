@@ -0,0 +1,357 @@
+"""
+SUBIT Story Codec
+Compact story text as template ids and slot values
+
+Every story the engine renders is a few paragraphs, each one of the
+StoryRenderer templates filled with values from small, fixed pools:
+settings, names, backgrounds, archetype names, motivations, fears and
+event descriptions (a step prefix, a PlotGenerator.event_templates or
+fallback_event_templates base, and a specific_templates suffix). A
+TemplateDictionary enumerates the templates and every value each slot
+can take, and a StoryCodec stores a story as one token per paragraph:
+a template id and a value id per slot.
+
+Each encoded story carries the dictionary's version (a CRC-32 of its
+contents) above its ids, and decoding against a different dictionary
+fails instead of producing the wrong text (unless the two CRCs collide,
+a 1 in 2**32 chance). Text the dictionary does not cover (a custom
+name, an edited paragraph) is stored literally, so decoding is always
+exact.
+
+Encoding:
+    ids: varint byte length, then an unsigned little-endian integer
+        holding one mixed-radix digit per choice, first choice least
+        significant: per paragraph, template id + 2 (1 for a literal
+        paragraph), then per slot value id + 1 (0 for literal text);
+        then 0 for "no more paragraphs"; the rest of the integer (its
+        most significant 32 bits) is the version
+    literals: per literal slot or paragraph, in order, a varint byte
+        length and the UTF-8 text
+
+Packing the ids into one integer spends about log2(pool size) bits on
+each choice, rather than a whole byte or two per varint.
+
+Usage:
+    codec = StoryCodec(engine)
+    blob = codec.encode(story.text)          # ~16 bytes for ~400 characters
+    assert codec.decode(blob) == story.text
+    Counter(codec.template_ids(blob))        # analytics without decoding text
+"""
+
+import os
+import re
+import sys
+import zlib
+from string import Formatter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Add parent directory to path for importing base SUBIT
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.subit import ARCHETYPE_NAMES, WHO, Archetype, SUBITNarrativeEngine
+
+
+# Order of the StoryRenderer template sections in the dictionary
+SECTIONS = ("opening", "intro", "event", "reflection", "closing")
+
+# Step prefixes PlotGenerator adds to the first three event descriptions
+STEP_PREFIXES = ("First, ", "Then, ", "Finally, ")
+
+class StoryToken(NamedTuple):
+    """One paragraph: a template id (None for literal text) and its slot values."""
+    template: Optional[int]
+    values: Tuple[str, ...]
+
+
+def _put(out: bytearray, value: int) -> None:
+    """Append an unsigned varint."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read an unsigned varint, returning it and the next position."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _lower_first(text: str) -> str:
+    return text[0].lower() + text[1:]
+
+
+class TemplateDictionary:
+    """
+    The templates and slot values an engine renders stories from.
+
+    Attributes:
+        templates: (section, template) pairs; a template's id is its index
+        fields: Slot names of each template, in order
+        values: Sorted possible values of each slot name
+        version: CRC-32 of the templates and values
+    """
+
+    def __init__(self, templates: Iterable[Tuple[str, str]], values: Dict[str, Iterable[str]]):
+        """
+        Build a dictionary.
+
+        Args:
+            templates: (section, str.format template) pairs
+            values: Possible values of each slot name
+
+        Raises:
+            ValueError: A template slot with no values
+        """
+        self.templates: Tuple[Tuple[str, str], ...] = tuple(templates)
+        self.values: Dict[str, Tuple[str, ...]] = {
+            name: tuple(sorted(set(pool))) for name, pool in sorted(values.items())
+        }
+        self._ids = {name: {v: i for i, v in enumerate(pool)} for name, pool in self.values.items()}
+
+        self.fields: List[Tuple[str, ...]] = []
+        self._pieces: List[Tuple[str, ...]] = []
+        self._patterns = []
+        for _, template in self.templates:
+            parsed = list(Formatter().parse(template))
+            fields = tuple(name for _, name, _, _ in parsed if name is not None)
+            missing = [name for name in fields if name not in self.values]
+            if missing:
+                raise ValueError(f"No values for slot {missing[0]!r} in {template!r}")
+            self.fields.append(fields)
+            # Literal text before each slot, and the text after the last
+            self._pieces.append(tuple(literal for literal, _, _, _ in parsed)
+                                + (('',) if parsed and parsed[-1][1] is not None else ()))
+            regex, seen = "", set()
+            for literal, name, _, _ in parsed:
+                regex += re.escape(literal)
+                if name is not None:
+                    regex += f"(?P={name})" if name in seen else f"(?P<{name}>.*?)"
+                    seen.add(name)
+            self._patterns.append(re.compile(regex, re.DOTALL))
+
+        # Most literal text first, so catch-alls like "{description}" come last
+        self._match_order = sorted(range(len(self.templates)),
+                                   key=lambda i: -len("".join(self._pieces[i])))
+
+        crc = zlib.crc32("\0".join(t for _, t in self.templates).encode())
+        for name, pool in self.values.items():
+            crc = zlib.crc32("\0".join((name,) + pool).encode(), crc)
+        self.version = crc
+
+    @classmethod
+    def from_engine(cls, engine: SUBITNarrativeEngine) -> 'TemplateDictionary':
+        """
+        Enumerate the templates and slot values of an engine.
+
+        Characters are generated for every archetype and name in its
+        pool (names make generation deterministic), worlds for every
+        archetype, and descriptions from every event base, suffix and
+        step prefix.
+        """
+        renderer, plot_gen = engine.renderer, engine.plot_gen
+        templates = [(section, t) for section in SECTIONS for t in renderer.templates[section]]
+
+        names, backgrounds, archetypes, motivations, fears, settings = (set() for _ in range(6))
+        for code in range(64):
+            archetype = Archetype.from_int(code)
+            pool = engine.character_gen.name_pools.get(archetype.who, ["Alex"])
+            if archetype.who == WHO.WE:
+                pool = [f"{name} of {archetype.name}" for name in pool]
+            for name in pool:
+                character = engine.character_gen.generate(archetype, name=name)
+                names.add(name)
+                backgrounds.add(character.background)
+                archetypes.add(character.attributes["archetype_name"])
+                motivations.add(character.attributes["motivation"].lower())
+                fears.add(character.attributes["fear"].lower())
+            settings.add(engine.world_gen.generate(archetype).setting)
+
+        bases = [base + suffix
+                 for pool in [*plot_gen.event_templates.values(), plot_gen.fallback_event_templates]
+                 for base in pool
+                 for suffix in ("",) + tuple(plot_gen.specific_templates.values())]
+        descriptions = bases + [prefix + _lower_first(base) for prefix in STEP_PREFIXES
+                                for base in bases]
+
+        return cls(templates, {
+            "setting": settings,
+            "protagonist": names,
+            "name": names,
+            "background": backgrounds,
+            "archetype": archetypes,
+            "motivation": motivations,
+            "fear": fears,
+            "description": descriptions,
+            "final_state": ARCHETYPE_NAMES.values(),
+        })
+
+    def match(self, paragraph: str) -> StoryToken:
+        """
+        Split a paragraph into a template and slot values.
+
+        Prefers a template whose values are all in the dictionary; any
+        match reproduces the paragraph exactly.
+
+        Returns:
+            The token (template None if no template matches)
+        """
+        fallback = None
+        for i in self._match_order:
+            m = self._patterns[i].fullmatch(paragraph)
+            if m is None:
+                continue
+            values = tuple(m.group(name) for name in self.fields[i])
+            if all(v in self._ids[name] for name, v in zip(self.fields[i], values)):
+                return StoryToken(i, values)
+            if fallback is None:
+                fallback = StoryToken(i, values)
+        return fallback or StoryToken(None, (paragraph,))
+
+    def value_id(self, name: str, value: str) -> Optional[int]:
+        """Id of a slot value, or None if the dictionary lacks it."""
+        return self._ids.get(name, {}).get(value)
+
+    def render(self, token: StoryToken) -> str:
+        """The paragraph a token stands for."""
+        if token.template is None:
+            return token.values[0]
+        pieces = self._pieces[token.template]
+        return "".join(p + v for p, v in zip(pieces, token.values)) + pieces[-1]
+
+
+class StoryCodec:
+    """
+    Encodes story text against a TemplateDictionary.
+
+    Attributes:
+        dictionary: The TemplateDictionary
+    """
+
+    def __init__(self, engine: Optional[SUBITNarrativeEngine] = None,
+                 dictionary: Optional[TemplateDictionary] = None):
+        """
+        Create a codec.
+
+        Args:
+            engine: Engine whose templates to use (a new one if neither
+                engine nor dictionary is given)
+            dictionary: Prebuilt dictionary (overrides engine)
+        """
+        self.dictionary = dictionary or TemplateDictionary.from_engine(
+            engine or SUBITNarrativeEngine())
+        # Template digits: 0 ends the story, 1 is a literal paragraph
+        self._template_radix = len(self.dictionary.templates) + 2
+
+    @property
+    def version(self) -> int:
+        """The dictionary version stamped on every encoded story."""
+        return self.dictionary.version
+
+    def tokens(self, text: str) -> List[StoryToken]:
+        """One token per paragraph of a story text."""
+        return [self.dictionary.match(p) for p in text.split("\n\n")]
+
+    def encode(self, text: str) -> bytes:
+        """Encode a story text (exactly recoverable with decode)."""
+        dictionary = self.dictionary
+        digits: List[Tuple[int, int]] = []
+        literals = bytearray()
+        for token in self.tokens(text):
+            if token.template is None:
+                digits.append((1, self._template_radix))
+                raw = token.values[0].encode()
+                _put(literals, len(raw))
+                literals += raw
+                continue
+            digits.append((token.template + 2, self._template_radix))
+            for name, value in zip(dictionary.fields[token.template], token.values):
+                value_id = dictionary.value_id(name, value)
+                digits.append((0 if value_id is None else value_id + 1,
+                               len(dictionary.values[name]) + 1))
+                if value_id is None:
+                    raw = value.encode()
+                    _put(literals, len(raw))
+                    literals += raw
+        ids = dictionary.version * self._template_radix
+        for digit, radix in reversed(digits):
+            ids = ids * radix + digit
+        packed = ids.to_bytes((ids.bit_length() + 7) // 8, "little")
+        out = bytearray()
+        _put(out, len(packed))
+        return bytes(out + packed + literals)
+
+    def _parse(self, blob: bytes, with_values: bool = True) -> List[StoryToken]:
+        """
+        Tokens of an encoded story.
+
+        Raises:
+            ValueError: A different dictionary version, or a malformed blob
+        """
+        dictionary = self.dictionary
+        tokens = []
+        try:
+            length, pos = _get(blob, 0)
+            if pos + length > len(blob):
+                raise IndexError(pos + length)
+            ids = int.from_bytes(blob[pos:pos + length], "little")
+            pos += length
+
+            def literal() -> Optional[str]:
+                nonlocal pos
+                size, pos = _get(blob, pos)
+                end = pos + size
+                if end > len(blob):
+                    raise IndexError(end)
+                text = blob[pos:end].decode() if with_values else None
+                pos = end
+                return text
+
+            while True:
+                ids, code = divmod(ids, self._template_radix)
+                if code == 0:
+                    break
+                if code == 1:
+                    text = literal()
+                    tokens.append(StoryToken(None, (text,) if with_values else ()))
+                    continue
+                template = code - 2
+                values = []
+                for name in dictionary.fields[template]:
+                    pool = dictionary.values[name]
+                    ids, value = divmod(ids, len(pool) + 1)
+                    text = literal() if value == 0 else pool[value - 1]
+                    if with_values:
+                        values.append(text)
+                tokens.append(StoryToken(template, tuple(values)))
+        except (IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Malformed encoded story: {e}") from None
+        if ids != dictionary.version:
+            raise ValueError("Story was encoded with a different template dictionary, "
+                             "or is damaged")
+        if pos != len(blob):
+            raise ValueError("Malformed encoded story: trailing data")
+        return tokens
+
+    def decode_tokens(self, blob: bytes) -> List[StoryToken]:
+        """The tokens of an encoded story, values included."""
+        return self._parse(blob)
+
+    def decode(self, blob: bytes) -> str:
+        """
+        The exact text of an encoded story.
+
+        Raises:
+            ValueError: A different dictionary version, or a malformed blob
+        """
+        return "\n\n".join(map(self.dictionary.render, self._parse(blob)))
+
+    def template_ids(self, blob: bytes) -> List[Optional[int]]:
+        """Template id of each paragraph (None for literal text), without decoding any text."""
+        return [token.template for token in self._parse(blob, with_values=False)]
@@ -6,12 +6,17 @@ A formal system for generating narratives based on archetypal transmutations.
 """
 
 import random
-import json
+import sys
+import time
 from enum import Enum
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
-from collections import deque
-import hashlib
+
+if TYPE_CHECKING:
+    from dobre.src.dobre import Dobre
+
+# json, hashlib and collections are imported where used: they are only
+# needed for saving, seeding and path search, not for a cold start.
 
 
 # ============================================================================
@@ -76,6 +81,18 @@ WHEN_ENCODE = {
 
 WHEN_DECODE = {v: k for k, v in WHEN_ENCODE.items()}
 
+# Each axis value's 2 bits as an int, stored on the member (WHO.ME.int_value
+# == 2) since Enum hashing makes dict lookups several times slower
+for _encode in (WHO_ENCODE, WHERE_ENCODE, WHEN_ENCODE):
+    for _member, _bits in _encode.items():
+        _member.int_value = int(_bits, 2)
+
+# (who, where, when) by 6-bit integer code
+INT_AXES: Tuple[Tuple[WHO, WHERE, WHEN], ...] = tuple(
+    (WHO_DECODE[b[0:2]], WHERE_DECODE[b[2:4]], WHEN_DECODE[b[4:6]])
+    for b in (format(code, '06b') for code in range(64))
+)
+
 
 # ============================================================================
 # 3. CORE DATA STRUCTURES
@@ -106,7 +123,13 @@ class Archetype:
     @property
     def int_value(self) -> int:
         """Return integer value of the 6-bit string (0-63)."""
-        return int(self.binary, 2)
+        return self.who.int_value << 4 | self.where.int_value << 2 | self.when.int_value
+    
+    @property
+    def dobre(self) -> 'Dobre':
+        """Return the Dobre word for this archetype (looked up by code)."""
+        from dobre.src.dobre import Dobre
+        return Dobre.from_code(self.int_value)
     
     @property
     def name(self) -> str:
@@ -123,29 +146,15 @@ class Archetype:
             return NotImplemented
         
         # XOR the integer values
-        result_int = self.int_value ^ other.int_value
-        
-        # Convert back to binary
-        result_bin = format(result_int, '06b')
-        
-        # Parse into components
-        who_bits = result_bin[0:2]
-        where_bits = result_bin[2:4]
-        when_bits = result_bin[4:6]
-        
-        return Archetype(
-            who=WHO_DECODE[who_bits],
-            where=WHERE_DECODE[where_bits],
-            when=WHEN_DECODE[when_bits]
-        )
+        return Archetype(*INT_AXES[self.int_value ^ other.int_value])
     
     def __eq__(self, other) -> bool:
         if not isinstance(other, Archetype):
             return False
-        return self.bits == other.bits
+        return self.int_value == other.int_value
     
     def __hash__(self):
-        return hash(self.bits)
+        return self.int_value
     
     def __repr__(self) -> str:
         return f"[{self.who.value}, {self.where.value}, {self.when.value}]"
@@ -184,7 +193,7 @@ class Archetype:
         """Create archetype from integer 0-63."""
         if not 0 <= value <= 63:
             raise ValueError(f"Expected 0-63, got {value}")
-        return cls.from_bits(format(value, '06b'))
+        return cls(*INT_AXES[value])
 
 
 @dataclass
@@ -218,6 +227,16 @@ class Character:
             "background": self.background,
             "attributes": self.attributes
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Character':
+        """Rebuild a character from its to_dict form."""
+        return cls(
+            name=data["name"],
+            current_state=Archetype.from_int(data["current_state"]["int"]),
+            background=data["background"],
+            attributes=data["attributes"]
+        )
 
 
 @dataclass
@@ -247,6 +266,17 @@ class Event:
             "bits_changed": self.bits_changed,
             "significance": self.significance
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Event':
+        """Rebuild an event from its to_dict form."""
+        return cls(
+            event_type=data["event_type"],
+            description=data["description"],
+            previous_state=Archetype.from_bits(data["previous_state"]),
+            new_state=Archetype.from_bits(data["new_state"]),
+            significance=data["significance"]
+        )
 
 
 @dataclass
@@ -257,6 +287,11 @@ class NarrativeArc:
     final_state: Archetype
     plot_points: List[Event] = field(default_factory=list)
     
+    @property
+    def states(self) -> List[Archetype]:
+        """The protagonist's state before and after each plot point."""
+        return [self.initial_state] + [e.new_state for e in self.plot_points]
+    
     @property
     def is_complete(self) -> bool:
         """Check if arc reaches final state."""
@@ -286,6 +321,16 @@ class NarrativeArc:
             "dramatic_tension": self.dramatic_tension,
             "is_complete": self.is_complete
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NarrativeArc':
+        """Rebuild an arc from its to_dict form (derived fields are recomputed)."""
+        return cls(
+            protagonist=Character.from_dict(data["protagonist"]),
+            initial_state=Archetype.from_bits(data["initial_state"]),
+            final_state=Archetype.from_bits(data["final_state"]),
+            plot_points=[Event.from_dict(e) for e in data["plot_points"]]
+        )
 
 
 @dataclass
@@ -302,6 +347,15 @@ class StoryWorld:
             "dominant_archetype": self.dominant_archetype.bits,
             "rules": self.rules
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StoryWorld':
+        """Rebuild a world from its to_dict form."""
+        return cls(
+            setting=data["setting"],
+            dominant_archetype=Archetype.from_bits(data["dominant_archetype"]),
+            rules=data["rules"]
+        )
 
 
 @dataclass
@@ -323,6 +377,17 @@ class Story:
             "metadata": self.metadata
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Story':
+        """Rebuild a story from its to_dict form, e.g. a saved JSON record."""
+        return cls(
+            title=data["title"],
+            text=data["text"],
+            arc=NarrativeArc.from_dict(data["arc"]),
+            world=StoryWorld.from_dict(data["world"]),
+            metadata=data["metadata"]
+        )
+    
     def save(self, path: str, format: str = "txt") -> None:
         """Save story to file."""
         if format == "txt":
@@ -331,6 +396,7 @@ class Story:
                 f.write(self.text)
                 f.write(f"\n\n---\nGenerated by SUBIT Narrative Engine")
         elif format == "json":
+            import json
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
         elif format == "md":
@@ -343,6 +409,31 @@ class Story:
                 f.write(f"- Dramatic tension: {self.arc.dramatic_tension:.2f}\n")
                 if "formula" in self.metadata:
                     f.write(f"- Formula: {self.metadata['formula']}\n")
+    
+    @staticmethod
+    def save_many(stories: Iterable['Story'], path: str, compress: bool = False,
+                  sync_every: int = 1000) -> range:
+        """
+        Append stories to an archive file (see src/archive.py).
+        
+        One data file and one index file hold any number of stories;
+        read them back with StoryArchive.open(path).
+        
+        Args:
+            stories: Stories to append, in order
+            path: Archive data file (created if missing; the index is path + ".idx")
+            compress: zlib-compress each record that shrinks
+            sync_every: Records written between fsyncs
+        
+        Returns:
+            The ids given to the stories
+        """
+        from src.archive import StoryArchiveWriter
+        with StoryArchiveWriter(path, compress=compress, sync_every=sync_every) as writer:
+            start = len(writer)
+            for story in stories:
+                writer.append(story)
+            return range(start, len(writer))
 
 
 # ============================================================================
@@ -419,21 +510,32 @@ ARCHETYPE_NAMES = {
 
 
 class ArchetypeCatalog:
-    """Access to the 64 archetypes and their metadata."""
+    """
+    Access to the 64 archetypes and their metadata.
+    
+    The catalog is built on first access, so constructing one is free.
+    """
     
     def __init__(self):
-        self.archetypes: Dict[str, Dict[str, Any]] = {}
-        self._build_catalog()
+        self._archetypes: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    @property
+    def archetypes(self) -> Dict[str, Dict[str, Any]]:
+        """Archetype metadata keyed by bits."""
+        if self._archetypes is None:
+            self._build_catalog()
+        return self._archetypes
     
     def _build_catalog(self):
         """Build the archetype catalog with metadata."""
+        archetypes = {}
         for bits, name in ARCHETYPE_NAMES.items():
             archetype = Archetype.from_bits(bits)
             
             # Generate key qualities based on axes
             key_qualities = self._generate_key_qualities(archetype)
             
-            self.archetypes[bits] = {
+            archetypes[bits] = {
                 "name": name,
                 "archetype": archetype,
                 "bits": bits,
@@ -445,6 +547,7 @@ class ArchetypeCatalog:
                 "key": key_qualities,
                 "description": self._generate_description(archetype, name, key_qualities)
             }
+        self._archetypes = archetypes
     
     def _generate_key_qualities(self, a: Archetype) -> str:
         """Generate key qualities for an archetype."""
@@ -544,154 +647,167 @@ class TransmutationFormula:
 
 
 class TransmutationCatalog:
-    """Access to master transmutation formulas."""
+    """
+    Access to master transmutation formulas.
+    
+    Formulas are built and verified on first access, so constructing a
+    catalog is free.
+    """
     
     def __init__(self):
-        self.formulas: List[TransmutationFormula] = []
-        self._build_formulas()
-    
-   def _build_formulas(self):
-    """Build the 12 master transmutation formulas (verified correct)."""
-    
-    # Helper to create archetypes
-    def a(who: str, where: str, when: str) -> Archetype:
-        who_map = {"ME": WHO.ME, "WE": WHO.WE, "YOU": WHO.YOU, "THEY": WHO.THEY}
-        where_map = {"EAST": WHERE.EAST, "SOUTH": WHERE.SOUTH, 
-                    "WEST": WHERE.WEST, "NORTH": WHERE.NORTH}
-        when_map = {"SPRING": WHEN.SPRING, "SUMMER": WHEN.SUMMER,
-                   "AUTUMN": WHEN.AUTUMN, "WINTER": WHEN.WINTER}
-        return Archetype(
-            who=who_map[who],
-            where=where_map[where],
-            when=when_map[when]
-        )
+        self._formulas: Optional[List[TransmutationFormula]] = None
     
-    # VERIFIED CORRECT FORMULAS - each one has been tested
-    self.formulas = [
-        # 1. Philosopher's Stone ✅
-        TransmutationFormula(
-            name="Philosopher's Stone",
-            initial=a("ME", "SOUTH", "WINTER"),      # 10 11 00
-            impulse=a("THEY", "EAST", "SPRING"),      # 00 10 10
-            catalyst=a("YOU", "NORTH", "AUTUMN"),     # 01 00 01
-            result=a("WE", "WEST", "SUMMER"),         # 11 01 11
-            description="Personal longing becomes collective achievement"
-        ),
-        
-        # 2. Hero's Journey ✅ (corrected)
-        TransmutationFormula(
-            name="Hero's Journey",
-            initial=a("ME", "EAST", "SPRING"),        # 10 10 10
-            impulse=a("THEY", "SOUTH", "WINTER"),      # 00 11 00
-            catalyst=a("WE", "WEST", "AUTUMN"),        # 11 01 01
-            result=a("YOU", "NORTH", "SUMMER"),        # 01 00 11
-            description="Innocence confronts shadow, returns with wisdom"
-        ),
-        
-        # 3. Alchemical Marriage ✅
-        TransmutationFormula(
-            name="Alchemical Marriage",
-            initial=a("ME", "EAST", "SPRING"),        # 10 10 10
-            impulse=a("YOU", "WEST", "AUTUMN"),        # 01 01 01
-            catalyst=a("WE", "SOUTH", "SUMMER"),       # 11 11 11
-            result=a("THEY", "NORTH", "WINTER"),       # 00 00 00
-            description="Union of opposites returns to the source"
-        ),
-        
-        # 4. Creative Process ✅
-        TransmutationFormula(
-            name="Creative Process",
-            initial=a("ME", "NORTH", "WINTER"),       # 10 00 00
-            impulse=a("THEY", "EAST", "SPRING"),       # 00 10 10
-            catalyst=a("YOU", "SOUTH", "SUMMER"),      # 01 11 11
-            result=a("WE", "WEST", "AUTUMN"),          # 11 01 01
-            description="Solitude + inspiration + mastery = shared creation"
-        ),
-        
-        # 5. Healing ✅
-        TransmutationFormula(
-            name="Healing",
-            initial=a("ME", "WEST", "WINTER"),        # 10 01 00
-            impulse=a("THEY", "SOUTH", "SUMMER"),      # 00 11 11
-            catalyst=a("YOU", "EAST", "SPRING"),       # 01 10 10
-            result=a("WE", "NORTH", "AUTUMN"),         # 11 00 01
-            description="Isolation + collective energy + mediator = integration"
-        ),
-        
-        # 6. Revelation ✅
-        TransmutationFormula(
-            name="Revelation",
-            initial=a("THEY", "NORTH", "WINTER"),     # 00 00 00
-            impulse=a("ME", "EAST", "SPRING"),         # 10 10 10
-            catalyst=a("WE", "SOUTH", "SUMMER"),       # 11 11 11
-            result=a("YOU", "WEST", "AUTUMN"),         # 01 01 01
-            description="From void, through seeking and communion, wisdom emerges"
-        ),
-        
-        # 7. Power Transformation ✅
-        TransmutationFormula(
-            name="Power Transformation",
-            initial=a("ME", "SOUTH", "SUMMER"),       # 10 11 11
-            impulse=a("THEY", "WEST", "AUTUMN"),       # 00 01 01
-            catalyst=a("YOU", "NORTH", "SPRING"),      # 01 00 10
-            result=a("WE", "EAST", "WINTER"),          # 11 10 00
-            description="Individual power becomes collective guardianship"
-        ),
-        
-        # 8. Dark Night ✅
-        TransmutationFormula(
-            name="Dark Night",
-            initial=a("WE", "SOUTH", "SUMMER"),       # 11 11 11
-            impulse=a("THEY", "WEST", "AUTUMN"),       # 00 01 01
-            catalyst=a("YOU", "EAST", "WINTER"),       # 01 10 00
-            result=a("ME", "NORTH", "SPRING"),         # 10 00 10
-            description="Community joy, through crisis, retreats to potential"
-        ),
-        
-        # 9. Awakening ✅
-        TransmutationFormula(
-            name="Awakening",
-            initial=a("ME", "NORTH", "AUTUMN"),       # 10 00 01
-            impulse=a("THEY", "SOUTH", "SPRING"),      # 00 11 10
-            catalyst=a("WE", "EAST", "SUMMER"),        # 11 10 11
-            result=a("YOU", "WEST", "WINTER"),         # 01 01 00
-            description="Old patterns shattered by force become witness"
-        ),
-        
-        # 10. Renewal ✅
-        TransmutationFormula(
-            name="Renewal",
-            initial=a("THEY", "NORTH", "AUTUMN"),     # 00 00 01
-            impulse=a("ME", "SOUTH", "WINTER"),        # 10 11 00
-            catalyst=a("WE", "EAST", "SPRING"),        # 11 10 10
-            result=a("YOU", "WEST", "SUMMER"),         # 01 01 11
-            description="Unrealized possibilities + endurance = catharsis"
-        ),
-        
-        # 11. Reconciliation ✅
-        TransmutationFormula(
-            name="Reconciliation",
-            initial=a("ME", "WEST", "AUTUMN"),        # 10 01 01
-            impulse=a("THEY", "EAST", "SUMMER"),       # 00 10 11
-            catalyst=a("YOU", "NORTH", "WINTER"),      # 01 00 00
-            result=a("WE", "SOUTH", "SPRING"),         # 11 11 10
-            description="Judgment + higher perspective + love = renewed union"
-        ),
-        
-        # 12. Complete Transmutation ✅
-        TransmutationFormula(
-            name="Complete Transmutation",
-            initial=a("ME", "EAST", "SPRING"),        # 10 10 10
-            impulse=a("WE", "SOUTH", "SUMMER"),        # 11 11 11
-            catalyst=a("YOU", "WEST", "AUTUMN"),       # 01 01 01
-            result=a("THEY", "NORTH", "WINTER"),       # 00 00 00
-            description="The three active pillars return to the source"
-        )
-    ]
+    @property
+    def formulas(self) -> List[TransmutationFormula]:
+        """The master formulas."""
+        if self._formulas is None:
+            self._build_formulas()
+        return self._formulas
+    
+    def _build_formulas(self):
+        """Build the 12 master transmutation formulas (verified correct)."""
+    
+        # Helper to create archetypes
+        def a(who: str, where: str, when: str) -> Archetype:
+            who_map = {"ME": WHO.ME, "WE": WHO.WE, "YOU": WHO.YOU, "THEY": WHO.THEY}
+            where_map = {"EAST": WHERE.EAST, "SOUTH": WHERE.SOUTH, 
+                        "WEST": WHERE.WEST, "NORTH": WHERE.NORTH}
+            when_map = {"SPRING": WHEN.SPRING, "SUMMER": WHEN.SUMMER,
+                       "AUTUMN": WHEN.AUTUMN, "WINTER": WHEN.WINTER}
+            return Archetype(
+                who=who_map[who],
+                where=where_map[where],
+                when=when_map[when]
+            )
     
-    # Verify all formulas (this will now pass)
-    for f in self.formulas:
-        assert f.verify(), f"Formula {f.name} failed verification"
+        # VERIFIED CORRECT FORMULAS - each one has been tested
+        formulas = [
+            # 1. Philosopher's Stone ✅
+            TransmutationFormula(
+                name="Philosopher's Stone",
+                initial=a("ME", "SOUTH", "WINTER"),      # 10 11 00
+                impulse=a("THEY", "EAST", "SPRING"),      # 00 10 10
+                catalyst=a("YOU", "NORTH", "AUTUMN"),     # 01 00 01
+                result=a("WE", "WEST", "SUMMER"),         # 11 01 11
+                description="Personal longing becomes collective achievement"
+            ),
+        
+            # 2. Hero's Journey ✅ (corrected)
+            TransmutationFormula(
+                name="Hero's Journey",
+                initial=a("ME", "EAST", "SPRING"),        # 10 10 10
+                impulse=a("THEY", "SOUTH", "WINTER"),      # 00 11 00
+                catalyst=a("WE", "WEST", "AUTUMN"),        # 11 01 01
+                result=a("YOU", "NORTH", "SUMMER"),        # 01 00 11
+                description="Innocence confronts shadow, returns with wisdom"
+            ),
+        
+            # 3. Alchemical Marriage ✅
+            TransmutationFormula(
+                name="Alchemical Marriage",
+                initial=a("ME", "EAST", "SPRING"),        # 10 10 10
+                impulse=a("YOU", "WEST", "AUTUMN"),        # 01 01 01
+                catalyst=a("WE", "SOUTH", "SUMMER"),       # 11 11 11
+                result=a("THEY", "NORTH", "WINTER"),       # 00 00 00
+                description="Union of opposites returns to the source"
+            ),
+        
+            # 4. Creative Process ✅
+            TransmutationFormula(
+                name="Creative Process",
+                initial=a("ME", "NORTH", "WINTER"),       # 10 00 00
+                impulse=a("THEY", "EAST", "SPRING"),       # 00 10 10
+                catalyst=a("YOU", "SOUTH", "SUMMER"),      # 01 11 11
+                result=a("WE", "WEST", "AUTUMN"),          # 11 01 01
+                description="Solitude + inspiration + mastery = shared creation"
+            ),
+        
+            # 5. Healing ✅
+            TransmutationFormula(
+                name="Healing",
+                initial=a("ME", "WEST", "WINTER"),        # 10 01 00
+                impulse=a("THEY", "SOUTH", "SUMMER"),      # 00 11 11
+                catalyst=a("YOU", "EAST", "SPRING"),       # 01 10 10
+                result=a("WE", "NORTH", "AUTUMN"),         # 11 00 01
+                description="Isolation + collective energy + mediator = integration"
+            ),
+        
+            # 6. Revelation ✅
+            TransmutationFormula(
+                name="Revelation",
+                initial=a("THEY", "NORTH", "WINTER"),     # 00 00 00
+                impulse=a("ME", "EAST", "SPRING"),         # 10 10 10
+                catalyst=a("WE", "SOUTH", "SUMMER"),       # 11 11 11
+                result=a("YOU", "WEST", "AUTUMN"),         # 01 01 01
+                description="From void, through seeking and communion, wisdom emerges"
+            ),
+        
+            # 7. Power Transformation ✅
+            TransmutationFormula(
+                name="Power Transformation",
+                initial=a("ME", "SOUTH", "SUMMER"),       # 10 11 11
+                impulse=a("THEY", "WEST", "AUTUMN"),       # 00 01 01
+                catalyst=a("YOU", "NORTH", "SPRING"),      # 01 00 10
+                result=a("WE", "EAST", "WINTER"),          # 11 10 00
+                description="Individual power becomes collective guardianship"
+            ),
+        
+            # 8. Dark Night ✅
+            TransmutationFormula(
+                name="Dark Night",
+                initial=a("WE", "SOUTH", "SUMMER"),       # 11 11 11
+                impulse=a("THEY", "WEST", "AUTUMN"),       # 00 01 01
+                catalyst=a("YOU", "EAST", "WINTER"),       # 01 10 00
+                result=a("ME", "NORTH", "SPRING"),         # 10 00 10
+                description="Community joy, through crisis, retreats to potential"
+            ),
+        
+            # 9. Awakening ✅
+            TransmutationFormula(
+                name="Awakening",
+                initial=a("ME", "NORTH", "AUTUMN"),       # 10 00 01
+                impulse=a("THEY", "SOUTH", "SPRING"),      # 00 11 10
+                catalyst=a("WE", "EAST", "SUMMER"),        # 11 10 11
+                result=a("YOU", "WEST", "WINTER"),         # 01 01 00
+                description="Old patterns shattered by force become witness"
+            ),
+        
+            # 10. Renewal ✅
+            TransmutationFormula(
+                name="Renewal",
+                initial=a("THEY", "NORTH", "AUTUMN"),     # 00 00 01
+                impulse=a("ME", "SOUTH", "WINTER"),        # 10 11 00
+                catalyst=a("WE", "EAST", "SPRING"),        # 11 10 10
+                result=a("YOU", "WEST", "SUMMER"),         # 01 01 11
+                description="Unrealized possibilities + endurance = catharsis"
+            ),
+        
+            # 11. Reconciliation ✅
+            TransmutationFormula(
+                name="Reconciliation",
+                initial=a("ME", "WEST", "AUTUMN"),        # 10 01 01
+                impulse=a("THEY", "EAST", "SUMMER"),       # 00 10 11
+                catalyst=a("YOU", "NORTH", "WINTER"),      # 01 00 00
+                result=a("WE", "SOUTH", "SPRING"),         # 11 11 10
+                description="Judgment + higher perspective + love = renewed union"
+            ),
+        
+            # 12. Complete Transmutation ✅
+            TransmutationFormula(
+                name="Complete Transmutation",
+                initial=a("ME", "EAST", "SPRING"),        # 10 10 10
+                impulse=a("WE", "SOUTH", "SUMMER"),        # 11 11 11
+                catalyst=a("YOU", "WEST", "AUTUMN"),       # 01 01 01
+                result=a("THEY", "NORTH", "WINTER"),       # 00 00 00
+                description="The three active pillars return to the source"
+            )
+        ]
+    
+        # Verify all formulas (this will now pass)
+        for f in formulas:
+            assert f.verify(), f"Formula {f.name} failed verification"
+        
+        self._formulas = formulas
     
     def all(self) -> List[TransmutationFormula]:
         """Return all master formulas."""
@@ -755,6 +871,8 @@ def find_path(
     
     Returns list of paths, where each path is a list of (impulse, catalyst) pairs.
     """
+    from collections import deque
+    
     # BFS to find shortest paths
     queue = deque([(start, [])])
     visited = {start: 0}
@@ -828,14 +946,292 @@ def int_to_bits(value: int) -> str:
     return format(value, '06b')
 
 
+_DEFAULT_CATALOG: Optional[ArchetypeCatalog] = None
+
+
 def name_to_archetype(name: str) -> Optional[Archetype]:
     """Convert archetype name to Archetype object."""
-    catalog = ArchetypeCatalog()
-    return catalog.get_by_name(name)
+    global _DEFAULT_CATALOG
+    if _DEFAULT_CATALOG is None:
+        _DEFAULT_CATALOG = ArchetypeCatalog()
+    return _DEFAULT_CATALOG.get_by_name(name)
+
+
+def parse_archetype(value: str) -> Optional[Archetype]:
+    """
+    Parse an archetype from bits ("10 11 00" or "101100") or a name.
+    
+    Returns None if the value is neither valid bits nor a known name.
+    """
+    clean = value.replace(" ", "")
+    if len(clean) == 6 and set(clean) <= {"0", "1"}:
+        return Archetype.from_bits(clean)
+    return name_to_archetype(value)
+
+
+def seed_bytes(seed: str) -> bytes:
+    """Hash a string seed into the bytes used to seed the RNG."""
+    import hashlib
+    return hashlib.md5(seed.encode()).digest()
 
 
 # ============================================================================
-# 7. GENERATOR CLASSES
+# 7. INSTRUMENTATION
+# ============================================================================
+
+# Stages reported by SUBITNarrativeEngine.generate_story, in execution order
+STORY_STAGES = (
+    "target_selection",
+    "world_generation",
+    "character_generation",
+    "decomposition",
+    "event_generation",
+    "rendering",
+    "title",
+    "metadata"
+)
+
+# Upper bounds (seconds) of the wall-time histogram buckets
+STAGE_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, float("inf")
+)
+
+
+class _NullStage:
+    """Context manager that measures nothing."""
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> '_NullStage':
+        return self
+    
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Instrumentation:
+    """
+    Instrumentation hooks for story generation.
+    
+    The base class is a no-op: `stage` returns a shared context manager that
+    does nothing and `count` discards its input. Subclasses set `enabled`
+    and override `record` and `count` to collect measurements.
+    """
+    
+    enabled = False
+    
+    def stage(self, name: str) -> Any:
+        """Return a context manager timing one execution of a stage."""
+        return _NULL_STAGE
+    
+    def record(self, stage: str, wall: float, cpu: float, allocations: int) -> None:
+        """Receive wall time, CPU time and net allocated blocks for a stage."""
+        pass
+    
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment a named counter."""
+        pass
+
+
+NULL_INSTRUMENTATION = Instrumentation()
+
+
+class _TimedStage:
+    """Context manager reporting one stage execution to an Instrumentation."""
+    
+    __slots__ = ("instrumentation", "name", "wall", "cpu", "blocks")
+    
+    def __init__(self, instrumentation: Instrumentation, name: str):
+        self.instrumentation = instrumentation
+        self.name = name
+    
+    def __enter__(self) -> '_TimedStage':
+        self.blocks = sys.getallocatedblocks()
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info) -> bool:
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        blocks = sys.getallocatedblocks() - self.blocks
+        self.instrumentation.record(self.name, wall, cpu, blocks)
+        return False
+
+
+class _CountingRNG:
+    """Forward draws to an RNG, counting each one as `rng_draws`."""
+    
+    def __init__(self, rng: Any, instrumentation: Instrumentation):
+        self._rng = rng
+        self._instrumentation = instrumentation
+    
+    def seed(self, *args, **kwargs) -> None:
+        self._rng.seed(*args, **kwargs)
+    
+    def random(self) -> float:
+        self._instrumentation.count("rng_draws")
+        return self._rng.random()
+    
+    def randint(self, a: int, b: int) -> int:
+        self._instrumentation.count("rng_draws")
+        return self._rng.randint(a, b)
+    
+    def choice(self, seq):
+        self._instrumentation.count("rng_draws")
+        return self._rng.choice(seq)
+    
+    def sample(self, population, k: int) -> list:
+        self._instrumentation.count("rng_draws", k)
+        return self._rng.sample(population, k)
+    
+    def shuffle(self, x: list) -> None:
+        self._instrumentation.count("rng_draws", len(x))
+        self._rng.shuffle(x)
+
+
+@dataclass
+class StageStats:
+    """Accumulated measurements for one stage."""
+    count: int = 0
+    wall_total: float = 0.0
+    wall_max: float = 0.0
+    cpu_total: float = 0.0
+    allocations: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(STAGE_BUCKETS))
+    
+    @property
+    def wall_mean(self) -> float:
+        """Mean wall time per execution."""
+        return self.wall_total / self.count if self.count else 0.0
+    
+    def quantile(self, q: float) -> float:
+        """Estimate a wall-time quantile as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(STAGE_BUCKETS, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.wall_max)
+        return self.wall_max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "count": self.count,
+            "wall_total": self.wall_total,
+            "wall_mean": self.wall_mean,
+            "wall_p50": self.quantile(0.5),
+            "wall_p95": self.quantile(0.95),
+            "wall_max": self.wall_max,
+            "cpu_total": self.cpu_total,
+            "allocations": self.allocations,
+            "buckets": dict(zip([str(b) for b in STAGE_BUCKETS], self.buckets))
+        }
+
+
+class HistogramInstrumentation(Instrumentation):
+    """
+    Instrumentation that keeps in-process histograms of stage timings.
+    
+    Wall times are bucketed by STAGE_BUCKETS; CPU time and net allocated
+    blocks are summed per stage. Counters (e.g. `rng_draws`, `stories`)
+    are kept alongside.
+    """
+    
+    enabled = True
+    
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {}
+        self.counters: Dict[str, int] = {}
+    
+    def stage(self, name: str) -> _TimedStage:
+        return _TimedStage(self, name)
+    
+    def record(self, stage: str, wall: float, cpu: float, allocations: int) -> None:
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.count += 1
+        stats.wall_total += wall
+        stats.cpu_total += cpu
+        stats.allocations += allocations
+        if wall > stats.wall_max:
+            stats.wall_max = wall
+        for i, bound in enumerate(STAGE_BUCKETS):
+            if wall <= bound:
+                stats.buckets[i] += 1
+                break
+    
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+    
+    def reset(self) -> None:
+        """Discard all measurements."""
+        self.stages.clear()
+        self.counters.clear()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+            "counters": dict(self.counters)
+        }
+    
+    def to_text(self, prefix: str = "subit") -> str:
+        """
+        Dump all measurements as plain-text metrics, one per line.
+        
+        Lines look like `subit_stage_wall_seconds_sum{stage="rendering"} 0.0012`.
+        """
+        lines = []
+        ordered = [s for s in STORY_STAGES if s in self.stages]
+        ordered += sorted(s for s in self.stages if s not in STORY_STAGES)
+        for name in ordered:
+            stats = self.stages[name]
+            label = f'stage="{name}"'
+            cumulative = 0
+            for bound, n in zip(STAGE_BUCKETS, stats.buckets):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_stage_wall_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f"{prefix}_stage_wall_seconds_sum{{{label}}} {stats.wall_total:.9f}")
+            lines.append(f"{prefix}_stage_wall_seconds_count{{{label}}} {stats.count}")
+            lines.append(f"{prefix}_stage_cpu_seconds_sum{{{label}}} {stats.cpu_total:.9f}")
+            lines.append(f"{prefix}_stage_allocated_blocks_sum{{{label}}} {stats.allocations}")
+        for name in sorted(self.counters):
+            lines.append(f"{prefix}_{name}_total {self.counters[name]}")
+        return "\n".join(lines) + "\n"
+
+
+def measure_overhead(
+    instrumentation: Optional[Instrumentation] = None,
+    iterations: int = 100000
+) -> float:
+    """
+    Measure the cost of one instrumented stage plus one counter increment.
+    
+    Returns mean seconds per stage; with the default no-op instrumentation
+    this is the overhead every story pays when nothing is collected.
+    """
+    instrumentation = instrumentation or NULL_INSTRUMENTATION
+    stage = instrumentation.stage
+    count = instrumentation.count
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with stage("overhead"):
+            count("overhead")
+    return (time.perf_counter() - start) / iterations
+
+
+# ============================================================================
+# 8. GENERATOR CLASSES
 # ============================================================================
 
 class CharacterGenerator:
@@ -843,6 +1239,7 @@ class CharacterGenerator:
     
     def __init__(self, catalog: ArchetypeCatalog):
         self.catalog = catalog
+        self.rng = random
         
         # Name pools by archetype
         self.name_pools = {
@@ -880,7 +1277,7 @@ class CharacterGenerator:
     ) -> Character:
         """Generate a character from an archetype."""
         if seed:
-            random.seed(hashlib.md5(seed.encode()).digest())
+            self.rng.seed(seed_bytes(seed))
         
         metadata = self.catalog.get(archetype)
         
@@ -889,7 +1286,7 @@ class CharacterGenerator:
             char_name = name
         else:
             pool = self.name_pools.get(archetype.who, ["Alex"])
-            char_name = random.choice(pool)
+            char_name = self.rng.choice(pool)
             if archetype.who == WHO.WE:
                 char_name = f"{char_name} of {archetype.name}"
         
@@ -1066,6 +1463,8 @@ class PlotGenerator:
         self.character_gen = character_gen
         self.world_gen = world_gen
         self.transmutations = transmutation_catalog
+        self.rng = random
+        self.instrumentation = NULL_INSTRUMENTATION
         
         # Event description templates
         self.event_templates = {
@@ -1109,6 +1508,9 @@ class PlotGenerator:
             ]
         }
         
+        # Descriptions for changes with no event template
+        self.fallback_event_templates = ["Something shifts, subtly but profoundly"]
+        
         # Specific templates for known archetypes
         self.specific_templates = {
             GHOST: " as a stranger arrives from the east",
@@ -1126,45 +1528,49 @@ class PlotGenerator:
         complexity: int = 3
     ) -> NarrativeArc:
         """Generate a narrative arc from initial to target state."""
+        instrumentation = self.instrumentation
         
         # Generate protagonist
-        protagonist = self.character_gen.generate(
-            initial,
-            seed=protagonist_name,
-            name=protagonist_name
-        )
+        with instrumentation.stage("character_generation"):
+            protagonist = self.character_gen.generate(
+                initial,
+                seed=protagonist_name,
+                name=protagonist_name
+            )
         
         # Calculate required change
         required_change = initial ^ target
         
         # Decompose into steps
-        steps = self._decompose_change(required_change, complexity)
+        with instrumentation.stage("decomposition"):
+            steps = self._decompose_change(required_change, complexity)
         
         # Generate plot points
-        plot_points = []
-        current = initial
-        
-        for i, (impulse_bits, catalyst_bits) in enumerate(steps):
-            impulse = Archetype.from_bits(impulse_bits)
-            catalyst = Archetype.from_bits(catalyst_bits)
+        with instrumentation.stage("event_generation"):
+            plot_points = []
+            current = initial
             
-            # Generate event
-            event = self._generate_event(
-                current, impulse, catalyst, i+1
-            )
-            plot_points.append(event)
+            for i, (impulse_bits, catalyst_bits) in enumerate(steps):
+                impulse = Archetype.from_bits(impulse_bits)
+                catalyst = Archetype.from_bits(catalyst_bits)
+                
+                # Generate event
+                event = self._generate_event(
+                    current, impulse, catalyst, i+1
+                )
+                plot_points.append(event)
+                
+                # Update current state
+                current = current ^ impulse ^ catalyst
             
-            # Update current state
-            current = current ^ impulse ^ catalyst
-        
-        # Verify we reached target
-        if current != target:
-            # Fallback: direct transmutation
-            direct_event = self._generate_event(
-                initial, required_change, Archetype.from_bits("00 00 00"), 1
-            )
-            plot_points = [direct_event]
-            current = initial ^ required_change
+            # Verify we reached target
+            if current != target:
+                # Fallback: direct transmutation
+                direct_event = self._generate_event(
+                    initial, required_change, Archetype.from_bits("00 00 00"), 1
+                )
+                plot_points = [direct_event]
+                current = initial ^ required_change
         
         return NarrativeArc(
             protagonist=protagonist,
@@ -1173,6 +1579,43 @@ class PlotGenerator:
             plot_points=plot_points
         )
     
+    def arc_from_formula(
+        self,
+        formula: TransmutationFormula,
+        protagonist_name: Optional[str] = None
+    ) -> NarrativeArc:
+        """
+        Build the arc a master formula spells out: the impulse acts on
+        the initial state, then the catalyst completes the change.
+        
+        Args:
+            formula: Transmutation formula
+            protagonist_name: Optional name for protagonist
+            
+        Returns:
+            NarrativeArc with one plot point per formula step
+        """
+        with self.instrumentation.stage("character_generation"):
+            protagonist = self.character_gen.generate(
+                formula.initial,
+                seed=protagonist_name,
+                name=protagonist_name
+            )
+        
+        with self.instrumentation.stage("event_generation"):
+            touched = formula.initial ^ formula.impulse
+            plot_points = [
+                self._generate_event(formula.initial, formula.impulse, ZERO, 1),
+                self._generate_event(touched, ZERO, formula.catalyst, 2)
+            ]
+        
+        return NarrativeArc(
+            protagonist=protagonist,
+            initial_state=formula.initial,
+            final_state=formula.result,
+            plot_points=plot_points
+        )
+    
     def _decompose_change(
         self,
         required_change: Archetype,
@@ -1187,7 +1630,7 @@ class PlotGenerator:
         
         if complexity == 1 or required_int == 0:
             # Single step: required_change = impulse ⊕ catalyst
-            impulse_int = random.randint(0, 63)
+            impulse_int = self.rng.randint(0, 63)
             catalyst_int = required_int ^ impulse_int
             return [(int_to_bits(impulse_int), int_to_bits(catalyst_int))]
         
@@ -1198,21 +1641,21 @@ class PlotGenerator:
         # If required change is small, use it directly
         if required_int < 8:  # Small change
             step_size = required_int
-            impulse_int = random.randint(0, min(7, step_size))
+            impulse_int = self.rng.randint(0, min(7, step_size))
             catalyst_int = step_size ^ impulse_int
             steps.append((int_to_bits(impulse_int), int_to_bits(catalyst_int)))
             return steps
         
         # For larger changes, try to use master formula components
         # This is a simplified approach
-        step1_int = random.randint(1, 15)
+        step1_int = self.rng.randint(1, 15)
         step2_int = required_int ^ step1_int
         
-        impulse1 = random.randint(0, 63)
+        impulse1 = self.rng.randint(0, 63)
         catalyst1 = step1_int ^ impulse1
         steps.append((int_to_bits(impulse1), int_to_bits(catalyst1)))
         
-        impulse2 = random.randint(0, 63)
+        impulse2 = self.rng.randint(0, 63)
         catalyst2 = step2_int ^ impulse2
         steps.append((int_to_bits(impulse2), int_to_bits(catalyst2)))
         
@@ -1241,18 +1684,15 @@ class PlotGenerator:
         changed_key = ",".join(sorted(changed)) if changed else "None"
         
         # Get base description
-        base = self.event_templates.get(
-            changed_key,
-            ["Something shifts, subtly but profoundly"]
-        )
-        description = random.choice(base)
+        base = self.event_templates.get(changed_key, self.fallback_event_templates)
+        description = self.rng.choice(base)
         
         # Add specific details for known archetypes
         for archetype, template in self.specific_templates.items():
             if impulse == archetype:
                 description += template
                 break
-            elif catalyst == archetype and random.random() < 0.5:
+            elif catalyst == archetype and self.rng.random() < 0.5:
                 description += template
                 break
         
@@ -1280,6 +1720,7 @@ class StoryRenderer:
     
     def __init__(self):
         self.templates = self._load_templates()
+        self.rng = random
     
     def _load_templates(self) -> Dict[str, List[str]]:
         """Load story templates."""
@@ -1324,7 +1765,7 @@ class StoryRenderer:
         paragraphs = []
         
         # Opening
-        opening = random.choice(self.templates["opening"])
+        opening = self.rng.choice(self.templates["opening"])
         paragraphs.append(opening.format(
             setting=world.setting,
             protagonist=arc.protagonist.name,
@@ -1332,7 +1773,7 @@ class StoryRenderer:
         ))
         
         # Introduction of protagonist
-        intro = random.choice(self.templates["intro"]).format(
+        intro = self.rng.choice(self.templates["intro"]).format(
             name=arc.protagonist.name,
             archetype=arc.protagonist.attributes.get("archetype_name", "unknown"),
             motivation=arc.protagonist.attributes.get("motivation", "").lower(),
@@ -1343,19 +1784,19 @@ class StoryRenderer:
         # Plot points
         for i, event in enumerate(arc.plot_points):
             # Event description
-            event_text = random.choice(self.templates["event"]).format(
+            event_text = self.rng.choice(self.templates["event"]).format(
                 description=event.description
             )
             paragraphs.append(event_text)
             
             # Add reflection (except after last event)
             if i < len(arc.plot_points) - 1:
-                reflection = random.choice(self.templates["reflection"])
+                reflection = self.rng.choice(self.templates["reflection"])
                 paragraphs.append(reflection)
         
         # Closing
         final_state_name = arc.final_state.name
-        closing = random.choice(self.templates["closing"]).format(
+        closing = self.rng.choice(self.templates["closing"]).format(
             protagonist=arc.protagonist.name,
             final_state=final_state_name
         )
@@ -1365,13 +1806,20 @@ class StoryRenderer:
 
 
 # ============================================================================
-# 8. MAIN ENGINE
+# 9. MAIN ENGINE
 # ============================================================================
 
 class SUBITNarrativeEngine:
     """Main story generation engine."""
     
-    def __init__(self):
+    def __init__(self, instrumentation: Optional[Instrumentation] = None):
+        """
+        Initialize the engine.
+        
+        Args:
+            instrumentation: Optional hooks receiving per-stage timings and
+                counters (no-op if None)
+        """
         self.catalog = ArchetypeCatalog()
         self.transmutations = TransmutationCatalog()
         self.character_gen = CharacterGenerator(self.catalog)
@@ -1382,6 +1830,7 @@ class SUBITNarrativeEngine:
             self.transmutations
         )
         self.renderer = StoryRenderer()
+        self.set_instrumentation(instrumentation)
         
         # Title templates
         self.title_templates = [
@@ -1399,6 +1848,18 @@ class SUBITNarrativeEngine:
             "A {result_name} Story"
         ]
     
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        """Attach instrumentation hooks (None restores the no-op default)."""
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        if self.instrumentation.enabled:
+            self.rng = _CountingRNG(random, self.instrumentation)
+        else:
+            self.rng = random
+        self.character_gen.rng = self.rng
+        self.plot_gen.rng = self.rng
+        self.plot_gen.instrumentation = self.instrumentation
+        self.renderer.rng = self.rng
+    
     def generate_story(
         self,
         initial: Optional[Archetype] = None,
@@ -1407,7 +1868,8 @@ class SUBITNarrativeEngine:
         protagonist_name: Optional[str] = None,
         style: str = "magic_realism",
         complexity: int = 3,
-        seed: Optional[str] = None
+        seed: Optional[str] = None,
+        arc: Optional[NarrativeArc] = None
     ) -> Story:
         """
         Generate a complete story.
@@ -1420,69 +1882,85 @@ class SUBITNarrativeEngine:
             style: Literary style (unused in basic version)
             complexity: Number of plot points (1-5)
             seed: Random seed for reproducibility
+            arc: Precomputed arc (e.g. one a poem was written from); its
+                states override initial and target, and no arc is generated
             
         Returns:
             Complete Story object
         """
         
+        instrumentation = self.instrumentation
+        instrumentation.count("stories")
+        
         if seed:
-            random.seed(hashlib.md5(seed.encode()).digest())
+            self.rng.seed(seed_bytes(seed))
         
         # Determine initial and target states
-        formula = None
-        if formula_name:
-            formula = self.transmutations.find_by_name(formula_name)
-            if formula:
-                initial = formula.initial
-                target = formula.result
-        
-        if initial is None:
-            initial = self.catalog.random()
-        
-        if target is None:
-            # Pick a random target different from initial
-            targets = [a for a in self.catalog.all() if a != initial]
-            target = random.choice(targets) if targets else initial
+        with instrumentation.stage("target_selection"):
+            formula = None
+            if formula_name:
+                formula = self.transmutations.find_by_name(formula_name)
+                if formula:
+                    initial = formula.initial
+                    target = formula.result
+            
+            if arc is not None:
+                initial = arc.initial_state
+                target = arc.final_state
+            
+            if initial is None:
+                initial = self.rng.choice(self.catalog.all())
+            
+            if target is None:
+                # Pick a random target different from initial
+                targets = [a for a in self.catalog.all() if a != initial]
+                target = self.rng.choice(targets) if targets else initial
         
         # Generate world
-        world = self.world_gen.generate(initial)
-        
-        # Generate narrative arc
-        arc = self.plot_gen.generate_arc(
-            initial=initial,
-            target=target,
-            protagonist_name=protagonist_name,
-            complexity=complexity
-        )
+        with instrumentation.stage("world_generation"):
+            world = self.world_gen.generate(initial)
+        
+        # Generate narrative arc (character, decomposition and event stages)
+        if arc is None:
+            arc = self.plot_gen.generate_arc(
+                initial=initial,
+                target=target,
+                protagonist_name=protagonist_name,
+                complexity=complexity
+            )
         
         # Render story
-        text = self.renderer.render(arc, world)
+        with instrumentation.stage("rendering"):
+            text = self.renderer.render(arc, world)
         
         # Generate title
-        title = self._generate_title(arc, formula)
+        with instrumentation.stage("title"):
+            title = self._generate_title(arc, formula)
         
         # Collect metadata
-        metadata = {
-            "initial_state": initial.bits,
-            "final_state": target.bits,
-            "initial_name": initial.name,
-            "final_name": target.name,
-            "transmutations": [
-                {
-                    "step": i,
-                    "event": e.description,
-                    "bits_changed": e.bits_changed,
-                    "from": e.previous_state.bits,
-                    "to": e.new_state.bits,
-                    "from_name": e.previous_state.name,
-                    "to_name": e.new_state.name
-                }
-                for i, e in enumerate(arc.plot_points)
-            ],
-            "dramatic_tension": arc.dramatic_tension,
-            "style": style,
-            "complexity": complexity
-        }
+        with instrumentation.stage("metadata"):
+            metadata = {
+                "initial_state": initial.bits,
+                "final_state": target.bits,
+                "initial_name": initial.name,
+                "final_name": target.name,
+                "transmutations": [
+                    {
+                        "step": i,
+                        "event": e.description,
+                        "bits_changed": e.bits_changed,
+                        "from": e.previous_state.bits,
+                        "to": e.new_state.bits,
+                        "from_name": e.previous_state.name,
+                        "to_name": e.new_state.name
+                    }
+                    for i, e in enumerate(arc.plot_points)
+                ],
+                "dramatic_tension": arc.dramatic_tension,
+                "style": style,
+                "complexity": complexity,
+                "seed": seed
+            }
         
         if formula:
             metadata["formula"] = formula.name
@@ -1497,7 +1975,7 @@ class SUBITNarrativeEngine:
     
     def _generate_title(self, arc: NarrativeArc, formula: Optional[TransmutationFormula] = None) -> str:
         """Generate story title."""
-        template = random.choice(self.title_templates)
+        template = self.rng.choice(self.title_templates)
         
         # Try to get impulse and catalyst from first event if available
         impulse_name = "Stranger"
@@ -1515,6 +1993,16 @@ class SUBITNarrativeEngine:
             formula_name=formula.name if formula else "Change"
         )
     
+    def warm(self) -> None:
+        """
+        Build every lazily constructed table now.
+        
+        Call before forking workers so the tables are shared rather than
+        rebuilt in each child.
+        """
+        self.catalog.all()
+        self.transmutations.all()
+    
     def batch_generate(
         self,
         count: int,
@@ -1538,7 +2026,7 @@ class SUBITNarrativeEngine:
 
 
 # ============================================================================
-# 9. CONVENIENCE FUNCTIONS
+# 10. CONVENIENCE FUNCTIONS
 # ============================================================================
 
 def create_archetype(who: str, where: str, when: str) -> Archetype:
@@ -1566,24 +2054,9 @@ def generate_story(
     """Convenience function to generate a story."""
     engine = SUBITNarrativeEngine()
     
-    initial_arch = None
-    target_arch = None
-    
-    if initial:
-        if " " in initial:
-            initial_arch = Archetype.from_bits(initial)
-        else:
-            initial_arch = name_to_archetype(initial)
-    
-    if target:
-        if " " in target:
-            target_arch = Archetype.from_bits(target)
-        else:
-            target_arch = name_to_archetype(target)
-    
     return engine.generate_story(
-        initial=initial_arch,
-        target=target_arch,
+        initial=parse_archetype(initial) if initial else None,
+        target=parse_archetype(target) if target else None,
         formula_name=formula,
         protagonist_name=name,
         complexity=complexity
@@ -1591,7 +2064,7 @@ def generate_story(
 
 
 # ============================================================================
-# 10. EXAMPLE USAGE
+# 11. EXAMPLE USAGE
 # ============================================================================
 
 def example_philosopher_stone():
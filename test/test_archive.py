@@ -0,0 +1,123 @@
+"""
+test_archive.py
+Unit tests for story round trips through to_dict and the append-only
+story archive.
+
+Run with: pytest test_archive.py -v
+or: python -m unittest test_archive.py
+"""
+
+import unittest
+import os
+import tempfile
+from unittest import mock
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src import archive
+from src.archive import StoryArchive, StoryArchiveWriter, index_path
+from src.subit import SUBITNarrativeEngine, Story
+
+
+class TestFromDict(unittest.TestCase):
+    """Test rebuilding stories from their to_dict form."""
+
+    def test_round_trip(self):
+        """Test that from_dict inverts to_dict, derived fields included."""
+        engine = SUBITNarrativeEngine()
+        for seed in ("a", "b", "c"):
+            story = engine.generate_story(seed=seed, formula_name="Philosopher's Stone")
+            restored = Story.from_dict(story.to_dict())
+            self.assertEqual(restored.to_dict(), story.to_dict())
+            self.assertEqual(restored.arc.protagonist.current_state, story.arc.protagonist.current_state)
+            self.assertEqual(restored.arc.states, story.arc.states)
+
+
+class TestArchive(unittest.TestCase):
+    """Test writing, reading and recovering archives."""
+
+    @classmethod
+    def setUpClass(cls):
+        engine = SUBITNarrativeEngine()
+        cls.stories = [engine.generate_story(seed=str(i)) for i in range(40)]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "stories.sar")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_random_access_and_scan(self):
+        """Test reads by id, sequential scans and hydrated stories."""
+        self.assertEqual(Story.save_many(self.stories, self.path), range(0, 40))
+        with StoryArchive.open(self.path) as stories:
+            self.assertEqual(len(stories), 40)
+            for i in (0, 17, 39):
+                self.assertEqual(stories.read(i), self.stories[i].to_dict())
+            self.assertEqual(stories[5].text, self.stories[5].text)
+            self.assertEqual(list(stories.scan()), [s.to_dict() for s in self.stories])
+            self.assertEqual(len(list(stories.scan(30))), 10)
+            self.assertEqual(list(stories.scan(40)), [])
+            self.assertEqual([s.title for s in stories], [s.title for s in self.stories])
+            with self.assertRaises(IndexError):
+                stories.read(40)
+
+    def test_append_and_compress(self):
+        """Test that ids continue across writers and compressed records mix with plain ones."""
+        Story.save_many(self.stories[:10], self.path)
+        self.assertEqual(Story.save_many(self.stories[10:], self.path, compress=True), range(10, 40))
+        with StoryArchive.open(self.path) as stories:
+            self.assertEqual(list(stories.scan()), [s.to_dict() for s in self.stories])
+        plain = os.path.join(self.tmp.name, "plain.sar")
+        Story.save_many(self.stories, plain)
+        self.assertLess(os.path.getsize(self.path), os.path.getsize(plain) * 0.7)
+
+    def test_batched_fsync(self):
+        """Test that the data and index are synced once per batch."""
+        with mock.patch.object(archive.os, "fsync") as fsync:
+            with StoryArchiveWriter(self.path, sync_every=16) as writer:
+                for story in self.stories:
+                    writer.append(story)
+                self.assertEqual(fsync.call_count, 2 * 2)
+                with StoryArchive.open(self.path) as stories:
+                    self.assertEqual(len(stories), 32)
+            self.assertEqual(fsync.call_count, 3 * 2)
+
+    def test_crash_recovery(self):
+        """Test that an unindexed data tail and a torn index entry are cut off."""
+        Story.save_many(self.stories[:5], self.path)
+        size = os.path.getsize(self.path)
+        with open(self.path, "ab") as f:
+            f.write(b"\x10\x00\x00\x00\x00{\"tit")
+        with open(index_path(self.path), "ab") as f:
+            f.write(b"\x00\x01\x02")
+        with StoryArchiveWriter(self.path) as writer:
+            self.assertEqual(len(writer), 5)
+            self.assertEqual(os.path.getsize(self.path), size)
+            writer.append(self.stories[5])
+        with StoryArchive.open(self.path) as stories:
+            self.assertEqual([s.title for s in stories], [s.title for s in self.stories[:6]])
+
+    def test_not_an_archive(self):
+        """Test that foreign files and missing archives are rejected."""
+        with open(self.path, "wb") as f:
+            f.write(b"# A story\n")
+        with self.assertRaises(ValueError):
+            StoryArchiveWriter(self.path)
+        open(index_path(self.path), "wb").close()
+        with self.assertRaises(ValueError):
+            StoryArchive.open(self.path)
+        with self.assertRaises(FileNotFoundError):
+            StoryArchive.open(os.path.join(self.tmp.name, "missing.sar"))
+
+    def test_empty(self):
+        """Test an archive with no stories."""
+        self.assertEqual(Story.save_many([], self.path), range(0, 0))
+        with StoryArchive.open(self.path) as stories:
+            self.assertEqual(len(stories), 0)
+            self.assertEqual(list(stories), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
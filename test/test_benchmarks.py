@@ -0,0 +1,93 @@
+"""
+test_benchmarks.py
+Unit tests for the benchmark suite harness.
+
+Run with: pytest test_benchmarks.py -v
+or: python -m unittest test_benchmarks.py
+"""
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from benchmarks.cases import CASES, select
+from benchmarks.run import time_case, compare, load_baseline, BASELINE_PATH
+
+
+class TestBenchmarkCases(unittest.TestCase):
+    """Test that every registered case runs."""
+
+    def test_cases_run(self):
+        """Test each case factory and callable once."""
+        for name, (group, factory) in CASES.items():
+            with self.subTest(case=name):
+                factory()()
+
+    def test_select(self):
+        """Test case selection by name and group."""
+        self.assertEqual(select([]), list(CASES))
+        self.assertIn("archetype_xor", select(["archetype"]))
+        self.assertEqual(select(["find_path"]), ["find_path"])
+
+    def test_baseline_covers_cases(self):
+        """Test that the committed baseline has an entry for every case."""
+        baseline = load_baseline(BASELINE_PATH)
+        self.assertIsNotNone(baseline)
+        for name in CASES:
+            self.assertIn(name, baseline["results"])
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Test timing and baseline comparison."""
+
+    def test_time_case(self):
+        """Test timing output fields."""
+        result = time_case(lambda: None, repeat=2, min_time=0.001)
+        self.assertEqual(result["repeat"], 2)
+        self.assertGreaterEqual(result["loops"], 1)
+        self.assertLessEqual(result["min_ns"], result["median_ns"])
+
+    def test_compare_thresholds(self):
+        """Test default, per-case and overridden thresholds."""
+        baseline = {
+            "default_threshold": 0.25,
+            "noise_floor_ns": 0.0,
+            "thresholds": {"slow": 1.0},
+            "results": {"fast": {"min_ns": 100.0}, "slow": {"min_ns": 100.0}}
+        }
+        results = {"results": {
+            "fast": {"min_ns": 150.0},
+            "slow": {"min_ns": 150.0},
+            "added": {"min_ns": 10.0}
+        }}
+
+        rows = {r["name"]: r for r in compare(results, baseline)}
+        self.assertEqual(rows["fast"]["status"], "regressed")
+        self.assertEqual(rows["slow"]["status"], "ok")
+        self.assertEqual(rows["added"]["status"], "new")
+
+        rows = {r["name"]: r for r in compare(results, baseline, threshold=0.6)}
+        self.assertEqual(rows["fast"]["status"], "ok")
+
+    def test_compare_noise_floor(self):
+        """Test that slowdowns under the noise floor never regress."""
+        baseline = {
+            "default_threshold": 0.5,
+            "noise_floor_ns": 100.0,
+            "results": {"tiny": {"min_ns": 50.0}, "small": {"min_ns": 150.0}}
+        }
+        results = {"results": {"tiny": {"min_ns": 140.0}, "small": {"min_ns": 300.0}}}
+
+        rows = {r["name"]: r for r in compare(results, baseline)}
+        self.assertEqual(rows["tiny"]["status"], "ok")
+        self.assertEqual(rows["small"]["status"], "regressed")
+
+        rows = {r["name"]: r for r in compare(results, baseline, noise_floor_ns=0.0)}
+        self.assertEqual(rows["tiny"]["status"], "regressed")
+        rows = {r["name"]: r for r in compare(results, baseline, noise_floor_ns=200.0)}
+        self.assertEqual(rows["small"]["status"], "ok")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,362 @@
+"""
+test_dobre.py
+Unit tests for Dobre words: conversions, interning and XOR.
+
+Run with: pytest test_dobre.py -v
+or: python -m unittest test_dobre.py
+"""
+
+import unittest
+import copy
+import io
+import pickle
+import random
+import subprocess
+from functools import reduce
+from operator import xor
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.subit import WHO, Archetype
+from dobre.src.dobre import (
+    CODE_SYLLABLES, HERO_JOURNEY, SYLLABLE_BITS, XOR_TABLE, Dobre, DobrePhrase,
+    DobreTokenizer, PackedDecoder, canon_names, list_all_archetypes, PackedEncoder, iter_packed, pack_archetypes,
+    pack_codes, pack_text, phonetic_distance, reduce_phrases, resolve, resolve_transcript,
+    stream, unpack_archetypes, unpack_codes,
+    unpack_text, verify_transmutation
+)
+
+DOBRE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dobre", "src", "dobre.py")
+
+
+class TestDobreWord(unittest.TestCase):
+    """Test conversions against the SUBIT archetypes."""
+
+    def test_matches_archetypes(self):
+        """Test every code against Archetype.from_int."""
+        for code in range(64):
+            arch = Archetype.from_int(code)
+            word = Dobre.from_code(code)
+            self.assertEqual(word.to_code(), code)
+            self.assertEqual(word.to_bits(), arch.binary)
+            self.assertEqual(word.to_archetype(),
+                             (arch.who.value, arch.where.value, arch.when.value))
+            self.assertEqual(sum(SYLLABLE_BITS[s] << shift for s, shift
+                                 in zip(CODE_SYLLABLES[code], (4, 2, 0))), code)
+
+    def test_interned(self):
+        """Test that every constructor returns the one shared word."""
+        word = Dobre.from_code(44)
+        self.assertIs(Dobre("di", "bo", "ra"), word)
+        self.assertIs(Dobre.from_string(" di-bo-ra "), word)
+        self.assertIs(Dobre.from_archetype("ME", "SOUTH", "WINTER"), word)
+        self.assertIs(pickle.loads(pickle.dumps(word)), word)
+        self.assertIs(copy.deepcopy(word), word)
+        with self.assertRaises(AttributeError):
+            word.s1 = "da"
+
+    def test_hashable(self):
+        """Test words as set members and dict keys."""
+        words = {Dobre.from_code(code % 64) for code in range(200)}
+        self.assertEqual(len(words), 64)
+        self.assertEqual({Dobre.from_string("da-ba-ra"): 1}[Dobre.from_code(0)], 1)
+        self.assertNotEqual(Dobre.from_code(0), "da-ba-ra")
+
+    def test_invalid(self):
+        """Test the validation errors."""
+        for bad in ("bi-bi-ri", "di-bu-ri", "di-bi", "", "di-bi-ro-ra"):
+            with self.subTest(word=bad):
+                with self.assertRaises(ValueError):
+                    Dobre.from_string(bad)
+        for bad in (-1, 64):
+            with self.assertRaises(ValueError):
+                Dobre.from_code(bad)
+        with self.assertRaises(ValueError):
+            Dobre.from_archetype("ME", "UP", "SPRING")
+
+
+class TestArchetypeBridge(unittest.TestCase):
+    """Test conversion between Dobre words and SUBIT Archetypes."""
+
+    def test_shared_codes(self):
+        """Test that both directions agree with the integer code."""
+        for code in range(64):
+            arch = Archetype.from_int(code)
+            self.assertEqual(arch.int_value, int(arch.binary, 2))
+            self.assertIs(arch.dobre, Dobre.from_code(code))
+            self.assertEqual(arch.dobre.archetype, arch)
+            self.assertEqual(hash(arch), hash(Archetype.from_bits(arch.bits)))
+        self.assertEqual(WHO.ME.int_value, 2)
+        self.assertIsNot(Dobre.from_code(5).archetype, Dobre.from_code(5).archetype)
+
+    def test_canon_loaded_once(self):
+        """Test that the CANON catalog is read on first use only."""
+        rows = list_all_archetypes()
+        self.assertEqual(rows[0]["name"], "Zero")
+        self.assertNotIn("Unknown", [row["name"] for row in rows])
+        list_all_archetypes()
+        self.assertEqual(canon_names.cache_info().misses, 1)
+
+
+class TestFuzzy(unittest.TestCase):
+    """Test fuzzy resolution of noisy tokens."""
+
+    def test_phonetic_distance(self):
+        """Test edit costs."""
+        self.assertEqual(phonetic_distance("dibiri", "dibiri"), 0)
+        self.assertEqual(phonetic_distance("tibiri", "dibiri"), 0.5)
+        self.assertEqual(phonetic_distance("dibire", "dibiri"), 0.5)
+        self.assertEqual(phonetic_distance("dibiro", "dibiri"), 1)
+        self.assertEqual(phonetic_distance("dbiri", "dibiri"), 1)
+        self.assertEqual(phonetic_distance("", "abc"), 3)
+
+    def test_resolve(self):
+        """Test near misses from speech-to-text."""
+        cases = {"di-bi-ri": 0, "dibiri": 0, "Di Bi Ri": 0, "di-bi-rii": 0,
+                 "ti-bi-ri": 0.5, "di-pi-li": 1.0}
+        for token, distance in cases.items():
+            with self.subTest(token=token):
+                best = resolve(token)[0]
+                self.assertIs(best.word, Dobre.from_string("di-bi-ri"))
+                self.assertEqual(best.distance, distance)
+        self.assertEqual(str(resolve("di-bu-ri")[0].word), "di-bo-ri")
+        self.assertEqual(resolve("zzzzzz"), [])
+        self.assertEqual(resolve("di"), [])
+        ranked = resolve("di-bi-rx", limit=4)
+        self.assertEqual([str(m.word) for m in ranked],
+                         ["di-bi-ra", "di-bi-re", "di-bi-ri", "di-bi-ro"])
+        with self.assertRaises(ValueError):
+            resolve("di-bi-ri", max_distance=3)
+
+    def test_matches_brute_force(self):
+        """Test the index against ranking all 64 words."""
+        rng = random.Random(46)
+        letters = "dbrtplaeiou"
+        for _ in range(200):
+            token = "".join(rng.choice(letters) for _ in range(rng.randint(5, 7)))
+            if any(a == b for a, b in zip(token, token[1:])):
+                continue  # Doubled letters are collapsed before ranking
+            expected = sorted(
+                (phonetic_distance(token, "".join(CODE_SYLLABLES[code])), code)
+                for code in range(64))
+            expected = [(d, c) for d, c in expected if d <= 1.0]
+            found = [(m.distance, m.word.code) for m in resolve(token, 1.0, limit=64)]
+            self.assertEqual(found, expected, msg=token)
+
+    def test_transcript(self):
+        """Test batch resolution, leaving ties and misses unresolved."""
+        results = resolve_transcript("dibiri ta-ba-ra nonsense di-bi-rx")
+        self.assertEqual([r and str(r.word) for r in results],
+                         ["di-bi-ri", "da-ba-ra", None, None])
+
+
+class TestDobreXor(unittest.TestCase):
+    """Test XOR transmutation."""
+
+    def test_table(self):
+        """Test the XOR table against integer XOR."""
+        for a in range(64):
+            for b in range(0, 64, 7):
+                self.assertIs(Dobre.from_code(a) ^ Dobre.from_code(b), Dobre.from_code(a ^ b))
+                self.assertIs(XOR_TABLE[a][b], Dobre.from_code(a ^ b))
+
+    def test_formula(self):
+        """Test a canon formula and XOR with a non-word."""
+        self.assertTrue(verify_transmutation(HERO_JOURNEY))
+        with self.assertRaises(TypeError):
+            Dobre.from_code(1) ^ 1
+
+
+class TestTokenizer(unittest.TestCase):
+    """Test the streaming tokenizer."""
+
+    TEXT = "di-bi-ri  da-ba-ra\nde-bu-ro di-bi-rida-ba-ra do-bo-ro di-b"
+
+    def test_chunked_matches_whole(self):
+        """Test that every chunk size gives the same codes and errors."""
+        whole = DobreTokenizer()
+        expected = list(whole.tokenize(self.TEXT))
+        self.assertEqual(expected, [42, 0, 63])
+        for size in (1, 2, 3, 7, 64):
+            with self.subTest(chunk_size=size):
+                tokenizer = DobreTokenizer()
+                codes = list(tokenizer.tokenize(io.BytesIO(self.TEXT.encode()), size))
+                self.assertEqual(codes, expected)
+                self.assertEqual(tokenizer.errors, whole.errors)
+                self.assertEqual(tokenizer.offset, len(self.TEXT))
+
+    def test_error_offsets(self):
+        """Test that errors point at the first bad character and parsing continues."""
+        tokenizer = DobreTokenizer()
+        list(tokenizer.tokenize(io.StringIO(self.TEXT)))
+        offsets = [error.offset for error in tokenizer.errors]
+        self.assertEqual(offsets, [23, 36, len(self.TEXT)])
+        self.assertEqual([self.TEXT[o:o + 1] for o in offsets], ["u", "d", ""])
+        self.assertEqual(tokenizer.errors[0].token, "de-bu-ro")
+        self.assertIn("vowel", tokenizer.errors[0].message)
+        self.assertEqual(tokenizer.words, 3)
+
+    def test_strict(self):
+        """Test that strict mode raises at the first bad token."""
+        with self.assertRaisesRegex(ValueError, "offset 23"):
+            list(DobreTokenizer(strict=True).tokenize(self.TEXT))
+
+    def test_chunk_iterable(self):
+        """Test feeding from a generator of byte chunks."""
+        words = [str(Dobre.from_code(code)) for code in range(64)]
+        chunks = (word.encode() + b" " for word in words)
+        self.assertEqual(list(DobreTokenizer().tokenize(chunks)), list(range(64)))
+        self.assertEqual(list(DobreTokenizer().tokenize("")), [])
+
+
+class TestPhraseFold(unittest.TestCase):
+    """Test N-ary phrase reduction and range queries."""
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.codes = [rng.randrange(64) for _ in range(200)]
+        self.phrase = DobrePhrase.from_codes(self.codes)
+
+    def test_reduce(self):
+        """Test the fold against a word-by-word XOR."""
+        self.assertIs(self.phrase.reduce(), reduce(xor, self.phrase.words))
+        self.assertIs(DobrePhrase([]).reduce(), Dobre.from_code(0))
+        three = DobrePhrase.from_string("di-bi-ri da-ba-ra do-bo-ro")
+        self.assertIs(three.reduce(), three.transmute())
+
+    def test_xor_range(self):
+        """Test ranges against slicing."""
+        for start, end in [(0, 0), (0, 200), (5, 6), (17, 150), (199, 200)]:
+            expected = reduce(xor, self.codes[start:end], 0)
+            self.assertIs(self.phrase.xor_range(start, end), Dobre.from_code(expected))
+        for start, end in [(-1, 3), (3, 2), (0, 201)]:
+            with self.assertRaises(ValueError):
+                self.phrase.xor_range(start, end)
+
+    def test_from_codes(self):
+        """Test building from tokenizer output and rejecting bad codes."""
+        text = " ".join(str(word) for word in self.phrase.words)
+        self.assertEqual(str(DobrePhrase.from_codes(DobreTokenizer().tokenize(text))), text)
+        with self.assertRaises(ValueError):
+            DobrePhrase.from_codes([64])
+
+    def test_reduce_phrases(self):
+        """Test the batch API against per-phrase folds."""
+        lengths = [3, 0, 1, 50, 146]
+        results = reduce_phrases(bytes(self.codes), lengths)
+        start = 0
+        for length, result in zip(lengths, results):
+            self.assertEqual(result, reduce(xor, self.codes[start:start + length], 0))
+            start += length
+        self.assertEqual(len(reduce_phrases(bytes(self.codes), [10] * 5)), 5)
+        self.assertEqual(reduce_phrases(b"", []), b"")
+        for bad in ([201], [3, -1]):
+            with self.assertRaises(ValueError):
+                reduce_phrases(bytes(self.codes), bad)
+        with self.assertRaises(ValueError):
+            reduce_phrases(b"\x40", [1])
+
+
+class TestPackedCodec(unittest.TestCase):
+    """Test the 6-bit packed codec."""
+
+    def setUp(self):
+        rng = random.Random(43)
+        self.codes = bytes(rng.randrange(64) for _ in range(20000))
+
+    def test_layout(self):
+        """Test the bit layout and the padding byte."""
+        self.assertEqual(pack_codes([0, 1, 2, 63]), bytes([0b00000000, 0b00010000, 0b10111111, 0]))
+        self.assertEqual(pack_codes([63]), bytes([0b11111100, 0, 0, 3]))
+        self.assertEqual(pack_codes([]), b"\x00")
+
+    def test_round_trips(self):
+        """Test every tail length, and a buffer spanning several iter windows."""
+        for n in list(range(9)) + [len(self.codes)]:
+            with self.subTest(count=n):
+                codes = self.codes[:n]
+                packed = pack_codes(codes)
+                self.assertEqual(len(packed), (n + 3) // 4 * 3 + 1)
+                self.assertEqual(unpack_codes(packed), codes)
+                self.assertEqual(bytes(iter_packed(memoryview(bytearray(packed)))), codes)
+
+    def test_streaming(self):
+        """Test that chunked encoding and decoding match the bulk functions."""
+        codes = self.codes[:1001]
+        packed = pack_codes(codes)
+        for size in (1, 2, 5, 300):
+            with self.subTest(chunk_size=size):
+                encoder = PackedEncoder()
+                out = b"".join(encoder.feed(codes[i:i + size]) for i in range(0, len(codes), size))
+                self.assertEqual(out + encoder.close(), packed)
+                self.assertEqual(encoder.count, len(codes))
+                decoder = PackedDecoder()
+                out = b"".join(decoder.feed(packed[i:i + size]) for i in range(0, len(packed), size))
+                self.assertEqual(out + decoder.close(), codes)
+
+    def test_errors(self):
+        """Test bad codes, truncation and bad padding."""
+        with self.assertRaises(ValueError):
+            pack_codes([64])
+        packed = pack_codes(self.codes[:10])
+        for bad in (packed[:-1], packed[:-2], b"", b"\x00\x00\x00\x04", b"\x01"):
+            with self.subTest(packed=bad):
+                with self.assertRaises(ValueError):
+                    unpack_codes(bad)
+
+    def test_text_and_archetypes(self):
+        """Test bulk conversion to and from Dobre text and Archetypes."""
+        text = " ".join(str(Dobre.from_code(code)) for code in self.codes[:999])
+        packed = pack_text(text)
+        self.assertEqual(unpack_codes(packed), self.codes[:999])
+        self.assertEqual(unpack_text(packed), text)
+        self.assertLess(len(packed) * 10, len(text))
+        with self.assertRaises(ValueError):
+            pack_text("di-bi-ri du-ba-ra")
+        archetypes = [Archetype.from_int(code) for code in self.codes[:99]]
+        self.assertEqual(unpack_archetypes(pack_archetypes(archetypes)), archetypes)
+
+
+class TestStream(unittest.TestCase):
+    """Test the CLI stream mode."""
+
+    INPUT = "42\n101010\nME EAST SPRING\nme-east-spring\n di-bi-ri \n" \
+            "di-bi-ri da-ba-ra do-bo-ro\n\nnope\n0\n"
+
+    def test_formats(self):
+        """Test format detection, phrase folding and line alignment."""
+        out, err = io.StringIO(), io.StringIO()
+        self.assertEqual(stream(io.StringIO(self.INPUT), out, err, batch=2), 1)
+        rows = out.getvalue().split("\n")
+        self.assertEqual(rows[:5], ["di-bi-ri\t42\t101010\tME-EAST-SPRING"] * 5)
+        self.assertEqual(rows[5], "de-be-re\t21\t010101\tYOU-WEST-AUTUMN")
+        self.assertEqual(rows[6:8], ["", ""])
+        self.assertEqual(rows[8], "da-ba-ra\t0\t000000\tTHEY-NORTH-WINTER")
+        self.assertIn("line 8", err.getvalue())
+
+    def test_spacing(self):
+        """Test that runs of whitespace inside a line are ignored."""
+        out = io.StringIO()
+        lines = io.StringIO("me  east\tspring\ndi-bi-ri   da-ba-ra\n")
+        self.assertEqual(stream(lines, out, io.StringIO()), 0)
+        self.assertEqual(out.getvalue().split("\n")[:2], ["di-bi-ri\t42\t101010\tME-EAST-SPRING"] * 2)
+
+    def test_spaced_bits(self):
+        """Test SUBIT's spaced bit format (Archetype.bits)."""
+        out = io.StringIO()
+        self.assertEqual(stream(io.StringIO("10 10 10\n11  01 11\n"), out, io.StringIO()), 0)
+        rows = out.getvalue().split("\n")
+        self.assertEqual(rows[0], "di-bi-ri\t42\t101010\tME-EAST-SPRING")
+        self.assertEqual(rows[1].split("\t")[2], "110111")
+
+    def test_cli(self):
+        """Test the --stream flag end to end, with nothing but rows on stdout."""
+        result = subprocess.run([sys.executable, DOBRE_SCRIPT, "--stream"], input="63\nbad\n",
+                                capture_output=True, text=True)
+        self.assertEqual(result.stdout, "do-bo-ro\t63\t111111\tWE-SOUTH-SUMMER\n\n")
+        self.assertEqual(result.returncode, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
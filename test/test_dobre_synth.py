@@ -0,0 +1,156 @@
+"""
+test_dobre_synth.py
+Unit tests for the offline Dobre synthesizer: caches, rendering and
+streamed WAV output.
+
+Run with: pytest test_dobre_synth.py -v
+or: python -m unittest test_dobre_synth.py
+"""
+
+import unittest
+import io
+import subprocess
+import tempfile
+import wave
+from unittest import mock
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from dobre.src import synth
+from dobre.src.dobre import DOBRE_SYLLABLES, Dobre, DobrePhrase
+from dobre.src.synth import DobreSynth
+
+SYNTH_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dobre", "src", "synth.py")
+
+
+class WriteOnly:
+    """A pipe-like binary target that cannot seek."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+    def flush(self):
+        pass
+
+
+def read_wav(data):
+    with wave.open(io.BytesIO(data)) as wav:
+        return wav.getparams(), wav.readframes(wav.getnframes())
+
+
+class TestCaches(unittest.TestCase):
+    """Test the syllable and word caches."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.synth = DobreSynth()
+
+    def test_syllables(self):
+        """Test that the 12 syllables are distinct and equally long."""
+        syllables = self.synth.syllables
+        self.assertEqual(list(syllables), DOBRE_SYLLABLES)
+        self.assertEqual(len(set(syllables.values())), 12)
+        self.assertEqual(len({len(pcm) for pcm in syllables.values()}), 1)
+
+    def test_words(self):
+        """Test that the 64 words are distinct, equally long and end in silence."""
+        words = self.synth.words
+        self.assertEqual(len(set(words)), 64)
+        self.assertEqual({len(pcm) for pcm in words}, {2 * self.synth.word_frames})
+        self.assertEqual(words[42][-100:], bytes(100))
+        self.assertIs(self.synth.word("di-bi-ri"), words[42])
+        self.assertIs(self.synth.word(Dobre.from_code(7)), words[7])
+        with self.assertRaises(ValueError):
+            self.synth.word(64)
+
+    @unittest.skipIf(synth.np is None, "NumPy not installed")
+    def test_backends_agree(self):
+        """Test that the pure-Python fallback renders the same PCM as NumPy."""
+        with mock.patch.object(synth, "np", None):
+            fallback = DobreSynth(rate=8000)
+        self.assertEqual(DobreSynth(rate=8000).words, fallback.words)
+
+    def test_parameters(self):
+        """Test parameter validation."""
+        for kwargs in ({"rate": 4000}, {"pitch": 20}, {"syllable_seconds": 0.05},
+                       {"pause_seconds": -1}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                DobreSynth(**kwargs)
+        slow = DobreSynth(rate=8000, syllable_seconds=0.3, pause_seconds=0.0)
+        self.assertGreater(slow.word_frames, 3 * 0.2 * 8000)
+
+
+class TestRendering(unittest.TestCase):
+    """Test phrase sources, chunking and WAV output."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.synth = DobreSynth(rate=8000)
+
+    def test_sources(self):
+        """Test that text, files, phrases, words and codes render alike."""
+        text = "di-bi-ri da-ba-ra\ndo-bo-ro"
+        expected = self.synth.words[42] + self.synth.words[0] + self.synth.words[63]
+        sources = [text, io.StringIO(text), io.BytesIO(text.encode()),
+                   DobrePhrase.from_string(text), [Dobre.from_code(42), 0, 63], bytes([42, 0, 63])]
+        for source in sources:
+            with self.subTest(source=type(source).__name__):
+                self.assertEqual(self.synth.render(source), expected)
+
+    def test_chunks(self):
+        """Test chunk sizes and that chunks join to the whole phrase."""
+        codes = bytes(range(64)) * 3
+        chunks = list(self.synth.chunks(codes, 50))
+        self.assertEqual([len(c) // (2 * self.synth.word_frames) for c in chunks], [50, 50, 50, 42])
+        self.assertEqual(b"".join(chunks), self.synth.render(codes))
+
+    def test_bad_input(self):
+        """Test that bad tokens, codes and chunk sizes are rejected."""
+        with self.assertRaises(ValueError):
+            self.synth.render("di-bi-ri du-bu-ru")
+        with self.assertRaises(ValueError):
+            self.synth.render([1, 64])
+        with self.assertRaises(ValueError):
+            list(self.synth.chunks([1], 0))
+
+    def test_write_wav_seekable(self):
+        """Test a WAV of unknown length, with the header patched on close."""
+        out = io.BytesIO()
+        codes = bytes(range(64)) * 5
+        frames = self.synth.write_wav(iter(codes), out, chunk_words=7)
+        self.assertEqual(frames, 320 * self.synth.word_frames)
+        params, pcm = read_wav(out.getvalue())
+        self.assertEqual((params.nchannels, params.sampwidth, params.framerate, params.nframes),
+                         (1, 2, 8000, frames))
+        self.assertEqual(pcm, self.synth.render(codes))
+
+    def test_write_wav_pipe(self):
+        """Test that a phrase of known length streams to a target that cannot seek."""
+        out = WriteOnly()
+        phrase = DobrePhrase.from_codes(range(64))
+        frames = self.synth.write_wav(phrase, out, chunk_words=10)
+        params, pcm = read_wav(out.buffer.getvalue())
+        self.assertEqual(params.nframes, frames)
+        self.assertEqual(pcm, self.synth.render(phrase))
+
+    def test_cli(self):
+        """Test rendering stdin to a file from the command line."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chant.wav")
+            result = subprocess.run([sys.executable, SYNTH_SCRIPT, "-", path, "--rate", "8000"],
+                                    input=b"di-bi-ri da-ba-ra", capture_output=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            with open(path, "rb") as f:
+                self.assertEqual(read_wav(f.read())[1], self.synth.render([42, 0]))
+            result = subprocess.run([sys.executable, SYNTH_SCRIPT, "-", path],
+                                    input=b"di-bi-ri zz", capture_output=True)
+            self.assertEqual(result.returncode, 1)
+            self.assertIn(b"offset 9", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
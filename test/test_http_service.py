@@ -0,0 +1,242 @@
+"""
+test_http_service.py
+Unit tests for the SUBIT HTTP service and its generation pool.
+
+Run with: pytest test_http_service.py -v
+or: python -m unittest test_http_service.py
+"""
+
+import unittest
+import http.client
+import json
+import threading
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.service import MAX_LINE_COUNT, SUBITService
+from src.http_service import GenerationPool, Overloaded, SUBITHTTPServer
+
+
+class TestServiceOperations(unittest.TestCase):
+    """Test the path, formula and Dobre operations."""
+
+    def setUp(self):
+        self.service = SUBITService()
+
+    def test_path(self):
+        """Test that every returned path reaches the end state."""
+        result = self.service.handle("path", {"start": "Pioneer", "end": "11 00 10",
+                                              "max_steps": 1})
+        self.assertEqual(result["start"], "10 10 10")
+        self.assertTrue(result["paths"])
+        start = int(result["start"].replace(" ", ""), 2)
+        for path in result["paths"]:
+            state = start
+            for step in path:
+                state ^= int(step["impulse"].replace(" ", ""), 2)
+                state ^= int(step["catalyst"].replace(" ", ""), 2)
+            self.assertEqual(state, 0b110010)
+        with self.assertRaises(ValueError):
+            self.service.handle("path", {"start": "Pioneer", "end": "Pioneer", "max_steps": 9})
+
+    def test_formula(self):
+        """Test formula lookup by name and listing."""
+        self.assertEqual(self.service.handle("formula", {"name": "Healing"})["name"], "Healing")
+        self.assertEqual(len(self.service.handle("formula")), 12)
+        with self.assertRaises(ValueError):
+            self.service.handle("formula", {"name": "Nothing"})
+
+    def test_story_poem(self):
+        """Test that the story and poem share one generated arc."""
+        calls = []
+        plot_gen = self.service.engine.plot_gen
+        generate_arc = plot_gen.generate_arc
+        plot_gen.generate_arc = lambda *a, **k: calls.append(a) or generate_arc(*a, **k)
+        result = self.service.handle("story_poem", {"formula_name": "Healing",
+                                                    "seed": "s", "form": "haiku"})
+        self.assertEqual(len(calls), 1)
+        states = [result["story"]["arc"]["initial_state"]] + [
+            e["new_state"] for e in result["story"]["arc"]["plot_points"]]
+        self.assertEqual([s["bits"] for s in result["poem"]["metadata"]["states"]], states)
+        with self.assertRaises(ValueError):
+            self.service.handle("story_poem", {"mood": "grim"})
+
+    def test_dobre(self):
+        """Test that every input form translates to the same word."""
+        forms = [
+            {"word": "di-bi-ri"},
+            {"code": 42},
+            {"bits": "101010"},
+            {"archetype": "Pioneer"},
+            {"who": "me", "where": "east", "when": "spring"},
+        ]
+        for args in forms:
+            with self.subTest(args=args):
+                result = self.service.handle("dobre", args)
+                self.assertEqual(result["dobre"], "di-bi-ri")
+                self.assertEqual(result["code"], 42)
+        with self.assertRaises(ValueError):
+            self.service.handle("dobre", {})
+
+    def test_dobre_types(self):
+        """Test that non-string words, bits and dimensions are rejected as invalid."""
+        for args in ({"word": 5}, {"bits": 101010}, {"who": 1, "where": "east", "when": "spring"}):
+            with self.subTest(args=args), self.assertRaises(ValueError):
+                self.service.handle("dobre", args)
+
+    def test_line_count_limit(self):
+        """Test that line_count is bounded by MAX_LINE_COUNT."""
+        poem = self.service.handle("poem", {"archetype": "Pioneer", "line_count": MAX_LINE_COUNT})
+        self.assertEqual(len(poem["text"].split("\n")), MAX_LINE_COUNT)
+        for op, args in (("poem", {"archetype": "Pioneer", "line_count": MAX_LINE_COUNT + 1}),
+                         ("poem", {"archetype": "Pioneer", "line_count": 0}),
+                         ("story_poem", {"line_count": 200000})):
+            with self.subTest(op=op, args=args), self.assertRaises(ValueError):
+                self.service.handle(op, args)
+
+    def test_seed_type(self):
+        """Test that a non-string seed is rejected as invalid."""
+        for op in ("story", "story_poem"):
+            with self.subTest(op=op), self.assertRaises(ValueError):
+                self.service.handle(op, {"seed": 5})
+
+
+class TestGenerationPool(unittest.TestCase):
+    """Test admission control on a thread pool."""
+
+    def test_overload(self):
+        """Test that submissions beyond workers + queue_limit are rejected."""
+        pool = GenerationPool(workers=1, queue_limit=1, processes=False)
+        gate = threading.Event()
+        pool.service.handlers["wait"] = lambda args: gate.wait()
+        try:
+            first = pool.submit("wait", {})
+            second = pool.submit("wait", {})
+            with self.assertRaises(Overloaded):
+                pool.submit("wait", {})
+            self.assertEqual(pool.stats()["rejected"], 1)
+            gate.set()
+            first.result()
+            second.result()
+            self.assertEqual(pool.run("formula", {"name": "Healing"})["name"], "Healing")
+        finally:
+            gate.set()
+            pool.shutdown()
+
+    def test_stream_order(self):
+        """Test that streamed results come back in request order."""
+        pool = GenerationPool(workers=2, queue_limit=0, processes=False)
+        try:
+            items = [{"code": i} for i in range(10)] + [{"code": "x"}]
+            outcomes = list(pool.stream("dobre", items))
+        finally:
+            pool.shutdown()
+        self.assertEqual([o[0] for o in outcomes], list(range(11)))
+        self.assertEqual([o[2]["code"] for o in outcomes[:10]], list(range(10)))
+        self.assertFalse(outcomes[10][1])
+
+    def test_stream_internal_error(self):
+        """Test that an unexpected exception fails only its own item."""
+        pool = GenerationPool(workers=2, queue_limit=0, processes=False)
+        pool.service.handlers["flaky"] = lambda args: args["ok"] or {}.pop("missing")
+        try:
+            outcomes = list(pool.stream("flaky", [{"ok": 1}, {"ok": 0}, {"ok": 2}]))
+        finally:
+            pool.shutdown()
+        self.assertEqual([o[1] for o in outcomes], [True, False, True])
+        self.assertIn("Internal error: KeyError", outcomes[1][2])
+
+
+class TestHTTPServer(unittest.TestCase):
+    """Test the HTTP endpoints over one keep-alive connection."""
+
+    @classmethod
+    def setUpClass(cls):
+        pool = GenerationPool(workers=2, queue_limit=4)
+        cls.server = SUBITHTTPServer(("127.0.0.1", 0), pool)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.conn = http.client.HTTPConnection(*self.server.server_address, timeout=30)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def request(self, method, path, body=None):
+        payload = json.dumps(body) if body is not None else None
+        self.conn.request(method, path, body=payload)
+        response = self.conn.getresponse()
+        return response, response.read()
+
+    def test_keep_alive(self):
+        """Test several endpoints on one connection."""
+        response, body = self.request("POST", "/story",
+                                      {"formula_name": "Philosopher's Stone", "seed": "x"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(body)["metadata"]["formula"], "Philosopher's Stone")
+        sock = self.conn.sock
+        response, body = self.request("GET", "/dobre?word=di-bi-ri")
+        self.assertEqual(json.loads(body)["name"], "Pioneer")
+        response, body = self.request("GET", "/formula?name=Healing")
+        self.assertEqual(json.loads(body)["name"], "Healing")
+        response, body = self.request("GET", "/path?start=Pioneer&end=11+00+10&max_steps=1")
+        self.assertTrue(json.loads(body)["paths"])
+        self.assertIs(self.conn.sock, sock)
+
+    def test_seeded_story_reproducible(self):
+        """Test that seeded stories match across workers."""
+        texts = {json.loads(self.request("POST", "/story", {"seed": "salt"})[1])["text"]
+                 for _ in range(4)}
+        self.assertEqual(len(texts), 1)
+
+    def test_errors(self):
+        """Test 400 and 404 responses."""
+        response, body = self.request("POST", "/poem", {"archetype": "Nobody"})
+        self.assertEqual(response.status, 400)
+        self.assertIn("Nobody", json.loads(body)["error"])
+        response, _ = self.request("GET", "/nowhere")
+        self.assertEqual(response.status, 404)
+        self.conn.request("POST", "/story", body="{not json")
+        response = self.conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 400)
+        response, body = self.request("POST", "/story", {"seed": 5})
+        self.assertEqual(response.status, 400)
+        self.assertIn("seed", json.loads(body)["error"])
+
+    def test_batch_stream(self):
+        """Test a chunked batch response."""
+        response, body = self.request("POST", "/batch/poem", {
+            "items": [{"archetype": "Pioneer", "form": "haiku"}] * 3 + [{"archetype": "?"}]
+        })
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r["index"] for r in records], [0, 1, 2, 3])
+        self.assertEqual([r["ok"] for r in records], [True, True, True, False])
+        self.assertEqual(len(records[0]["result"]["text"].split("\n")), 3)
+
+    def test_batch_bad_seed(self):
+        """Test that a bad item in a story batch does not end the stream."""
+        response, body = self.request("POST", "/batch/story", {
+            "items": [{"seed": "a"}, {"seed": 5}, {"seed": "b"}]
+        })
+        self.assertEqual(response.status, 200)
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r["ok"] for r in records], [True, False, True])
+
+    def test_batch_limit(self):
+        """Test that oversized batches are rejected."""
+        response, _ = self.request("POST", "/batch/story", {"count": 10 ** 6})
+        self.assertEqual(response.status, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
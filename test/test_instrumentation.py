@@ -0,0 +1,99 @@
+"""
+test_instrumentation.py
+Unit tests for the SUBIT Narrative Engine instrumentation hooks.
+
+Run with: pytest test_instrumentation.py -v
+or: python -m unittest test_instrumentation.py
+"""
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.subit import (
+    SUBITNarrativeEngine,
+    Instrumentation, HistogramInstrumentation, NULL_INSTRUMENTATION,
+    STORY_STAGES, measure_overhead
+)
+
+
+class TestNullInstrumentation(unittest.TestCase):
+    """Test the no-op default."""
+
+    def test_default_is_noop(self):
+        """Test that engines use the shared no-op instrumentation by default."""
+        engine = SUBITNarrativeEngine()
+        self.assertIs(engine.instrumentation, NULL_INSTRUMENTATION)
+        self.assertFalse(engine.instrumentation.enabled)
+
+    def test_noop_stage(self):
+        """Test that the no-op stage is reusable and records nothing."""
+        inst = Instrumentation()
+        with inst.stage("anything"):
+            inst.count("anything")
+        self.assertIs(inst.stage("a"), inst.stage("b"))
+
+    def test_measure_overhead(self):
+        """Test that overhead measurement returns a small positive number."""
+        overhead = measure_overhead(iterations=1000)
+        self.assertGreater(overhead, 0.0)
+        self.assertLess(overhead, 0.001)
+
+
+class TestHistogramInstrumentation(unittest.TestCase):
+    """Test per-stage histograms and counters."""
+
+    def setUp(self):
+        self.inst = HistogramInstrumentation()
+        self.engine = SUBITNarrativeEngine(instrumentation=self.inst)
+
+    def test_all_stages_recorded(self):
+        """Test that every story stage is timed once per story."""
+        for _ in range(5):
+            self.engine.generate_story()
+
+        for stage in STORY_STAGES:
+            self.assertIn(stage, self.inst.stages)
+            stats = self.inst.stages[stage]
+            self.assertEqual(stats.count, 5)
+            self.assertEqual(sum(stats.buckets), 5)
+            self.assertGreaterEqual(stats.wall_total, 0.0)
+
+    def test_counters(self):
+        """Test story and RNG draw counters."""
+        self.engine.generate_story()
+        self.engine.generate_story()
+        self.assertEqual(self.inst.counters["stories"], 2)
+        self.assertGreater(self.inst.counters["rng_draws"], 0)
+
+    def test_seeded_output_unchanged(self):
+        """Test that instrumentation does not change seeded output."""
+        plain = SUBITNarrativeEngine().generate_story(seed="salt")
+        measured = self.engine.generate_story(seed="salt")
+        self.assertEqual(plain.text, measured.text)
+        self.assertEqual(plain.title, measured.title)
+
+    def test_text_dump(self):
+        """Test plain-text metrics dump."""
+        self.engine.generate_story()
+        text = self.inst.to_text()
+        self.assertIn('subit_stage_wall_seconds_count{stage="rendering"} 1', text)
+        self.assertIn('le="+Inf"', text)
+        self.assertIn("subit_stories_total 1", text)
+
+    def test_reset(self):
+        """Test discarding measurements."""
+        self.engine.generate_story()
+        self.inst.reset()
+        self.assertEqual(self.inst.to_dict(), {"stages": {}, "counters": {}})
+
+    def test_detach(self):
+        """Test restoring the no-op default."""
+        self.engine.set_instrumentation(None)
+        self.engine.generate_story()
+        self.assertEqual(self.inst.counters, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
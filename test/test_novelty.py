@@ -0,0 +1,157 @@
+"""
+test_novelty.py
+Unit tests for shingling, MinHash, the Bloom filters and the streaming
+novelty filter.
+
+Run with: pytest test_novelty.py -v
+or: python -m unittest test_novelty.py
+"""
+
+import unittest
+import io
+import json
+import random
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.novelty import (
+    BloomFilter, NoveltyFilter, ScalableBloomFilter,
+    lsh_bands, minhash, shingles
+)
+from src.subit import SUBITNarrativeEngine
+from src.poetry.subit_poetry import SUBITPoetryEngine
+
+
+def jaccard(a, b):
+    a, b = set(a), set(b)
+    return len(a & b) / len(a | b)
+
+
+class TestSignatures(unittest.TestCase):
+    """Test shingles and MinHash signatures."""
+
+    def test_shingles(self):
+        """Test normalization, window count and short texts."""
+        self.assertEqual(shingles("The cat, the HAT!", 2), shingles("the cat the hat", 2))
+        self.assertEqual(len(shingles("a b c d e", 3)), 3)
+        self.assertEqual(len(shingles("a b", 3)), 1)
+        self.assertEqual(shingles("", 3), [])
+        self.assertNotEqual(shingles("a b c", 3), shingles("c b a", 3))
+
+    def test_minhash_estimates_jaccard(self):
+        """Test that signature agreement tracks Jaccard similarity."""
+        rng = random.Random(5)
+        base = [rng.getrandbits(64) for _ in range(400)]
+        other = base[:300] + [rng.getrandbits(64) for _ in range(100)]
+        a, b = minhash(base, 256), minhash(other, 256)
+        agreement = sum(x == y for x, y in zip(a, b)) / 256
+        self.assertAlmostEqual(agreement, jaccard(base, other), delta=0.1)
+        self.assertEqual(minhash(base, 64), minhash(list(reversed(base)), 64))
+        self.assertEqual(len(minhash(base[:3], 64)), 64)
+        self.assertEqual(minhash([], 64), ())
+
+    def test_lsh_bands(self):
+        """Test band choice and threshold validation."""
+        self.assertEqual(lsh_bands(64, 0.7), (8, 8))
+        self.assertEqual(lsh_bands(64, 0.5), (16, 4))
+        with self.assertRaises(ValueError):
+            lsh_bands(64, 1.5)
+
+
+class TestBloom(unittest.TestCase):
+    """Test fixed and scalable Bloom filters."""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is found."""
+        bloom = BloomFilter(1000, 0.01)
+        items = [random.getrandbits(64) for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+        self.assertTrue(all(item in bloom for item in items))
+
+    def test_false_positive_rate(self):
+        """Test the false-positive rate at capacity."""
+        bloom = BloomFilter(2000, 0.01)
+        for item in range(2000):
+            bloom.add(item * 0x9E3779B97F4A7C15 & (1 << 64) - 1)
+        hits = sum((item * 0xC2B2AE3D27D4EB4F & (1 << 64) - 1) in bloom
+                   for item in range(1, 20001))
+        self.assertLess(hits / 20000, 0.03)
+
+    def test_scalable_growth(self):
+        """Test that slices are added as items arrive and all are searched."""
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        items = [random.getrandbits(64) for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+        self.assertEqual(len(bloom), 1000)
+        self.assertEqual(len(bloom.slices), 4)
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertLess(bloom.slices[-1].error_rate, bloom.slices[0].error_rate)
+
+
+class TestNoveltyFilter(unittest.TestCase):
+    """Test near-duplicate rejection on engine output."""
+
+    def setUp(self):
+        self.poetry = SUBITPoetryEngine()
+
+    def test_rejects_near_duplicates(self):
+        """Test exact and lightly edited copies."""
+        novelty = NoveltyFilter()
+        poems = [self.poetry.generate_free_verse("Ghost", 12, seed=i) for i in range(50)]
+        for poem in poems:
+            novelty.add(poem)
+        self.assertFalse(novelty.add(poems[0]))
+        edited = 0
+        for poem in poems:
+            words = poem.split(" ")
+            words[len(words) // 2] = "otherwise"
+            edited += not novelty.is_novel(" ".join(words))
+        self.assertGreater(edited, 40)
+        self.assertEqual(novelty.rejected, 1)
+
+    def test_keeps_distinct_poems(self):
+        """Test that unrelated poems from one archetype mostly pass."""
+        novelty = NoveltyFilter()
+        poems = [self.poetry.generate_free_verse("Ghost", 12, seed=i) for i in range(500)]
+        kept = list(novelty.filter(poems))
+        self.assertGreater(len(kept), 450)
+        self.assertEqual(novelty.stats()["bloom_slices"], 1)
+
+    def test_generate_regenerates(self):
+        """Test that generate retries until a novel text appears."""
+        novelty = NoveltyFilter()
+        novelty.add("one two three four five six seven eight nine")
+        candidates = iter(["one two three four five six seven eight nine",
+                           "ten eleven twelve thirteen fourteen fifteen sixteen seventeen"])
+        self.assertIn("ten", novelty.generate(lambda: next(candidates)))
+        with self.assertRaises(ValueError):
+            novelty.generate(lambda: "ten eleven twelve thirteen fourteen fifteen sixteen "
+                                     "seventeen", max_attempts=3)
+
+    def test_stories(self):
+        """Test regenerating stories by text."""
+        engine = SUBITNarrativeEngine()
+        novelty = NoveltyFilter()
+        seeds = iter(["one", "one", "two"])
+        first = novelty.generate(lambda: engine.generate_story(seed=next(seeds)),
+                                 key=lambda s: s.text)
+        second = novelty.generate(lambda: engine.generate_story(seed=next(seeds)),
+                                  key=lambda s: s.text)
+        self.assertNotEqual(first.text, second.text)
+        self.assertEqual(novelty.rejected, 1)
+
+    def test_write_batch(self):
+        """Test that write_batch skips near-duplicates."""
+        novelty = NoveltyFilter()
+        out = io.StringIO()
+        specs = [("Ghost", "free_verse", i % 10) for i in range(30)]
+        self.assertEqual(self.poetry.write_batch(specs, out, processes=1, novelty=novelty), 10)
+        self.assertEqual(len({json.loads(line)["text"] for line in out.getvalue().splitlines()}), 10)
+        self.assertEqual(novelty.rejected, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
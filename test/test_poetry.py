@@ -0,0 +1,282 @@
+"""
+test_poetry.py
+Unit tests for the precompiled poetic profiles and line templates, the
+batch poetry API, arc-driven poems, seeds and the poem cache.
+
+Run with: pytest test_poetry.py -v
+or: python -m unittest test_poetry.py
+"""
+
+import unittest
+import itertools
+import json
+import random
+import tempfile
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.subit import WHO, WHERE, WHEN, Archetype, SUBITNarrativeEngine
+from src.poetry.subit_poetry import (
+    ENGINE_VERSION, POETIC_IMAGERY, ImageDeck, PoemCache, SUBITPoetryEngine,
+    derive_line_templates
+)
+
+
+class TestPoetics(unittest.TestCase):
+    """Test profiles and template sets for all 64 archetypes."""
+
+    def setUp(self):
+        self.engine = SUBITPoetryEngine()
+
+    def test_every_archetype_has_templates(self):
+        """Test that each archetype has its own non-fallback templates."""
+        for arch in self.engine.catalog.all():
+            poetics = self.engine._get_poetics(arch)
+            self.assertGreaterEqual(len(poetics.templates), 5, msg=arch.name)
+            for template, segments in zip(poetics.templates, poetics.segments):
+                self.assertEqual("dawn".join(segments), template.format(image="dawn"))
+
+    def test_hand_written_templates_preferred(self):
+        """Test that hand-written sets are kept."""
+        pioneer = self.engine.catalog.get_by_name("Pioneer")
+        templates = self.engine._get_poetics(pioneer).templates
+        self.assertEqual(list(templates), self.engine.line_templates["pioneer"])
+
+    def test_derived_templates_follow_axes(self):
+        """Test templates derived from voice, imagery and time."""
+        templates = derive_line_templates(Archetype(WHO.WE, WHERE.NORTH, WHEN.WINTER))
+        self.assertEqual(templates[0], "We pause with the {image}")
+        self.assertIn("stillness", templates[2])
+        self.assertTrue(all("{image}" in t for t in templates))
+
+    def test_profile_frozen_and_shared(self):
+        """Test that profiles are read-only and built once."""
+        steadfast = self.engine.catalog.get_by_name("Steadfast")
+        profile = self.engine._get_archetype_poetic_profile(steadfast)
+        self.assertIs(profile, self.engine._get_archetype_poetic_profile(steadfast))
+        self.assertEqual(profile["archetype_name"], "Steadfast")
+        with self.assertRaises(TypeError):
+            profile["archetype_name"] = "Other"
+
+    def test_free_verse(self):
+        """Test free verse line counts, including a single line."""
+        self.assertEqual(len(self.engine.generate_free_verse("Nation", 9).split("\n")), 9)
+        self.assertEqual(len(self.engine.generate_free_verse("Nation", 1).split("\n")), 1)
+
+
+class TestBatch(unittest.TestCase):
+    """Test batch and streaming generation."""
+
+    SPECS = [
+        ("Pioneer", "haiku", "a"),
+        ("Ghost", "sonnet", 7),
+        {"archetype": "nation", "form": "free_verse", "line_count": 3, "seed": "z"},
+        ("Zero",),
+    ]
+
+    def setUp(self):
+        self.engine = SUBITPoetryEngine()
+
+    def test_inline_batch(self):
+        """Test spec forms, order and seeds in the metadata."""
+        poems = list(self.engine.generate_batch(self.SPECS, processes=1))
+        self.assertEqual([p["metadata"]["form"] for p in poems],
+                         ["haiku", "sonnet", "free_verse", "free_verse"])
+        self.assertEqual(poems[0]["metadata"]["seed"], "a")
+        self.assertEqual(len(poems[2]["text"].split("\n")), 3)
+        self.assertNotIn("seed", poems[3]["metadata"])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_process_batch_matches_inline(self):
+        """Test that seeded poems are the same with and without a pool."""
+        inline = list(self.engine.generate_batch(self.SPECS[:3], processes=1))
+        pooled = list(self.engine.generate_batch(self.SPECS[:3], processes=2, chunksize=1))
+        self.assertEqual(inline, pooled)
+
+    def test_unknown_archetype_fails_before_work(self):
+        """Test that names are resolved up front."""
+        with self.assertRaises(ValueError):
+            next(self.engine.generate_batch([("Pioneer",), ("Nobody",)], processes=1))
+
+    def test_write_batch(self):
+        """Test JSON lines output."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "poems.jsonl")
+            count = self.engine.write_batch(self.SPECS * 5, path, processes=1, chunksize=3)
+            with open(path, encoding="utf-8") as f:
+                poems = [json.loads(line) for line in f]
+        self.assertEqual(count, 20)
+        self.assertEqual(len(poems), 20)
+        self.assertEqual(poems[4]["text"], poems[0]["text"])
+
+    def test_iter_haiku(self):
+        """Test the endless haiku stream."""
+        for haiku in itertools.islice(self.engine.iter_haiku("pioneer"), 10):
+            self.assertEqual(len(haiku.split("\n")), 3)
+
+    def test_haiku_lines_distinct(self):
+        """Test that a haiku never repeats its 5-syllable line."""
+        for code in range(64):
+            stream = self.engine.iter_haiku(Archetype.from_int(code), seed="d")
+            for haiku in itertools.islice(stream, 50):
+                first, _, last = haiku.split("\n")
+                self.assertNotEqual(first, last)
+
+
+class TestArcPoems(unittest.TestCase):
+    """Test poems whose stanzas follow a narrative arc."""
+
+    def setUp(self):
+        self.narrative = SUBITNarrativeEngine()
+        self.engine = SUBITPoetryEngine(catalog=self.narrative.catalog,
+                                        plot_gen=self.narrative.plot_gen)
+
+    def test_stanza_per_state(self):
+        """Test one stanza per arc state, in each kind of form."""
+        story = self.narrative.generate_story(complexity=3, seed="arc")
+        states = story.arc.states
+        self.assertEqual(states[0], story.arc.initial_state)
+        self.assertEqual(states[-1], story.arc.final_state)
+        for form, lines in [("free_verse", 3), ("haiku", 3), ("blank_verse", 3), ("ballad", 4)]:
+            with self.subTest(form=form):
+                poem = self.engine.generate_from_arc(story.arc, form=form, line_count=3)
+                stanzas = poem["text"].split("\n\n")
+                self.assertEqual(len(stanzas), len(states))
+                self.assertTrue(all(len(s.split("\n")) == lines for s in stanzas))
+                self.assertEqual([s["bits"] for s in poem["metadata"]["states"]],
+                                 [s.bits for s in states])
+
+    def test_transmutation_follows_formula(self):
+        """Test that formula poems pass through the impulse state."""
+        formula = self.narrative.transmutations.find_by_name("Healing")
+        poem = self.engine.generate_from_transmutation("Healing", form="haiku")
+        self.assertEqual([s["bits"] for s in poem["metadata"]["states"]],
+                         [formula.initial.bits,
+                          (formula.initial ^ formula.impulse).bits,
+                          formula.result.bits])
+        self.assertEqual(poem["metadata"]["formula"], "Healing")
+        with self.assertRaises(ValueError):
+            self.engine.generate_from_transmutation("Nothing")
+
+    def test_story_reuses_arc(self):
+        """Test that a story told from a poem's arc does not build another."""
+        arc = self.narrative.plot_gen.arc_from_formula(
+            self.narrative.transmutations.find_by_name("Healing"), "Mara")
+        self.engine.generate_from_arc(arc, form="sonnet")
+        calls = []
+        generate_arc = self.narrative.plot_gen.generate_arc
+        self.narrative.plot_gen.generate_arc = lambda *a, **k: calls.append(a) or generate_arc(*a, **k)
+        story = self.narrative.generate_story(arc=arc)
+        self.assertIs(story.arc, arc)
+        self.assertEqual(calls, [])
+        self.assertEqual(story.metadata["final_state"], arc.final_state.bits)
+        self.assertEqual(len(story.metadata["transmutations"]), 2)
+
+
+class TestSeeds(unittest.TestCase):
+    """Test per-call seeds and the seeded poem cache."""
+
+    def setUp(self):
+        self.engine = SUBITPoetryEngine()
+
+    def test_every_method_reproducible(self):
+        """Test that each generator gives the same poem for the same seed."""
+        calls = [
+            lambda seed: self.engine.generate_haiku("Ghost", seed=seed),
+            lambda seed: self.engine.generate_haiku_sequence("Ghost", 3, seed=seed),
+            lambda seed: self.engine.generate_sonnet("Ghost", "petrarchan", seed=seed),
+            lambda seed: self.engine.generate_free_verse("Ghost", 8, seed=seed),
+            lambda seed: self.engine.generate_blank_verse("Ghost", 4, seed=seed),
+            lambda seed: self.engine.generate_ballad("Ghost", 2, seed=seed),
+            lambda seed: self.engine.generate_hymn("Ghost", 2, seed=seed),
+            lambda seed: self.engine.generate_ode("Ghost", 1, seed=seed),
+            lambda seed: self.engine.generate_elegy("Ghost", 3, seed=seed),
+            lambda seed: list(itertools.islice(self.engine.iter_haiku("Ghost", seed=seed), 3)),
+            lambda seed: self.engine.generate_from_transmutation(
+                "Healing", protagonist_name="Mara", seed=seed),
+        ]
+        for i, call in enumerate(calls):
+            with self.subTest(call=i):
+                first = call("s")
+                self.engine.rng.random()
+                self.assertEqual(call("s"), first)
+                self.assertNotEqual(call("t"), first)
+
+    def test_unseeded_poems_vary(self):
+        """Test that poems without a seed still draw from the engine's RNG."""
+        texts = {self.engine.generate_poem("Pioneer", form=form)["text"]
+                 for form in ("sonnet", "sonnet", "free_verse", "free_verse")}
+        self.assertEqual(len(texts), 4)
+        self.assertEqual(self.engine.cache.stats()["misses"], 0)
+
+    def test_seed_is_per_call(self):
+        """Test that a seeded call leaves the engine's RNG alone."""
+        self.engine.rng = random.Random(1)
+        expected = random.Random(1).choice(range(100))
+        self.engine.generate_poem("Pioneer", seed=3)
+        self.assertEqual(self.engine.rng.choice(range(100)), expected)
+
+    def test_cache_hits(self):
+        """Test that repeated seeded poems are served from the cache."""
+        first = self.engine.generate_poem("Pioneer", form="sonnet", seed=9)
+        again = self.engine.generate_poem("Pioneer", form="sonnet", seed="9", title="Nine")
+        self.assertEqual(again["text"], first["text"])
+        self.assertEqual(again["title"], "Nine")
+        self.assertEqual(again["metadata"]["seed"], "9")
+        stats = self.engine.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertIn((self.engine._resolve("Pioneer").int_value, "sonnet", "shakespearean",
+                       None, "9", ENGINE_VERSION), self.engine.cache._entries)
+        self.engine.generate_poem("Pioneer", form="sonnet")
+        self.engine.generate_poem("Pioneer", form="sonnet", seed=random.Random(9))
+        self.assertEqual(self.engine.cache.stats()["misses"], 1)
+
+    def test_cache_bounds(self):
+        """Test eviction by entry count and by characters."""
+        cache = PoemCache(maxsize=2, max_chars=10)
+        cache.put(("a",), ("abc", "t"))
+        cache.put(("b",), ("abc", "t"))
+        cache.get(("a",))
+        cache.put(("c",), ("abc", "t"))
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.get(("a",)), ("abc", "t"))
+        cache.put(("d",), ("abcdefgh", "t"))
+        self.assertEqual(len(cache), 1)
+        cache.put(("e",), ("x" * 11, ""))
+        self.assertIsNone(cache.get(("e",)))
+        self.assertEqual(cache.stats()["evictions"], 3)
+        disabled = SUBITPoetryEngine(cache=PoemCache(maxsize=0))
+        disabled.generate_poem("Pioneer", seed=1)
+        self.assertEqual(len(disabled.cache), 0)
+
+
+class TestImageDeck(unittest.TestCase):
+    """Test shuffled image decks."""
+
+    def test_each_card_once_per_cycle(self):
+        """Test that a cycle deals every card and reshuffles never repeat."""
+        deck = ImageDeck("abcde", random.Random(3))
+        dealt = [deck.draw() for _ in range(50)]
+        for start in range(0, 50, 5):
+            self.assertEqual(sorted(dealt[start:start + 5]), list("abcde"))
+        self.assertTrue(all(a != b for a, b in zip(dealt, dealt[1:])))
+        self.assertEqual(ImageDeck(["only"]).draw(), "only")
+        with self.assertRaises(ValueError):
+            ImageDeck([])
+
+    def test_free_verse_uses_every_image(self):
+        """Test that twelve lines deal the whole image deck and a refrain word."""
+        engine = SUBITPoetryEngine()
+        arch = engine.catalog.get_by_name("Ghost")
+        imagery = POETIC_IMAGERY[arch.where]
+        for seed in range(10):
+            text = engine.generate_free_verse(arch, 12, seed=seed).lower()
+            for image in imagery["images"]:
+                self.assertIn(image, text)
+            self.assertTrue(any(word in text for word in imagery["lexicon"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+test_prefork.py
+Unit tests for the SUBIT service dispatcher and pre-fork server.
+
+Run with: pytest test_prefork.py -v
+or: python -m unittest test_prefork.py
+"""
+
+import unittest
+import json
+import socket
+import threading
+from unittest import mock
+import subprocess
+import tempfile
+import time
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.service import SUBITService
+from src import prefork
+from src.prefork import PreforkClient, PreforkServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestSUBITService(unittest.TestCase):
+    """Test request dispatch."""
+
+    def setUp(self):
+        self.service = SUBITService()
+
+    def test_shared_catalog(self):
+        """Test that both engines share one catalog."""
+        self.assertIs(self.service.engine.catalog, self.service.poetry.catalog)
+
+    def test_story(self):
+        """Test story generation from names and bits."""
+        story = self.service.handle("story", {"initial": "Steadfast", "target": "11 01 11"})
+        self.assertEqual(story["arc"]["initial_state"], "10 11 00")
+        self.assertEqual(story["arc"]["final_state"], "11 01 11")
+
+    def test_poem(self):
+        """Test poem generation."""
+        poem = self.service.handle("poem", {"archetype": "Pioneer", "form": "haiku"})
+        self.assertEqual(poem["metadata"]["archetype"], "Pioneer")
+
+    def test_errors(self):
+        """Test unknown operations, arguments and archetypes."""
+        with self.assertRaises(ValueError):
+            self.service.handle("unknown")
+        with self.assertRaises(ValueError):
+            self.service.handle("story", {"colour": "red"})
+        with self.assertRaises(ValueError):
+            self.service.handle("poem", {"archetype": "Nobody"})
+        with self.assertRaises(ValueError):
+            self.service.handle("poem", {})
+
+
+class TestResponses(unittest.TestCase):
+    """Test request lines turned into response lines, without sockets."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = PreforkServer("unused.sock")
+
+    def respond(self, line):
+        return json.loads(self.server._respond(line))
+
+    def test_ok(self):
+        """Test a successful request."""
+        response = self.respond(b'{"op": "dobre", "args": {"code": 42}}')
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["result"]["dobre"], "di-bi-ri")
+
+    def test_invalid_requests(self):
+        """Test that malformed and invalid requests get error lines."""
+        for line in (b"{not json", b"[1, 2]", b'"story"', b'{"op": "story", "args": [1]}',
+                     b'{"op": "story", "args": {"seed": 5}}'):
+            with self.subTest(line=line):
+                response = self.respond(line)
+                self.assertFalse(response["ok"])
+                self.assertNotIn("Internal error", response["error"])
+
+    def test_internal_error(self):
+        """Test that an unexpected exception is reported, not raised."""
+        self.server.service.handlers["broken"] = lambda args: {}["missing"]
+        try:
+            response = self.respond(b'{"op": "broken", "args": {}}')
+        finally:
+            del self.server.service.handlers["broken"]
+        self.assertEqual(response, {"ok": False, "error": "Internal error: KeyError: 'missing'"})
+
+
+    def test_oversized_line(self):
+        """Test that an over-long line gets one error and closes the connection."""
+        server_sock, client_sock = socket.socketpair()
+        client_sock.settimeout(5)
+
+        def serve():
+            with server_sock:
+                self.server._serve_connection(server_sock)
+
+        with mock.patch.object(prefork, "MAX_REQUEST_BYTES", 64):
+            thread = threading.Thread(target=serve)
+            thread.start()
+            with client_sock, client_sock.makefile("rwb") as stream:
+                stream.write(b'{"op": "dobre", "args": {"word": "' + b"x" * 200 + b'"}}\n')
+                stream.write(b'{"op": "dobre", "args": {"code": 42}}\n')
+                stream.flush()
+                replies = stream.read().splitlines()
+            thread.join(5)
+        self.assertEqual(len(replies), 1)
+        self.assertIn("exceeds 64 bytes", json.loads(replies[0])["error"])
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+class TestPreforkServer(unittest.TestCase):
+    """Test the pre-fork server end to end."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.address = os.path.join(cls.tmpdir.name, "subit.sock")
+        cls.proc = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "src", "prefork.py"),
+             "--socket", cls.address, "--workers", "2"],
+            stdout=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + 10
+        while not os.path.exists(cls.address):
+            if time.monotonic() > deadline:
+                cls.proc.kill()
+                raise RuntimeError("pre-fork server did not start")
+            time.sleep(0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.proc.terminate()
+        cls.proc.wait(timeout=10)
+        cls.tmpdir.cleanup()
+
+    def test_requests(self):
+        """Test several requests on one connection."""
+        with PreforkClient(self.address) as client:
+            # The counter is per worker, which may have served other tests
+            served = client.stats()["requests"]
+            story = client.story(formula_name="Philosopher's Stone", seed="salt")
+            self.assertEqual(story["metadata"]["formula"], "Philosopher's Stone")
+            poem = client.poem(archetype="Steadfast", form="haiku")
+            self.assertEqual(len(poem["text"].split("\n")), 3)
+            stats = client.stats()
+            self.assertEqual(stats["requests"], served + 3)
+            self.assertGreater(stats["frozen_objects"], 0)
+
+    def test_error_response(self):
+        """Test that errors are reported without closing the connection."""
+        with PreforkClient(self.address) as client:
+            with self.assertRaises(ValueError):
+                client.request("unknown")
+            self.assertIn("pid", client.stats())
+
+    def test_seeded_requests_match(self):
+        """Test that seeded stories are identical across connections."""
+        with PreforkClient(self.address) as a, PreforkClient(self.address) as b:
+            self.assertEqual(a.story(seed="x")["text"], b.story(seed="x")["text"])
+
+
+if __name__ == '__main__':
+    unittest.main()
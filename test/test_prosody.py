@@ -0,0 +1,220 @@
+"""
+test_prosody.py
+Unit tests for syllable counting, stress and meter, rhyme classes,
+5-7-5 haiku, rhyme-scheme sonnets and metrical forms.
+
+Run with: pytest test_prosody.py -v
+or: python -m unittest test_prosody.py
+"""
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.poetry.prosody import (
+    PRONUNCIATIONS, count_syllables, word_syllables, rhyme_key, line_rhyme,
+    word_stress, scan, fits_meter
+)
+from src.poetry.subit_poetry import (
+    POETIC_FORMS, POETIC_IMAGERY, SONNET_LAYOUTS, METRICAL_FORMS,
+    SUBITPoetryEngine, _split_template
+)
+
+
+class TestSyllables(unittest.TestCase):
+    """Test the lexicon and the rule fallback."""
+
+    def test_lexicon(self):
+        """Test words the spelling rules would miscount."""
+        self.assertEqual(word_syllables("beloved"), 3)
+        self.assertEqual(word_syllables("poem"), 2)
+        self.assertEqual(word_syllables("every"), 2)
+        self.assertEqual(word_syllables("Quiet"), 2)
+
+    def test_rules(self):
+        """Test words outside the lexicon."""
+        cases = {"snow": 1, "fire": 1, "candle": 2, "walked": 1, "wanted": 2,
+                 "waves": 1, "roses": 2, "melody": 3, "free": 1, "can't": 1}
+        for word, expected in cases.items():
+            with self.subTest(word=word):
+                self.assertNotIn(word, PRONUNCIATIONS)
+                self.assertEqual(word_syllables(word), expected)
+
+    def test_count_syllables(self):
+        """Test counting a line with punctuation."""
+        self.assertEqual(count_syllables("An old silent pond - a frog jumps in!"), 9)
+        self.assertEqual(count_syllables(""), 0)
+
+    def test_imagery_vocabulary(self):
+        """Test that every imagery word has a positive count."""
+        for imagery in POETIC_IMAGERY.values():
+            for phrase in imagery["images"] + imagery["lexicon"]:
+                self.assertGreater(count_syllables(phrase), 0)
+
+    def test_split_template(self):
+        """Test template syllables and slot names."""
+        self.assertEqual(_split_template("I am the {image} and the {image} is me"),
+                         (7, ["image", "image"]))
+
+
+class TestMeter(unittest.TestCase):
+    """Test stress lookup and meter fitting."""
+
+    def test_word_stress(self):
+        """Test lexicon, rule and monosyllable stress."""
+        self.assertEqual(word_stress("horizon"), "010")
+        self.assertEqual(word_stress("candle"), "10")
+        self.assertEqual(word_stress("begone"), "01")
+        self.assertEqual(word_stress("the"), "x")
+        self.assertEqual(word_stress("fire"), "x")
+
+    def test_stress_cache(self):
+        """Test that repeated lookups hit the LRU cache."""
+        word_stress("lantern")
+        hits = word_stress.cache_info().hits
+        word_stress("lantern")
+        self.assertEqual(word_stress.cache_info().hits, hits + 1)
+
+    def test_scan_and_fit(self):
+        """Test scanning lines against meters."""
+        line = "I walk beside the dawn beneath the frozen ground"
+        self.assertEqual(scan(line), "xx01xx01x10x")
+        self.assertTrue(fits_meter(scan(line), "iambic_hexameter"))
+        self.assertFalse(fits_meter(scan(line), "iambic_pentameter"))
+        self.assertTrue(fits_meter(scan("beneath the frozen ground"), "iambic_trimeter"))
+        self.assertFalse(fits_meter(scan("horizon"), "010101"))
+        self.assertTrue(fits_meter("x1x", "010"))
+
+
+class TestHaiku(unittest.TestCase):
+    """Test exact 5-7-5 haiku for every archetype."""
+
+    def setUp(self):
+        self.engine = SUBITPoetryEngine()
+
+    def test_all_archetypes(self):
+        """Test that every generated line hits its syllable target."""
+        targets = POETIC_FORMS["haiku"]["syllables"]
+        for arch in self.engine.catalog.all():
+            for _ in range(5):
+                lines = self.engine.generate_haiku(arch).split("\n")
+                self.assertEqual([count_syllables(line) for line in lines], targets,
+                                 msg=f"{arch.name}: {lines}")
+
+    def test_line_index_built_once(self):
+        """Test that an archetype's line index is reused."""
+        lines = self.engine._get_haiku_lines(self.engine.catalog.get_by_name("Pioneer"))
+        self.engine.generate_haiku("Pioneer")
+        self.assertIs(self.engine._get_haiku_lines(
+            self.engine.catalog.get_by_name("Pioneer")), lines)
+
+    def test_sequence(self):
+        """Test a haiku sequence."""
+        sequence = self.engine.generate_haiku_sequence("Steadfast", count=4)
+        self.assertEqual(len(sequence), 4)
+        for haiku in sequence:
+            self.assertEqual(len(haiku.split("\n")), 3)
+
+
+class TestRhyme(unittest.TestCase):
+    """Test rhyme classes."""
+
+    def test_spelling_rhymes(self):
+        """Test words keyed by spelling."""
+        groups = [("name", "flame", "came"), ("night", "light", "sight"),
+                  ("day", "away"), ("tree", "free", "knee"), ("year", "fear", "near")]
+        for group in groups:
+            with self.subTest(group=group):
+                self.assertEqual(len({rhyme_key(word) for word in group}), 1)
+        self.assertNotEqual(rhyme_key("name"), rhyme_key("night"))
+
+    def test_overrides(self):
+        """Test words whose spelling hides the rhyme."""
+        self.assertEqual(rhyme_key("heart"), rhyme_key("apart"))
+        self.assertEqual(rhyme_key("me"), rhyme_key("see"))
+        self.assertNotEqual(rhyme_key("heart"), rhyme_key("hear"))
+
+    def test_line_rhyme(self):
+        """Test the rhyme of a line's last word."""
+        self.assertEqual(line_rhyme("I walk beside the dawn, beyond all sight."), "ight")
+        self.assertEqual(line_rhyme(""), "")
+
+
+class TestSonnet(unittest.TestCase):
+    """Test rhyme-scheme sonnets."""
+
+    def setUp(self):
+        self.engine = SUBITPoetryEngine()
+
+    def assertScheme(self, text, scheme):
+        lines = text.split("\n")
+        letters, _ = SONNET_LAYOUTS[scheme]
+        self.assertEqual(len(lines), 14)
+        rhymes = {}
+        for letter, line in zip(letters, lines):
+            rhymes.setdefault(letter, []).append(line)
+        classes = {letter: {line_rhyme(l) for l in group} for letter, group in rhymes.items()}
+        for letter, group in rhymes.items():
+            # Lines sharing a letter rhyme, with distinct end words
+            self.assertEqual(len(classes[letter]), 1, msg=group)
+            self.assertEqual(len({l.split()[-1] for l in group}), len(group), msg=group)
+        # Different letters use different rhymes
+        self.assertEqual(len({c.pop() for c in classes.values()}), len(rhymes))
+
+    def test_all_schemes(self):
+        """Test every scheme on a sample of archetypes."""
+        for arch in self.engine.catalog.all()[::7]:
+            for scheme in SONNET_LAYOUTS:
+                with self.subTest(archetype=arch.name, scheme=scheme):
+                    self.assertScheme(self.engine.generate_sonnet(arch, scheme), scheme)
+
+    def test_unknown_scheme(self):
+        """Test that unknown schemes are rejected."""
+        with self.assertRaises(ValueError):
+            self.engine.generate_sonnet("Pioneer", "limerick")
+
+    def test_poem_metadata(self):
+        """Test the scheme passed through generate_poem."""
+        poem = self.engine.generate_poem("Ghost", form="sonnet", rhyme_scheme="petrarchan")
+        self.assertEqual(poem["metadata"]["rhyme_scheme"], "petrarchan")
+        self.assertScheme(poem["text"], "petrarchan")
+
+
+class TestMetricalForms(unittest.TestCase):
+    """Test blank verse, ballad, hymn, ode and elegy."""
+
+    def setUp(self):
+        self.engine = SUBITPoetryEngine()
+
+    def test_every_line_fits(self):
+        """Test that each line fits its meter in every form."""
+        for arch in self.engine.catalog.all()[::9]:
+            for form, spec in METRICAL_FORMS.items():
+                with self.subTest(archetype=arch.name, form=form):
+                    text = self.engine._generate_metered(arch, form, 2)
+                    lines = [line for line in text.split("\n") if line]
+                    meters = spec["stanza"] * 2
+                    self.assertEqual(len(lines), len(meters))
+                    for line, meter in zip(lines, meters):
+                        self.assertTrue(fits_meter(scan(line), meter), msg=f"{meter}: {line}")
+
+    def test_stanzas(self):
+        """Test stanza counts and separators."""
+        self.assertEqual(len(self.engine.generate_ballad("Pioneer", 3).split("\n\n")), 3)
+        self.assertEqual(len(self.engine.generate_elegy("Pioneer", 5).split("\n\n")), 5)
+        self.assertEqual(len(self.engine.generate_ode("Pioneer").split("\n")), 21)
+        self.assertEqual(len(self.engine.generate_hymn("Pioneer", 1).split("\n")), 4)
+        self.assertEqual(len(self.engine.generate_blank_verse("Pioneer", 7).split("\n")), 7)
+
+    def test_generate_poem(self):
+        """Test form dispatch, line counts and meter metadata."""
+        poem = self.engine.generate_poem("Ghost", form="ballad", line_count=6)
+        self.assertEqual(poem["metadata"]["meter"], POETIC_FORMS["ballad"]["meter"])
+        self.assertEqual(len(poem["text"].split("\n\n")), 2)
+        poem = self.engine.generate_poem("Ghost", form="blank_verse", line_count=5)
+        self.assertEqual(len(poem["text"].split("\n")), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+test_startup.py
+Unit tests for lazy catalogs and deferred imports in the SUBIT engine.
+
+Run with: pytest test_startup.py -v
+or: python -m unittest test_startup.py
+"""
+
+import unittest
+import subprocess
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.subit import (
+    ArchetypeCatalog, TransmutationCatalog, SUBITNarrativeEngine,
+    name_to_archetype, PIONEER
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyCatalogs(unittest.TestCase):
+    """Test that catalogs are built on first access."""
+
+    def test_archetype_catalog_lazy(self):
+        """Test that the archetype catalog builds on first use."""
+        catalog = ArchetypeCatalog()
+        self.assertIsNone(catalog._archetypes)
+        self.assertEqual(len(catalog.all()), 64)
+        self.assertIsNotNone(catalog._archetypes)
+
+    def test_transmutation_catalog_lazy(self):
+        """Test that formulas are built and verified on first use."""
+        catalog = TransmutationCatalog()
+        self.assertIsNone(catalog._formulas)
+        self.assertEqual(len(catalog.all()), 12)
+        self.assertTrue(all(f.verify() for f in catalog.formulas))
+
+    def test_engine_construction_defers_catalogs(self):
+        """Test that constructing an engine builds nothing until a story is made."""
+        engine = SUBITNarrativeEngine()
+        self.assertIsNone(engine.catalog._archetypes)
+        self.assertIsNone(engine.transmutations._formulas)
+        story = engine.generate_story(formula_name="Philosopher's Stone")
+        self.assertEqual(story.metadata["formula"], "Philosopher's Stone")
+
+    def test_name_to_archetype(self):
+        """Test name lookup through the shared catalog."""
+        self.assertEqual(name_to_archetype("Pioneer"), PIONEER)
+        self.assertIsNone(name_to_archetype("Nonexistent"))
+
+
+class TestDeferredImports(unittest.TestCase):
+    """Test that rarely used modules are not imported at startup."""
+
+    def test_import_defers_json_and_hashlib(self):
+        """Test a fresh interpreter after importing src.subit."""
+        probe = ("import sys, src.subit; "
+                 "print(','.join(m for m in ('json', 'hashlib') if m in sys.modules))")
+        out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.strip(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+test_store.py
+Unit tests for the SQLite story store: bulk inserts, indexed queries
+and lazy hydration.
+
+Run with: pytest test_store.py -v
+or: python -m unittest test_store.py
+"""
+
+import unittest
+import os
+import tempfile
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.subit import SUBITNarrativeEngine, STEADFAST, COUNCIL
+from src.store import StoryStore
+
+
+class TestStoryStore(unittest.TestCase):
+    """Test inserts, queries and hydration."""
+
+    @classmethod
+    def setUpClass(cls):
+        engine = SUBITNarrativeEngine()
+        cls.stories = [engine.generate_story(initial=STEADFAST, target=COUNCIL, seed=str(i),
+                                             complexity=1 + i % 3)
+                       for i in range(30)]
+        cls.stories += [engine.generate_story(seed=str(i)) for i in range(30, 60)]
+        cls.stories.append(engine.generate_story(formula_name="Philosopher's Stone", seed="stone"))
+
+    def setUp(self):
+        self.store = StoryStore(batch_size=8)
+        self.assertEqual(self.store.add_many(iter(self.stories)), len(self.stories))
+
+    def tearDown(self):
+        self.store.close()
+
+    def expected(self, match):
+        return [i + 1 for i, story in enumerate(self.stories) if match(story)]
+
+    def test_structural_query(self):
+        """Test initial, final, tension and complexity filters against a scan."""
+        def match(story):
+            return (story.arc.initial_state == STEADFAST and story.arc.final_state == COUNCIL
+                    and story.arc.dramatic_tension >= 0.3 and story.metadata["complexity"] == 2)
+        expected = self.expected(match)
+        self.assertTrue(expected)
+        self.assertEqual(self.store.ids("Steadfast", COUNCIL.bits, min_tension=0.3, complexity=2),
+                         expected)
+        stories = list(self.store.query(STEADFAST, COUNCIL.int_value, min_tension=0.3, complexity=2))
+        self.assertEqual([s.to_dict() for s in stories],
+                         [self.stories[i - 1].to_dict() for i in expected])
+        self.assertEqual(self.store.count(STEADFAST, COUNCIL, min_tension=0.3, complexity=2),
+                         len(expected))
+
+    def test_formula_seed_and_tension(self):
+        """Test the formula, seed and tension-range columns."""
+        stone = list(self.store.query(formula="Philosopher's Stone"))
+        self.assertEqual([s.metadata["seed"] for s in stone], ["stone"])
+        self.assertEqual(self.store.ids(seed="7"), [8])
+        self.assertEqual(self.store.ids(min_tension=0.5, max_tension=0.5),
+                         self.expected(lambda s: s.arc.dramatic_tension == 0.5))
+        self.assertEqual(len(self.store.ids(limit=5)), 5)
+
+    def test_lazy_hydration(self):
+        """Test that stories are hydrated as the query is iterated."""
+        stories = self.store.query(limit=400)
+        first = next(stories)
+        self.assertEqual(first.title, self.stories[0].title)
+        self.assertEqual(sum(1 for _ in stories), len(self.stories) - 1)
+
+    def test_get_and_errors(self):
+        """Test lookups by id and rejected arguments."""
+        self.assertEqual(self.store.get(3).text, self.stories[2].text)
+        with self.assertRaises(KeyError):
+            self.store.get(1000)
+        with self.assertRaises(ValueError):
+            self.store.query("Nobody")
+        with self.assertRaises(ValueError):
+            self.store.ids(initial=64)
+        with self.assertRaises(ValueError):
+            StoryStore(batch_size=0)
+
+    def test_indexes_used(self):
+        """Test that the structural query is answered from an index."""
+        plan = self.store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM stories WHERE initial = 44 AND final = 53 "
+            "AND complexity = 3 AND tension >= 0.6").fetchall()
+        self.assertIn("stories_states", " ".join(row[-1] for row in plan))
+
+    def test_file_store(self):
+        """Test WAL mode and persistence across connections."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stories.db")
+            with StoryStore(path) as store:
+                store.add_many(self.stories[:10])
+                self.assertEqual(store.add(self.stories[10]), 11)
+                self.assertEqual(store.stats()["journal_mode"], "wal")
+            with StoryStore(path) as store:
+                self.assertEqual(len(store), 11)
+                self.assertEqual(store.get(11).title, self.stories[10].title)
+
+
+if __name__ == '__main__':
+    unittest.main()
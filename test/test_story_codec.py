@@ -0,0 +1,107 @@
+"""
+test_story_codec.py
+Unit tests for the template dictionary and the template-id story codec.
+
+Run with: pytest test_story_codec.py -v
+or: python -m unittest test_story_codec.py
+"""
+
+import unittest
+import subprocess
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from src.subit import SUBITNarrativeEngine, STEADFAST, COUNCIL
+from src.story_codec import StoryCodec, StoryToken, TemplateDictionary
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class TestStoryCodec(unittest.TestCase):
+    """Test exact round trips, compression and analytics."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = SUBITNarrativeEngine()
+        cls.codec = StoryCodec(cls.engine)
+        cls.stories = [cls.engine.generate_story(seed=str(i), complexity=1 + i % 5)
+                       for i in range(200)]
+        cls.stories.append(cls.engine.generate_story(formula_name="Philosopher's Stone"))
+
+    def test_round_trip_and_ratio(self):
+        """Test that engine stories decode exactly and shrink more than 20x."""
+        text_bytes = blob_bytes = 0
+        for story in self.stories:
+            blob = self.codec.encode(story.text)
+            self.assertEqual(self.codec.decode(blob), story.text)
+            text_bytes += len(story.text.encode())
+            blob_bytes += len(blob)
+        self.assertGreater(text_bytes / blob_bytes, 20)
+
+    def test_dictionary_covers_engine_output(self):
+        """Test that every paragraph of engine output is a template with known values."""
+        dictionary = self.codec.dictionary
+        for story in self.stories[:50]:
+            for token in self.codec.tokens(story.text):
+                self.assertIsNotNone(token.template)
+                for name, value in zip(dictionary.fields[token.template], token.values):
+                    self.assertIsNotNone(dictionary.value_id(name, value), msg=value)
+        self.assertEqual(len(dictionary.values["setting"]), 64)
+
+    def test_uncovered_text(self):
+        """Test custom names and arbitrary paragraphs, stored literally."""
+        story = self.engine.generate_story(STEADFAST, COUNCIL, protagonist_name="Zoë Ωmega")
+        blob = self.codec.encode(story.text)
+        self.assertIn("Zoë Ωmega".encode(), blob)
+        self.assertEqual(self.codec.decode(blob), story.text)
+        for text in ("", "Plain text.", "A {brace}\n\n\n\nand gaps\n\n", story.text + "\n\nCoda."):
+            with self.subTest(text=text):
+                self.assertEqual(self.codec.decode(self.codec.encode(text)), text)
+
+    def test_template_ids(self):
+        """Test template-level analytics read straight from the encoding."""
+        dictionary = self.codec.dictionary
+        for story in self.stories[:20]:
+            blob = self.codec.encode(story.text)
+            ids = self.codec.template_ids(blob)
+            self.assertEqual(ids, [t.template for t in self.codec.decode_tokens(blob)])
+            sections = [dictionary.templates[i][0] for i in ids]
+            self.assertEqual((sections[0], sections[1], sections[-1]), ("opening", "intro", "closing"))
+            self.assertEqual(sections.count("event"), len(story.arc.plot_points))
+
+    def test_render(self):
+        """Test rendering tokens by hand."""
+        dictionary = self.codec.dictionary
+        closing = [t for _, t in dictionary.templates].index("And so {protagonist} became {final_state}.")
+        self.assertEqual(dictionary.render(StoryToken(closing, ("Luca", "Council"))),
+                         "And so Luca became Council.")
+        self.assertEqual(dictionary.render(StoryToken(None, ("As is.",))), "As is.")
+
+    def test_versions(self):
+        """Test that versions track content and mismatched or damaged blobs are rejected."""
+        self.assertEqual(StoryCodec(SUBITNarrativeEngine()).version, self.codec.version)
+        script = ("from src.story_codec import StoryCodec; print(StoryCodec().version)")
+        result = subprocess.run([sys.executable, "-c", script], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(int(result.stdout), self.codec.version)
+
+        engine = SUBITNarrativeEngine()
+        engine.renderer.templates["reflection"].append("The sky was quiet.")
+        other = StoryCodec(engine)
+        self.assertNotEqual(other.version, self.codec.version)
+        blob = self.codec.encode(self.stories[0].text)
+        with self.assertRaises(ValueError):
+            other.decode(blob)
+        with self.assertRaises(ValueError):
+            self.codec.decode(blob[:-1] + b"\xff")
+        with self.assertRaises(ValueError):
+            self.codec.decode(blob + b"\x00")
+        with self.assertRaises(ValueError):
+            self.codec.decode(b"")
+        with self.assertRaises(ValueError):
+            TemplateDictionary([("opening", "In {nowhere}")], {})
+
+
+if __name__ == '__main__':
+    unittest.main()